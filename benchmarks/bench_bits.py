@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+
+# Micro-benchmark comparing the original string-based `ArbitraryBits` class
+# against the integer-backed `BitStream` which `WLSerial` now uses.  Runs
+# through a parse-and-rebuild cycle of the item serials found in
+# `mod_testing_gear.txt`, eating/appending fields in roughly the same widths
+# that `_parse_serial` and `_deparse_serial` would.
+#
+# Run from the top level of the repo with:
+#
+#     python benchmarks/bench_bits.py
+
+import os
+import sys
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from ttwlsave import datalib
+
+parser = argparse.ArgumentParser(description='Benchmark serial bit-stream engines')
+
+parser.add_argument('-n', '--number',
+        type=int,
+        default=20000,
+        help='Number of parse/rebuild cycles to run per serial')
+
+parser.add_argument('-g', '--gear',
+        type=str,
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mod_testing_gear.txt'),
+        help='Item export file to read serials from')
+
+args = parser.parse_args()
+
+# Grab decrypted serial payloads
+payloads = []
+with open(args.gear) as df:
+    for line in df:
+        line = line.strip()
+        if datalib.WLSerial.get_inner_serial_base64(line):
+            serial = datalib.WLSerial.decode_serial_base64(line)
+            (decrypted, _, _) = datalib.WLSerial._decrypt_serial(serial)
+            payloads.append(decrypted)
+if not payloads:
+    raise Exception('No serials found in {}'.format(args.gear))
+
+# Field widths roughly matching a real serial: header, version, balance,
+# invdata, manufacturer, level, and then a run of part-sized fields.
+header_widths = [8, 7, 11, 7, 4, 7]
+
+def cycle(bits_class, payload):
+    bits = bits_class(payload)
+    values = []
+    for width in header_widths:
+        values.append((bits.eat(width), width))
+    remaining = len(bits.data) if bits_class is datalib.ArbitraryBits else len(bits)
+    while remaining >= 8:
+        values.append((bits.eat(8), 8))
+        remaining -= 8
+    new_bits = bits_class()
+    for value, width in values:
+        new_bits.append_value(value, width)
+    return new_bits.get_data()
+
+# Sanity check before timing anything
+for payload in payloads:
+    if cycle(datalib.ArbitraryBits, payload) != cycle(datalib.BitStream, payload):
+        raise Exception('Bit engines disagree on payload: {}'.format(payload.hex()))
+
+results = {}
+for bits_class in [datalib.ArbitraryBits, datalib.BitStream]:
+    elapsed = timeit.timeit(
+            lambda: [cycle(bits_class, p) for p in payloads],
+            number=args.number,
+            )
+    per_serial = elapsed / (args.number*len(payloads)) * 1000000
+    results[bits_class.__name__] = per_serial
+    print('{:>15}: {:.2f}s total, {:.2f}us per serial'.format(
+        bits_class.__name__,
+        elapsed,
+        per_serial,
+        ))
+print('Speedup: {:.1f}x'.format(results['ArbitraryBits'] / results['BitStream']))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+
+# Benchmark for the savegame/profile payload obfuscation, comparing the
+# original per-byte loops which used to live in TTWLSave/TTWLProfile against
+# the whole-buffer versions in `ttwlsave.cipher`.  Reports per-MB throughput.
+#
+# Run from the top level of the repo with:
+#
+#     python benchmarks/bench_cipher.py
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from ttwlsave import cipher
+from ttwlsave.ttwlsave import TTWLSave
+
+parser = argparse.ArgumentParser(description='Benchmark savegame payload obfuscation')
+
+parser.add_argument('-s', '--size',
+        type=float,
+        default=1,
+        help='Size of the test buffer, in MB')
+
+args = parser.parse_args()
+
+prefix_magic = TTWLSave._prefix_magic
+xor_magic = TTWLSave._xor_magic
+
+def loop_decrypt(data):
+    data = bytearray(data)
+    for i in range(len(data)-1, -1, -1):
+        if i < 32:
+            b = prefix_magic[i]
+        else:
+            b = data[i - 32]
+        b ^= xor_magic[i % 32]
+        data[i] ^= b
+    return bytes(data)
+
+def loop_encrypt(data):
+    data = bytearray(data)
+    for i in range(len(data)):
+        if i < 32:
+            b = prefix_magic[i]
+        else:
+            b = data[i - 32]
+        b ^= xor_magic[i % 32]
+        data[i] ^= b
+    return bytes(data)
+
+def fast_decrypt(data):
+    return cipher.decrypt(data, prefix_magic, xor_magic)
+
+def fast_encrypt(data):
+    return cipher.encrypt(data, prefix_magic, xor_magic)
+
+size = int(args.size*1024*1024)
+mb = size/1024/1024
+data = random.Random(0).randbytes(size) if hasattr(random.Random, 'randbytes') else os.urandom(size)
+
+results = {}
+for label, func in [
+        ('Loop decrypt', loop_decrypt),
+        ('Loop encrypt', loop_encrypt),
+        ('Block decrypt', fast_decrypt),
+        ('Block encrypt', fast_encrypt),
+        ]:
+    start = time.perf_counter()
+    results[label] = func(data)
+    elapsed = time.perf_counter() - start
+    print('{:>14}: {:.3f}s ({:.2f} MB/s)'.format(label, elapsed, mb/elapsed))
+
+if results['Loop decrypt'] != results['Block decrypt']:
+    raise Exception('Decryption results differ!')
+if results['Loop encrypt'] != results['Block encrypt']:
+    raise Exception('Encryption results differ!')
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+#
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+
+
+# Benchmark for CLI startup latency, using `python -X importtime` on the
+# main package and the CLI modules.  Reports the median self/cumulative
+# import time for each, and also makes sure that the big customization
+# tables (`ttwlsave.customizations`) aren't getting pulled in by apps which
+# don't need them.  Exits with an error if that happens, or if `--max-ms`
+# is given and importing `ttwlsave` itself takes longer than that.
+#
+# Run from the top level of the repo with:
+#
+#     python benchmarks/bench_import.py
+
+import os
+import sys
+import statistics
+import argparse
+import subprocess
+
+base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+parser = argparse.ArgumentParser(description='Benchmark ttwlsave import times')
+
+parser.add_argument('-r', '--runs',
+        type=int,
+        default=7,
+        help='Number of runs per module',
+        )
+
+parser.add_argument('-m', '--max-ms',
+        type=float,
+        help='Fail if importing the `ttwlsave` package itself takes longer than this, in ms',
+        )
+
+args = parser.parse_args()
+
+# Modules to time, and whether they're allowed to load the customization tables
+modules = [
+        ('ttwlsave', False),
+        ('ttwlsave.cli_info', False),
+        ('ttwlsave.cli_edit', False),
+        ('ttwlsave.cli_prof_info', False),
+        ('ttwlsave.cli_prof_edit', False),
+        ]
+
+def import_times(module):
+    """
+    Imports `module` in a fresh interpreter with `-X importtime`, and returns
+    a dict mapping module names to (self, cumulative) times in microseconds.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = base_dir
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+            )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        times[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return times
+
+failed = False
+package_self = []
+for module, customizations_ok in modules:
+
+    # One throwaway run so that .pyc files are up to date
+    import_times(module)
+
+    self_times = []
+    cumulative_times = []
+    loaded_customizations = False
+    for _ in range(args.runs):
+        times = import_times(module)
+        self_times.append(times[module][0])
+        cumulative_times.append(times[module][1])
+        if 'ttwlsave.customizations' in times:
+            loaded_customizations = True
+        package_self.append(times['ttwlsave'][0])
+
+    print('{:>22}: {:7.1f}ms self, {:7.1f}ms cumulative'.format(
+        module,
+        statistics.median(self_times)/1000,
+        statistics.median(cumulative_times)/1000,
+        ))
+    if loaded_customizations and not customizations_ok:
+        print('{:>22}  ERROR: loaded ttwlsave.customizations'.format(''))
+        failed = True
+
+package_ms = statistics.median(package_self)/1000
+print('')
+print('ttwlsave package (self): {:.1f}ms'.format(package_ms))
+if args.max_ms is not None and package_ms > args.max_ms:
+    print('ERROR: ttwlsave package import is slower than {:.1f}ms'.format(args.max_ms))
+    failed = True
+
+if failed:
+    sys.exit(1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+
+
+# Micro-benchmark for the archive's standard gear normalization (set level,
+# set Chaos Level to Ascended, clear rerolls), comparing the one-at-a-time
+# property setters against a single `WLSerial.apply` call.  Uses the same
+# three items that `cli_archive` forces into every save, plus anything found
+# in `mod_testing_gear.txt`.  Each pass alternates between two targets so
+# that every edit actually has something to change.
+#
+# Run from the top level of the repo with:
+#
+#     python benchmarks/bench_item_edit.py
+
+import os
+import sys
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import ttwlsave
+from ttwlsave import datalib
+
+parser = argparse.ArgumentParser(description='Benchmark multi-field item edits')
+
+parser.add_argument('-n', '--number',
+        type=int,
+        default=500,
+        help='Number of normalization passes to run over the items')
+
+parser.add_argument('-g', '--gear',
+        type=str,
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mod_testing_gear.txt'),
+        help='Item export file to read additional serials from')
+
+args = parser.parse_args()
+
+serials = [
+        'WL(BQAAAABXNIA7ORppgmool0p50WCcRx0zrBU6hAAAAAAAAGdAACAA)',
+        'WL(BQAAAACnEIC79mEggTIGugpRfCgjCAAABA==)',
+        'WL(BQAAAAA0SIA7LQmBgzJG6DEwMSwAAEAA)',
+        ]
+with open(args.gear) as df:
+    for line in df:
+        line = line.strip()
+        if datalib.WLSerial.get_inner_serial_base64(line):
+            serials.append(line)
+
+datawrapper = datalib.DataWrapper.shared()
+items = [datalib.WLSerial(datalib.WLSerial.decode_serial_base64(s), datawrapper) for s in serials]
+items = [item for item in items if item.can_have_chaos_level()]
+if not items:
+    raise Exception('No editable serials found')
+
+targets = [
+        (ttwlsave.max_level, ttwlsave.ChaosLevel.ASCENDED.value, 0),
+        (1, ttwlsave.ChaosLevel.CHAOTIC.value, 1),
+        ]
+
+def with_setters(level, chaos_level, rerolled):
+    for item in items:
+        if item.level != level:
+            item.level = level
+        if item.chaos_level != chaos_level:
+            item.chaos_level = chaos_level
+        item.rerolled = rerolled
+
+def with_apply(level, chaos_level, rerolled):
+    for item in items:
+        item.apply(level=level, chaos_level=chaos_level, rerolled=rerolled)
+
+# Sanity check before timing anything
+for func in [with_setters, with_apply]:
+    for target in targets:
+        func(*target)
+        for item in items:
+            if (item.level, item.chaos_level, item.rerolled) != target:
+                raise Exception('{} did not set {} properly'.format(func.__name__, target))
+
+results = {}
+for func in [with_setters, with_apply]:
+    elapsed = timeit.timeit(
+            lambda: [func(*target) for target in targets],
+            number=args.number,
+            )
+    per_item = elapsed / (args.number*len(targets)*len(items)) * 1000000
+    results[func.__name__] = per_item
+    print('{:>12}: {:.2f}s total, {:.2f}us per item'.format(
+        func.__name__,
+        elapsed,
+        per_item,
+        ))
+print('Speedup: {:.1f}x'.format(results['with_setters'] / results['with_apply']))
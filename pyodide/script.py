@@ -112,10 +112,11 @@ def fake_tvhm():
     save = TTWLSave( input_filename )
     save.randomize_guid();
     # duped in cli_edit.py
-    for missions in save.get_pt_completed_mission_lists():
-        for mission in missions:
-            if mission != "/Game/Missions/Plot/Mission_Plot11.Mission_Plot11_C":
-                save.delete_mission(0,mission,allow_plot=True)
+    for pt, missions in enumerate(save.get_pt_completed_mission_lists()):
+        save.delete_missions([mission for mission in missions
+                              if mission != "/Game/Missions/Plot/Mission_Plot11.Mission_Plot11_C"],
+                             pt=pt,
+                             allow_plot=True)
     save.set_playthroughs_completed(1)
     save.finish_game()
     # duped in cli_edit.py
@@ -136,7 +137,6 @@ def import_items(items_text):
                                          save.create_new_item_encoded,
                                          save.add_item,
                                          file_csv=True,
-                                         allow_fabricator=True,
                                          quiet=False
         )
     res =  wrap_io(task)
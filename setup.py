@@ -33,6 +33,7 @@ setup(
         package_data={
             'ttwlsave': [
                 'resources/inventoryserialdb.json.gz',
+                'resources/inventoryserialdb.bin',
                 'resources/balance_name_mapping.json.gz',
                 'resources/balance_to_inv_key.json.gz',
                 ],
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import sys
+import unittest
+import threading
+
+from ttwlsave import datalib
+
+class WLSerialApplyTests(unittest.TestCase):
+
+    # A level-20 item whose parts we can't parse (it's got no invkey)
+    no_invkey_serial = 'WL(BQAAAAC2o4A7AxhpQmkol0p50WCcRx0zrBU6hAAAAAAAAGdAACAA)'
+
+    def make_serial(self, serial):
+        return datalib.WLSerial(
+                datalib.WLSerial.decode_serial_base64(serial),
+                datalib.DataWrapper.shared(),
+                )
+
+    def test_apply_level_without_parts(self):
+        item = self.make_serial(self.no_invkey_serial)
+        self.assertEqual(item.level, 20)
+        self.assertFalse(item.can_parse_parts)
+
+        changed = item.apply(level=40, chaos_level=4, rerolled=2)
+        self.assertEqual(changed, {'level'})
+        self.assertEqual(item.level, 40)
+
+        # Make sure the change made it into the serial itself
+        reparsed = self.make_serial(item.get_serial_base64())
+        self.assertEqual(reparsed.level, 40)
+
+class InventorySerialDBThreadTests(unittest.TestCase):
+
+    # From mod_testing_gear.txt
+    serials = [
+            'WL(BQAAAACnEIC79mEggTIGugpRfCgjCAAABA==)',
+            'WL(BQAAAABXNIA7ORppgmool0p50WCcRx0zrBU6hAAAAAAAAGdAACAA)',
+            'WL(BQAAAAA0SIA7LQmBgzJG6DEwMSwAAEAA)',
+            ]
+    num_threads = 8
+    num_rounds = 5
+
+    def decode_all(self, datawrapper):
+        """
+        Decodes all our serials (and pushes them through a re-encode, which
+        needs the bit lookups), and looks up the first part in every category,
+        returning a list of everything we found.
+        """
+        results = []
+        for serial in self.serials:
+            item = datalib.WLSerial(datalib.WLSerial.decode_serial_base64(serial), datawrapper)
+            results.append((item.balance, item.level, item.chaos_level, item.rerolled))
+            item.apply(chaos_level=0, rerolled=1)
+            results.append(item.get_serial_base64())
+        serial_db = datawrapper.serial_db
+        for category in sorted(serial_db.get_categories()):
+            part = serial_db.get_part(category, 1)
+            if part is not None:
+                results.append((
+                    category,
+                    part,
+                    serial_db.get_part_index(category, part),
+                    serial_db.get_part_index(category, part.upper(), case_insensitive=True),
+                    ))
+        return results
+
+    def setUp(self):
+        # Switch threads as often as possible, to give races a chance to show up
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_concurrent_decode(self):
+        expected = self.decode_all(datalib.DataWrapper())
+        for _ in range(self.num_rounds):
+            # A fresh DataWrapper each round, so all the lazy caches start
+            # out empty and every thread is racing to fill them in.
+            datawrapper = datalib.DataWrapper()
+            barrier = threading.Barrier(self.num_threads)
+            results = [None]*self.num_threads
+            errors = []
+            def worker(idx):
+                try:
+                    barrier.wait()
+                    results[idx] = self.decode_all(datawrapper)
+                except Exception as e:
+                    errors.append(e)
+            threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(self.num_threads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+            for result in results:
+                self.assertEqual(result, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from ttwlsave import gvas, cipher, datalib, OakSave_pb2, OakProfile_pb2
+from ttwlsave.ttwlsave import TTWLSave
+from ttwlsave.ttwlprofile import TTWLProfile
+
+# From mod_testing_gear.txt
+good_serial = datalib.WLSerial.decode_serial_base64('WL(BQAAAAA0SIA7LQmBgzJG6DEwMSwAAEAA)')
+bad_serial = b'\x00garbage'
+
+class SaveFileTestCase(unittest.TestCase):
+    """
+    Base class for tests which need a savegame or profile on disk; these get
+    built from scratch in a temp dir.
+    """
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def write_file(self, filename, message, obj_class, sg_type):
+        header = gvas.GvasContainer()
+        header.sg_version = 2
+        header.pkg_version = 517
+        header.engine_major = 4
+        header.engine_minor = 26
+        header.engine_build = 1234
+        header.build_id = 'OAK-TEST'
+        header.fmt_version = 3
+        header.sg_type = sg_type
+        full_path = os.path.join(self.tempdir, filename)
+        header.save_to(full_path, cipher.encrypt(message.SerializeToString(),
+            obj_class._prefix_magic, obj_class._xor_magic))
+        return full_path
+
+    def make_save(self):
+        char = OakSave_pb2.Character()
+        char.inventory_items.add(item_serial_number=good_serial, pickup_order_index=5)
+        return TTWLSave(self.write_file('1.sav', char, TTWLSave, 'OakSaveGame'))
+
+    def make_profile(self):
+        prof = OakProfile_pb2.Profile()
+        prof.bank_inventory_list.add(item_serial_number=good_serial, pickup_order_index=5)
+        return TTWLProfile(self.write_file('profile.sav', prof, TTWLProfile, 'OakProfile'))
+
+class HeaderTests(SaveFileTestCase):
+
+    def check_header(self, obj, sg_type):
+        self.assertEqual(obj.sg_version, 2)
+        self.assertEqual(obj.pkg_version, 517)
+        self.assertEqual(obj.engine_major, 4)
+        self.assertEqual(obj.engine_minor, 26)
+        self.assertEqual(obj.engine_patch, 0)
+        self.assertEqual(obj.engine_build, 1234)
+        self.assertEqual(obj.build_id, 'OAK-TEST')
+        self.assertEqual(obj.fmt_version, 3)
+        self.assertEqual(obj.custom_format_data, [])
+        self.assertEqual(obj.sg_type, sg_type)
+
+        # Changes should make it into the saved file
+        obj.build_id = 'OAK-CHANGED'
+        self.assertEqual(obj.gvas.build_id, 'OAK-CHANGED')
+        new_path = os.path.join(self.tempdir, 'new.sav')
+        obj.save_to(new_path)
+        self.assertEqual(type(obj)(new_path).build_id, 'OAK-CHANGED')
+
+    def test_save_header(self):
+        self.check_header(self.make_save(), 'OakSaveGame')
+
+    def test_profile_header(self):
+        self.check_header(self.make_profile(), 'OakProfile')
+
+class AddNewItemsTests(SaveFileTestCase):
+
+    def test_add_new_items(self):
+        save = self.make_save()
+        new_items = save.add_new_items([good_serial, good_serial])
+        self.assertEqual(len(new_items), 2)
+        self.assertEqual(len(save.save.inventory_items), 3)
+        self.assertEqual(len(save.items), 3)
+        self.assertEqual(save.max_pickup_order, 7)
+
+    def test_add_new_items_bad_serial(self):
+        save = self.make_save()
+        with self.assertRaises(Exception):
+            save.add_new_items([good_serial, bad_serial])
+        self.assertEqual(len(save.save.inventory_items), 1)
+        self.assertEqual(len(save.items), 1)
+        self.assertEqual(save.max_pickup_order, 5)
+
+    def test_add_new_bank_items_bad_serial(self):
+        prof = self.make_profile()
+        with self.assertRaises(Exception):
+            prof.add_new_bank_items([good_serial, bad_serial])
+        self.assertEqual(len(prof.prof.bank_inventory_list), 1)
+        self.assertEqual(len(prof.bank), 1)
+        self.assertEqual(prof.max_bank_pickup_order, 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+
+# Whole-buffer versions of the savegame/profile obfuscation which Gibbed
+# figured out (see the notes at the top of ttwlsave.py and ttwlprofile.py).
+# The original per-byte loops look like this:
+#
+#     Decrypt:
+#         for i in range(len(data)-1, -1, -1):
+#             if i < 32:
+#                 b = prefix_magic[i]
+#             else:
+#                 b = data[i - 32]
+#             b ^= xor_magic[i % 32]
+#             data[i] ^= b
+#
+#     Encrypt:
+#         for i in range(len(data)):
+#             (same loop body)
+#
+# Since decryption runs backwards, each byte only ever gets XORed against
+# still-*encrypted* data from 32 bytes earlier, so the whole thing can be
+# done in one go: shift the buffer along by 32 bytes (with the prefix magic
+# filling the gap), and XOR that plus a repeated `xor_magic` against it.
+#
+# Encryption runs forwards, so it's a chained XOR across 32-byte blocks:
+#
+#     enc[k] = plain[k] ^ xor_magic ^ enc[k-1]     (with enc[-1] = prefix_magic)
+#
+# Unrolling that, block `k` ends up as the XOR of all plaintext blocks up to
+# and including `k`, XORed with `prefix_magic`, and XORed with `xor_magic`
+# only when `k` is even (it cancels itself out on odd blocks).  The running
+# XOR is a prefix scan, which we do on the whole buffer as a single Python
+# int, doubling the shift each pass, so it only takes log2(blocks) passes.
+#
+# All the ints in here are little-endian, so block `k` lives in bits
+# `256*k` through `256*(k+1)`.
+
+def _repeat(pattern, length):
+    """
+    Returns `pattern` repeated out to `length` bytes, as a little-endian int
+    """
+    return int.from_bytes((pattern * (length//len(pattern)+1))[:length], 'little')
+
+def decrypt(data, prefix_magic, xor_magic):
+    """
+    De-obfuscates the given savegame/profile `data`, using the specified
+    `prefix_magic` and `xor_magic` (both of which should be 32 bytes).
+    Returns the result as `bytes`.
+    """
+    length = len(data)
+    if length == 0:
+        return b''
+    mask = (1 << (length*8)) - 1
+    enc = int.from_bytes(data, 'little')
+    shifted = ((enc << 256) | int.from_bytes(prefix_magic, 'little')) & mask
+    return (enc ^ shifted ^ _repeat(xor_magic, length)).to_bytes(length, 'little')
+
+def decrypt_range(data, start, end, prefix_magic, xor_magic):
+    """
+    De-obfuscates just `data[start:end]` from the given savegame/profile
+    `data`, without touching the rest of it.  Each decrypted byte only
+    depends on the encrypted byte 32 positions earlier, so any window can
+    be decrypted on its own.  Returns the result as `bytes`.
+    """
+    end = min(end, len(data))
+    length = end - start
+    if length <= 0:
+        return b''
+    if start >= 32:
+        window = int.from_bytes(data[start-32:end], 'little')
+    else:
+        window = int.from_bytes(bytes(prefix_magic[start:]) + bytes(data[:end]), 'little')
+    rot = start % 32
+    key = _repeat(bytes(xor_magic[rot:]) + bytes(xor_magic[:rot]), length)
+    mask = (1 << (length*8)) - 1
+    return ((window >> 256) ^ (window & mask) ^ key).to_bytes(length, 'little')
+
+def encrypt(data, prefix_magic, xor_magic):
+    """
+    Obfuscates the given savegame/profile `data`, using the specified
+    `prefix_magic` and `xor_magic` (both of which should be 32 bytes).
+    Returns the result as `bytes`.
+    """
+    length = len(data)
+    if length == 0:
+        return b''
+
+    # Pad out to a full block; we'll trim it off at the end, and since the
+    # chain only ever looks backwards, the padding can't affect anything.
+    padded_len = (length + 31) // 32 * 32
+    total_bits = padded_len*8
+    mask = (1 << total_bits) - 1
+
+    # Running XOR across blocks
+    scan = int.from_bytes(data, 'little')
+    shift = 256
+    while shift < total_bits:
+        scan ^= (scan << shift) & mask
+        shift *= 2
+
+    # Now mix in the magic
+    scan ^= _repeat(prefix_magic, padded_len)
+    scan ^= _repeat(bytes(xor_magic) + bytes(32), padded_len)
+    return (scan & ((1 << (length*8)) - 1)).to_bytes(length, 'little')
@@ -26,8 +26,203 @@ import sys
 import html
 import argparse
 import ttwlsave
+import concurrent.futures
 from ttwlsave.ttwlsave import TTWLSave, InvSlot
 
+def process_save(filename, output_filename):
+    """
+    Processes a single archive savegame at `filename`, writing the result
+    to `output_filename`.  Returns a tuple containing the character level,
+    the (English) map name the character is in, and a list of (English)
+    active mission names, for use in the HTML summary.  This is a
+    module-level function so that it can be handed off to a process pool.
+    """
+
+    # Load!
+    print('Processing: {}'.format(filename))
+    save = TTWLSave(filename)
+    char_level = save.get_level()
+
+    # Grab info for the HTML summary before we make any changes
+    in_map = save.get_pt_last_map(0, True)
+    missions = save.get_pt_active_mission_list(0, True)
+
+    # May as well force the name, while we're at it
+    save.set_char_name("WL Savegame Archive")
+
+    # Hardcode GUID
+    save.randomize_guid()
+
+    # Max XP
+    # (Actually, not bothering with this -- Wonderlands enemies scale with
+    # your char so there's no real advantage to forcing us to max, and this
+    # way we'd have an opportunity to test out some level-change-based
+    # behavior.)
+    #save.set_level(ttwlsave.max_level)
+
+    # Max Hero Stats
+    # (eh, actually don't bother -- would probably just gunk up the UI
+    # with "points available" warnings, and it's not like we're not
+    # cheating like hell with our gear anyway.)
+    #save.set_hero_stats(ttwlsave.HeroStats, 30)
+
+    # Currency
+    save.set_money(50000000) # Fifty million
+    save.set_moon_orbs(16000)
+    save.set_souls(1400)
+
+    # Max SDUs
+    save.set_max_sdus()
+
+    # Max Ammo
+    save.set_max_ammo()
+
+    # Unlock all inventory slots
+    save.unlock_slots([
+        # Not unlocking the second spell slot since that's class-specific
+        InvSlot.WEAPON3,
+        InvSlot.WEAPON4,
+        InvSlot.ARMOR,
+        InvSlot.RING1,
+        InvSlot.RING2,
+        InvSlot.AMULET,
+        ])
+
+    # Unlock Feats/Companions
+    # (Not gonna do this after all, I don't think.)
+    #save.unlock_feat()
+
+    # Unlock Multiclass
+    # (Not gonna do this after all, I don't think.)
+    #save.unlock_multiclass()
+
+    # Unlock Chaos Mode (though don't actually set a value)
+    save.set_chaos_level(ttwlsave.max_chaos_level, unlock_only=True)
+
+    # Inventory - force our testing gear
+    # Gear data just taken from my modtest char - Level 40 + Ascended
+    # If the max level or Chaos Level ever updates, they'll get upgraded below
+    manual_transmission = 'WL(BQAAAABXNIA7ORppgmool0p50WCcRx0zrBU6hAAAAAAAAGdAACAA)'
+    transistor = 'WL(BQAAAACnEIC79mEggTIGugpRfCgjCAAABA==)'
+    goblin_pickaxe = 'WL(BQAAAAA0SIA7LQmBgzJG6DEwMSwAAEAA)'
+    save.overwrite_item_in_slot_encoded(ttwlsave.InvSlot.WEAPON1, manual_transmission)
+    save.overwrite_item_in_slot_encoded(ttwlsave.InvSlot.WARD, transistor)
+    save.overwrite_item_in_slot_encoded(ttwlsave.InvSlot.MELEE, goblin_pickaxe)
+
+    # Bring testing gear up to our max level, while we're at it.  The serials
+    # above don't have any rerolls logged, but we may as well be sure about
+    # that anyway.
+    for item in save.get_items():
+        changed = item.apply(
+                level=char_level,
+                chaos_level=ttwlsave.ChaosLevel.ASCENDED.value,
+                rerolled=0,
+                )
+        if 'level' not in changed and item.level != char_level:
+            print(' - WARNING: Could not set level on {}'.format(item.eng_name))
+
+    # Make sure all saves have my save-archive customizations selected
+    # (this is, generally, the case already, except that the Banner and
+    # Statue customizations can't get chosen until either Brighthoof or
+    # Dreamveil Overlook).
+    save.save.selected_customizations[:] = [
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/SkinTone/SkinToneColor_21.SkinToneColor_21',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Head/HeadType_11.HeadType_11',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/HairColor/HairColor_09.HairColor_09',
+            '/Game/PatchDLC/Indigo4/PlayerCharacters/_Shared/_Design/Customization/HeadAccessories/HeadAccessory_55.HeadAccessory_55',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/EyeShape/EyeShape_03.EyeShape_03',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Eyebrows/Eyebrows_05.Eyebrows_05',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/PupilShape/Pupil_15.Pupil_15',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/EyeColor/EyeColor_03.EyeColor_03',
+            '/Game/PatchDLC/Indigo2/PlayerCharacters/_Shared/_Design/EarShapes/EarShape_16.EarShape_16',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/NoseShape/NoseShape_06.NoseShape_06',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/MouthShape/MouthShape_09.MouthShape_09',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Scar/Scars_00.Scars_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Tattoo/Tattoos_00.Tattoos_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/TattooColor/TattooColor_01.TattooColor_01',
+            '/Game/PatchDLC/Indigo3/PlayerCharacters/_Shared/Design/Customization/FaceAccessories/FaceAccessory_29.FaceAccessory_29',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/Blush/BlushShape_00.BlushShape_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/BlushColor/MakeupColor_01_Blush.MakeupColor_01_Blush',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeLiner/EyelinerShape_00.EyelinerShape_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeLinerColor/MakeupColor_01_Eyeliner.MakeupColor_01_Eyeliner',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeShadow/EyeShadow_00.EyeShadow_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeShadowColor/MakeupColor_01_Eyeshadow.MakeupColor_01_Eyeshadow',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/Lipstick/Lipstick_00.Lipstick_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/LipstickColor/MakeupColor_01_Lipstick.MakeupColor_01_Lipstick',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Body/BodyShape_02.BodyShape_02',
+            '/Game/PatchDLC/Indigo2/PlayerCharacters/_Shared/_Design/ArmorColor/ArmorColor_80_Primary.ArmorColor_80_Primary',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/ColorSecondary/ArmorColor_69_Secondary.ArmorColor_69_Secondary',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/ColorTertiary/ArmorColor_48_Tertiary.ArmorColor_48_Tertiary',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/UnderPattern/UnderArmorPattern_22.UnderArmorPattern_22',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Emotes/Emote_09.Emote_09',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Emotes/Emote_11.Emote_11',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/Pattern/ArmorPattern_02.ArmorPattern_02',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Eyelashes/Eyelashes_02.Eyelashes_02',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Scar/ScarFlip_00.ScarFlip_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Tattoo/TattooFlip_00.TattooFlip_00',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/Pattern/BannerPattern_04.BannerPattern_04',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/PatternColor/BannerColor_27_Pattern.BannerColor_27_Pattern',
+            '/Game/PatchDLC/Indigo2/PlayerCharacters/_Shared/_Design/Banners/Banner_Shape_23.Banner_Shape_23',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/BackgroundColor/BannerColor_30_Shape.BannerColor_30_Shape',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/Icon/BannerIcon_12.BannerIcon_12',
+            '/Game/PatchDLC/Indigo4/PlayerCharacters/_Shared/_Design/Customization/Statues/Poses/HeroStatuePose_28.HeroStatuePose_28',
+            '/Game/PatchDLC/Indigo4/PlayerCharacters/_Shared/_Design/Customization/Statues/Materials/HeroStatueMaterial_25.HeroStatueMaterial_25',
+            '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/IconColor/BannerColor_29_Icon.BannerColor_29_Icon',
+            ]
+
+    # And I suppose if I'm enforcing *those* customizations, I may as well get the sliders, too,
+    # as well as voice + pronoun stuff.  Do it right!
+    sliders = {
+            'LeftEyePosX': 0.012512505,
+            'RightEyePosX': -0.012512505,
+            'LeftEyePosY': -0.13783783,
+            'RightEyePosY': -0.13783783,
+            'LeftEyeRot': -0.46546555,
+            'RightEyeRot': 0.46546555,
+            'LeftEyeScale': 0.9592593,
+            'RightEyeScale': 0.9592593,
+            'LeftEarScale': 1.0660659,
+            'RightEarScale': 1.0660659,
+            'NosePosY': -0.2181181,
+            'NoseScale': 0.88588595,
+            'MouthPosY': 0.3068068,
+            'MouthUpperLipScale': 1.1223223,
+            'MouthLowerLipScale': 1.0810812,
+            'BodyScale': 1.0001802,
+            'HeadAndNeck_Scale': 1.0009409,
+            }
+    for c in save.save.custom_float_customizations:
+        if c.name in sliders:
+            c.value = sliders[c.name]
+    save.save.player_voice.data = '/Game/Dialog/Nametags/DNT_PlBraveF.DNT_PlBraveF'
+    save.save.player_voice.pitch = 0.5
+    save.save.player_pronoun_selection = '/Game/PlayerCharacters/_Shared/_Design/PlayerPronouns/PlayerPronouns_Neutral.PlayerPronouns_Neutral'
+
+    # Write out
+    save.save_to(output_filename)
+
+    return (char_level, in_map, missions)
+
+def write_info_row(idf, row_num, base_filename, char_level, in_map, missions):
+    """
+    Writes out a single HTML summary row to `idf`, using the information
+    returned by `process_save`.
+    """
+    print('<tr class="row{}">'.format(row_num % 2), file=idf)
+    print(f'<td class="filename"><a href="https://github.com/apocalyptech/blsaves/raw/main/wl/{base_filename}">{base_filename}</a></td>', file=idf)
+    print(f'<td class="level">{char_level}</td>', file=idf)
+    print('<td class="in_map">{}</td>'.format(in_map), file=idf)
+    if len(missions) == 0:
+        print('<td class="empty_missions">&nbsp;</td>', file=idf)
+    else:
+        print('<td class="active_missions">', file=idf)
+        print('<ul>', file=idf)
+        for mission in sorted(missions):
+            print('<li>{}</li>'.format(html.escape(mission, quote=False)), file=idf)
+        print('</ul>', file=idf)
+        print('</td>', file=idf)
+    print('</tr>', file=idf)
+
 def main():
 
     # Set up args
@@ -67,10 +262,17 @@ def main():
             action='store_true',
             help='Clobber (overwrite) files without asking')
 
+    parser.add_argument('-j', '--jobs',
+            type=int,
+            default=1,
+            help='Number of savegames to process in parallel')
+
     # Parse args
     args = parser.parse_args()
     if not args.filename and not args.directory:
         args.directory = 'step'
+    if args.jobs < 1:
+        raise argparse.ArgumentTypeError('Number of jobs must be at least 1')
 
     # Construct a list of filenames
     targets = []
@@ -102,16 +304,10 @@ def main():
             # Default to No
             args.info = None
 
-    # Open the info file, if we have one.
-    if args.info:
-        idf = open(args.info, 'w')
-
-    # Now loop through and process
-    files_written = 0
-    if args.reverse:
-        row_offset = 1
-    else:
-        row_offset = 0
+    # Figure out output filenames and resolve any overwrite prompts before we
+    # start processing, so that nothing has to be interactive once we're
+    # (potentially) running in parallel.
+    to_process = []
     for filename in targets:
 
         # Figure out an output filename
@@ -137,185 +333,38 @@ def main():
                 break
             else:
                 # Default to No
-                response = 'n'
-
-        # Load!
-        print('Processing: {}'.format(filename))
-        save = TTWLSave(filename)
-        char_level = save.get_level()
-
-        # Write to our info file, if we have it
-        if args.info:
-
-            # Write out the row
-            print('<tr class="row{}">'.format((files_written + row_offset) % 2), file=idf)
-            print(f'<td class="filename"><a href="https://github.com/apocalyptech/blsaves/raw/main/wl/{base_filename}">{base_filename}</a></td>', file=idf)
-            print(f'<td class="level">{char_level}</td>', file=idf)
-            print('<td class="in_map">{}</td>'.format(save.get_pt_last_map(0, True)), file=idf)
-            missions = save.get_pt_active_mission_list(0, True)
-            if len(missions) == 0:
-                print('<td class="empty_missions">&nbsp;</td>', file=idf)
-            else:
-                print('<td class="active_missions">', file=idf)
-                print('<ul>', file=idf)
-                for mission in sorted(missions):
-                    print('<li>{}</li>'.format(html.escape(mission, quote=False)), file=idf)
-                print('</ul>', file=idf)
-                print('</td>', file=idf)
-            print('</tr>', file=idf)
-
-        # May as well force the name, while we're at it
-        save.set_char_name("WL Savegame Archive")
-
-        # Hardcode GUID
-        save.randomize_guid()
-
-        # Max XP
-        # (Actually, not bothering with this -- Wonderlands enemies scale with
-        # your char so there's no real advantage to forcing us to max, and this
-        # way we'd have an opportunity to test out some level-change-based
-        # behavior.)
-        #save.set_level(ttwlsave.max_level)
-
-        # Max Hero Stats
-        # (eh, actually don't bother -- would probably just gunk up the UI
-        # with "points available" warnings, and it's not like we're not
-        # cheating like hell with our gear anyway.)
-        #save.set_hero_stats(ttwlsave.HeroStats, 30)
-
-        # Currency
-        save.set_money(50000000) # Fifty million
-        save.set_moon_orbs(16000)
-        save.set_souls(1400)
-
-        # Max SDUs
-        save.set_max_sdus()
-
-        # Max Ammo
-        save.set_max_ammo()
-
-        # Unlock all inventory slots
-        save.unlock_slots([
-            # Not unlocking the second spell slot since that's class-specific
-            InvSlot.WEAPON3,
-            InvSlot.WEAPON4,
-            InvSlot.ARMOR,
-            InvSlot.RING1,
-            InvSlot.RING2,
-            InvSlot.AMULET,
-            ])
-
-        # Unlock Feats/Companions
-        # (Not gonna do this after all, I don't think.)
-        #save.unlock_feat()
-
-        # Unlock Multiclass
-        # (Not gonna do this after all, I don't think.)
-        #save.unlock_multiclass()
-
-        # Unlock Chaos Mode (though don't actually set a value)
-        save.set_chaos_level(ttwlsave.max_chaos_level, unlock_only=True)
-
-        # Inventory - force our testing gear
-        # Gear data just taken from my modtest char - Level 40 + Ascended
-        # If the max level or Chaos Level ever updates, they'll get upgraded below
-        manual_transmission = 'WL(BQAAAABXNIA7ORppgmool0p50WCcRx0zrBU6hAAAAAAAAGdAACAA)'
-        transistor = 'WL(BQAAAACnEIC79mEggTIGugpRfCgjCAAABA==)'
-        goblin_pickaxe = 'WL(BQAAAAA0SIA7LQmBgzJG6DEwMSwAAEAA)'
-        save.overwrite_item_in_slot_encoded(ttwlsave.InvSlot.WEAPON1, manual_transmission)
-        save.overwrite_item_in_slot_encoded(ttwlsave.InvSlot.WARD, transistor)
-        save.overwrite_item_in_slot_encoded(ttwlsave.InvSlot.MELEE, goblin_pickaxe)
-
-        # Bring testing gear up to our max level, while we're at it.
-        for item in save.get_items():
-            if item.level != char_level:
-                item.level = char_level
-            if item.chaos_level != ttwlsave.ChaosLevel.ASCENDED.value:
-                item.chaos_level = ttwlsave.ChaosLevel.ASCENDED.value
-            # The serials above don't have any rerolls logged, but we may as well
-            # be sure about that anyway
-            item.rerolled = 0
-
-        # Make sure all saves have my save-archive customizations selected
-        # (this is, generally, the case already, except that the Banner and
-        # Statue customizations can't get chosen until either Brighthoof or
-        # Dreamveil Overlook).
-        save.save.selected_customizations[:] = [
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/SkinTone/SkinToneColor_21.SkinToneColor_21',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Head/HeadType_11.HeadType_11',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/HairColor/HairColor_09.HairColor_09',
-                '/Game/PatchDLC/Indigo4/PlayerCharacters/_Shared/_Design/Customization/HeadAccessories/HeadAccessory_55.HeadAccessory_55',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/EyeShape/EyeShape_03.EyeShape_03',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Eyebrows/Eyebrows_05.Eyebrows_05',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/PupilShape/Pupil_15.Pupil_15',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/EyeColor/EyeColor_03.EyeColor_03',
-                '/Game/PatchDLC/Indigo2/PlayerCharacters/_Shared/_Design/EarShapes/EarShape_16.EarShape_16',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/NoseShape/NoseShape_06.NoseShape_06',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/MouthShape/MouthShape_09.MouthShape_09',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Scar/Scars_00.Scars_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Tattoo/Tattoos_00.Tattoos_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/TattooColor/TattooColor_01.TattooColor_01',
-                '/Game/PatchDLC/Indigo3/PlayerCharacters/_Shared/Design/Customization/FaceAccessories/FaceAccessory_29.FaceAccessory_29',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/Blush/BlushShape_00.BlushShape_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/BlushColor/MakeupColor_01_Blush.MakeupColor_01_Blush',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeLiner/EyelinerShape_00.EyelinerShape_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeLinerColor/MakeupColor_01_Eyeliner.MakeupColor_01_Eyeliner',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeShadow/EyeShadow_00.EyeShadow_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/EyeShadowColor/MakeupColor_01_Eyeshadow.MakeupColor_01_Eyeshadow',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/Lipstick/Lipstick_00.Lipstick_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Makeup/LipstickColor/MakeupColor_01_Lipstick.MakeupColor_01_Lipstick',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Body/BodyShape_02.BodyShape_02',
-                '/Game/PatchDLC/Indigo2/PlayerCharacters/_Shared/_Design/ArmorColor/ArmorColor_80_Primary.ArmorColor_80_Primary',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/ColorSecondary/ArmorColor_69_Secondary.ArmorColor_69_Secondary',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/ColorTertiary/ArmorColor_48_Tertiary.ArmorColor_48_Tertiary',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/UnderPattern/UnderArmorPattern_22.UnderArmorPattern_22',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Emotes/Emote_09.Emote_09',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Emotes/Emote_11.Emote_11',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Armor/Pattern/ArmorPattern_02.ArmorPattern_02',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Eyelashes/Eyelashes_02.Eyelashes_02',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Scar/ScarFlip_00.ScarFlip_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Tattoo/TattooFlip_00.TattooFlip_00',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/Pattern/BannerPattern_04.BannerPattern_04',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/PatternColor/BannerColor_27_Pattern.BannerColor_27_Pattern',
-                '/Game/PatchDLC/Indigo2/PlayerCharacters/_Shared/_Design/Banners/Banner_Shape_23.Banner_Shape_23',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/BackgroundColor/BannerColor_30_Shape.BannerColor_30_Shape',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/Icon/BannerIcon_12.BannerIcon_12',
-                '/Game/PatchDLC/Indigo4/PlayerCharacters/_Shared/_Design/Customization/Statues/Poses/HeroStatuePose_28.HeroStatuePose_28',
-                '/Game/PatchDLC/Indigo4/PlayerCharacters/_Shared/_Design/Customization/Statues/Materials/HeroStatueMaterial_25.HeroStatueMaterial_25',
-                '/Game/PlayerCharacters/_Shared/_Design/Customization/Banner/IconColor/BannerColor_29_Icon.BannerColor_29_Icon',
-                ]
-
-        # And I suppose if I'm enforcing *those* customizations, I may as well get the sliders, too,
-        # as well as voice + pronoun stuff.  Do it right!
-        sliders = {
-                'LeftEyePosX': 0.012512505,
-                'RightEyePosX': -0.012512505,
-                'LeftEyePosY': -0.13783783,
-                'RightEyePosY': -0.13783783,
-                'LeftEyeRot': -0.46546555,
-                'RightEyeRot': 0.46546555,
-                'LeftEyeScale': 0.9592593,
-                'RightEyeScale': 0.9592593,
-                'LeftEarScale': 1.0660659,
-                'RightEarScale': 1.0660659,
-                'NosePosY': -0.2181181,
-                'NoseScale': 0.88588595,
-                'MouthPosY': 0.3068068,
-                'MouthUpperLipScale': 1.1223223,
-                'MouthLowerLipScale': 1.0810812,
-                'BodyScale': 1.0001802,
-                'HeadAndNeck_Scale': 1.0009409,
-                }
-        for c in save.save.custom_float_customizations:
-            if c.name in sliders:
-                c.value = sliders[c.name]
-        save.save.player_voice.data = '/Game/Dialog/Nametags/DNT_PlBraveF.DNT_PlBraveF'
-        save.save.player_voice.pitch = 0.5
-        save.save.player_pronoun_selection = '/Game/PlayerCharacters/_Shared/_Design/PlayerPronouns/PlayerPronouns_Neutral.PlayerPronouns_Neutral'
-
-        # Write out
-        save.save_to(output_filename)
-        files_written += 1
+                continue
+
+        to_process.append((filename, base_filename, output_filename))
+
+    # Open the info file, if we have one.
+    if args.info:
+        idf = open(args.info, 'w')
+
+    # Now loop through and process
+    files_written = 0
+    if args.reverse:
+        row_offset = 1
+    else:
+        row_offset = 0
+    if args.jobs > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            results = executor.map(process_save,
+                    [filename for (filename, _, _) in to_process],
+                    [output_filename for (_, _, output_filename) in to_process],
+                    )
+            # `map` hands results back in the order they were submitted, so
+            # our HTML rows will still come out sorted.
+            for (_, base_filename, _), result in zip(to_process, results):
+                if args.info:
+                    write_info_row(idf, files_written + row_offset, base_filename, *result)
+                files_written += 1
+    else:
+        for filename, base_filename, output_filename in to_process:
+            result = process_save(filename, output_filename)
+            if args.info:
+                write_info_row(idf, files_written + row_offset, base_filename, *result)
+            files_written += 1
 
     if args.filename:
         if files_written == 1:
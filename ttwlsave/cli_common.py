@@ -22,7 +22,11 @@
 # 3. This notice may not be removed or altered from any source distribution.
 
 import csv
+import time
 import argparse
+import itertools
+import collections
+import concurrent.futures
 from . import datalib
 from ttwlsave import ChaosLevel
 
@@ -103,7 +107,108 @@ def export_items_csv(items, export_file, quiet=False):
     if not quiet:
         print('Wrote {} items (in base64 format) to CSV file {}'.format(len(items), export_file))
 
-def import_items(import_file, item_create_func, item_add_func, file_csv=False, quiet=False):
+class ItemFileReader(object):
+    """
+    Streams item serials out of an import file, without reading the whole
+    file in first.  If `file_csv` is `True`, we will process the file as if
+    it's a CSV, otherwise we'll process as if it's a "regular" text file.
+    Iterate over the object to get the serials (still in their `WL()`-encoded
+    form).  Once iteration's done, `looks_like_csv` will be `True` if a text
+    file looked like it might've been a CSV instead.
+    """
+
+    def __init__(self, import_file, file_csv=False):
+        self.import_file = import_file
+        self.file_csv = file_csv
+        self.looks_like_csv = False
+
+    def __iter__(self):
+        if self.file_csv:
+            # For CSV files, we'll look for serial numbers in literally any cell
+            # of the CSV
+            with open(self.import_file) as df:
+                reader = csv.reader(df)
+                for row in reader:
+                    for cell in row:
+                        cell = cell.strip()
+                        if datalib.WLSerial.get_inner_serial_base64(cell):
+                            yield cell
+        else:
+            # For text files, we need the entire line to *just* be a valid serial.
+            csv_patterns = set([
+                f',{prefix}(' for prefix in datalib.WLSerial.code_prefixes
+                ])
+            found_serial = False
+            with open(self.import_file) as df:
+                for line in df:
+                    itemline = line.strip()
+                    if datalib.WLSerial.get_inner_serial_base64(itemline):
+                        found_serial = True
+                        yield itemline
+                    # Also, check to see if we might be a CSV after all, for reporting
+                    # purposes.  Only bother until we've found a serial, though.
+                    elif not found_serial and not self.looks_like_csv and ',' in itemline:
+                        itemline_lower = itemline.lower()
+                        for pattern in csv_patterns:
+                            if pattern in itemline_lower:
+                                self.looks_like_csv = True
+                                break
+
+def _decode_serial_chunk(serials):
+    """
+    Decodes (and CRC-checks, and parses) a chunk of `WL()`-encoded `serials`,
+    for use in a process pool by `iter_decoded_serials`.  Returns a list of
+    tuples containing the original serial, the binary serial, and the entry
+    to prime `SerialRecordCache` with.  If a serial couldn't be decoded, the
+    last two will be `None` and the error message, respectively.
+    """
+    datawrapper = datalib.DataWrapper.shared()
+    results = []
+    for serial in serials:
+        try:
+            item = datalib.WLSerial(datalib.WLSerial.decode_serial_base64(serial), datawrapper)
+            item._parse_serial()
+            results.append((serial, item.serial, (
+                item.decrypted_serial,
+                item.orig_seed,
+                item.serial_version,
+                item._shared_record,
+                )))
+        except Exception as e:
+            results.append((serial, None, str(e)))
+    return results
+
+def iter_decoded_serials(serials, jobs, chunk_size=500):
+    """
+    Given an iterable of `WL()`-encoded `serials`, decode and parse them in
+    chunks of `chunk_size` across a pool of `jobs` processes, priming the
+    shared `SerialRecordCache` with the results so that creating the actual
+    item objects afterwards is cheap.  Yields the serials back out in their
+    original order, as they become available.  Only a few chunks are in
+    flight at any one time, so this is safe to use on huge files.
+    """
+    record_cache = datalib.DataWrapper.shared().record_cache
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = collections.deque()
+        serials = iter(serials)
+        done_reading = False
+        while True:
+            # Keep a few chunks in flight
+            while not done_reading and len(pending) < jobs*2:
+                chunk = list(itertools.islice(serials, chunk_size))
+                if chunk:
+                    pending.append(executor.submit(_decode_serial_chunk, chunk))
+                else:
+                    done_reading = True
+            if not pending:
+                break
+            for serial, binary, entry in pending.popleft().result():
+                if binary is None:
+                    raise Exception(entry)
+                record_cache.put(binary, entry)
+                yield serial
+
+def import_items(import_file, item_create_func, item_add_func, file_csv=False, quiet=False, jobs=1, is_duplicate_func=None):
     """
     Imports items from `import_file`.  `item_create_func` should point to
     a function used to create the item appropriately, and `item_add_func`
@@ -111,50 +216,28 @@ def import_items(import_file, item_create_func, item_add_func, file_csv=False, q
     appropriate container.  If `file_csv` is `True`, we will process the file
     as if it's a CSV, otherwise we'll process as if it's a "regular"
     text file.  If `quiet` is `True`, only error/warning output will be shown.
+    Items are added as they're read from the file.  If `jobs` is more than
+    `1`, the serials will be decoded across that many processes first.
+    If `is_duplicate_func` is given, it will be called with each newly-created
+    item, and any item for which it returns `True` will be skipped rather
+    than added.
     """
     if not quiet:
         print(' - Importing items from {}'.format(import_file))
     added_count = 0
+    skipped_count = 0
+    start_time = time.time()
 
-    # Process the file to find serials
-    looks_like_csv = False
-    csv_patterns = set([
-        f',{prefix}(' for prefix in datalib.WLSerial.code_prefixes
-        ])
-    serial_list = []
-    if file_csv:
-        # For CSV files, we'll look for serial numbers in literally any cell
-        # of the CSV
-        with open(import_file) as df:
-            reader = csv.reader(df)
-            for row in reader:
-                for cell in row:
-                    cell = cell.strip()
-                    if datalib.WLSerial.get_inner_serial_base64(cell):
-                        serial_list.append(cell)
+    reader = ItemFileReader(import_file, file_csv)
+    if jobs > 1:
+        serials = iter_decoded_serials(reader, jobs)
     else:
-        # For text files, we need the entire line to *just* be a valid serial.
-        with open(import_file) as df:
-            for line in df:
-                itemline = line.strip()
-                if datalib.WLSerial.get_inner_serial_base64(itemline):
-                    serial_list.append(itemline)
-                # Also, check to see if we might be a CSV after all, for reporting
-                # purposes.
-                if len(serial_list) == 0 and not looks_like_csv:
-                    itemline_lower = itemline.lower()
-                    for pattern in csv_patterns:
-                        if pattern in itemline_lower:
-                            looks_like_csv = True
-
-    # If we didn't add any items, and the file looked like it might've been a CSV
-    # (while being processed as a text file), report that to the user, just in case.
-    if not file_csv and looks_like_csv:
-        print('   - NOTICE: File looked like a CSV file, try adding --csv to the arguments')
-
-    # Now loop through the serials and see if we should add them
-    for serial in serial_list:
+        serials = reader
+    for serial in serials:
         new_item = item_create_func(serial)
+        if is_duplicate_func is not None and is_duplicate_func(new_item):
+            skipped_count += 1
+            continue
         item_add_func(new_item)
         if not quiet:
             if new_item.eng_name:
@@ -162,139 +245,143 @@ def import_items(import_file, item_create_func, item_add_func, file_csv=False, q
             else:
                 print('   + unknown item')
         added_count += 1
+
+    # If the file looked like it might've been a CSV (while being processed
+    # as a text file), report that to the user, just in case.
+    if not file_csv and reader.looks_like_csv:
+        print('   - NOTICE: File looked like a CSV file, try adding --csv to the arguments')
+
     if not quiet:
         print('   - Added Item Count: {}'.format(added_count))
+        if is_duplicate_func is not None:
+            print('   - Skipped Duplicate Count: {}'.format(skipped_count))
+        elapsed = time.time() - start_time
+        if added_count > 0 and elapsed > 0:
+            print('   - Import rate: {:0.0f} items/sec'.format(added_count/elapsed))
 
-def update_item_levels(items, to_level, quiet=False):
+def _report_updated(num_items, actually_updated, already_txt):
     """
-    Given a list of `items`, update their base level to `level`.  If `quiet`
-    is `True`, only errors will be printed.
+    Reports on how many of `num_items` items were `actually_updated`, for
+    `normalize_items`.  `already_txt` describes the items which didn't need
+    to be changed.
     """
-    num_items = len(items)
-    if not quiet:
-        if num_items == 1:
-            plural = ''
-        else:
-            plural = 's'
-        print(' - Updating {} item{} to level {}'.format(
-            num_items,
-            plural,
-            to_level,
-            ))
-    actually_updated = 0
-    for item in items:
-        if item.level != to_level:
-            item.level = to_level
-            actually_updated += 1
-    if not quiet:
-        remaining = num_items - actually_updated
-        if actually_updated == 1:
-            updated_verb = 'was'
-        else:
-            updated_verb = 'were'
-        if remaining > 0:
-            if remaining == 1:
-                remaining_verb = 'was'
-            else:
-                remaining_verb = 'were'
-            remaining_txt = ' ({} {} already at that level)'.format(remaining, remaining_verb)
+    remaining = num_items - actually_updated
+    if actually_updated == 1:
+        updated_verb = 'was'
+    else:
+        updated_verb = 'were'
+    if remaining > 0:
+        if remaining == 1:
+            remaining_verb = 'was'
         else:
-            remaining_txt = ''
-        print('   - {} {} updated{}'.format(
-            actually_updated,
-            updated_verb,
-            remaining_txt,
-            ))
+            remaining_verb = 'were'
+        remaining_txt = ' ({} {} {})'.format(remaining, remaining_verb, already_txt)
+    else:
+        remaining_txt = ''
+    print('   - {} {} updated{}'.format(
+        actually_updated,
+        updated_verb,
+        remaining_txt,
+        ))
 
-def update_chaos_level(items, to_chaos_level, quiet=False):
+def normalize_items(items, level=None, chaos=None, rerolls=None, quiet=False):
     """
-    Given a list of `items`, update their chaos level to `to_chaos_level`.  If `quiet`
-    is `True`, only errors will be printed.
+    Given a list of `items`, update their base level to `level`, their chaos
+    level to `chaos`, and their enchantment reroll count to `rerolls`.  Any of
+    those left as `None` will be left alone.  Each item gets parsed once and
+    re-encoded (at most) once, no matter how many changes are made, and items
+    which are already at the target values are skipped.  If `quiet` is
+    `True`, only errors will be printed; otherwise, a line describing each
+    requested change is printed before any items are touched, and the
+    number of items updated for each (in the same order) afterwards.
+    Returns a dict with the number of items updated for each of `level`,
+    `chaos`, and `rerolls`.
     """
-    if type(to_chaos_level) == ChaosLevel:
-        level = to_chaos_level
-        to_chaos_level = level.value
-        label = level.label
-    else:
-        level = ChaosLevel(to_chaos_level)
-        if level:
-            label = level.label
+    if chaos is not None:
+        if type(chaos) == ChaosLevel:
+            chaos_label = chaos.label
+            chaos = chaos.value
         else:
-            label = to_chaos_level
+            chaos_obj = ChaosLevel(chaos)
+            if chaos_obj:
+                chaos_label = chaos_obj.label
+            else:
+                chaos_label = chaos
+
     num_items = len(items)
     if not quiet:
         if num_items == 1:
             plural = ''
         else:
             plural = 's'
-        print(' - Updating {} item{} to chaos level {}'.format(
-            num_items,
-            plural,
-            label,
-            ))
-    actually_updated = 0
+        if level is not None:
+            print(' - Updating {} item{} to level {}'.format(
+                num_items,
+                plural,
+                level,
+                ))
+        if chaos is not None:
+            print(' - Updating {} item{} to chaos level {}'.format(
+                num_items,
+                plural,
+                chaos_label,
+                ))
+        if rerolls is not None:
+            if rerolls == 0:
+                print(' - Clearing reroll count for {} item{}'.format(
+                    num_items,
+                    plural,
+                    ))
+            else:
+                print(' - Updating reroll count for {} item{} to {}'.format(
+                    num_items,
+                    plural,
+                    rerolls,
+                    ))
+
+    counts = {'level': 0, 'chaos': 0, 'rerolls': 0}
     for item in items:
-        if item.chaos_level != to_chaos_level:
-            item.chaos_level = to_chaos_level
-            actually_updated += 1
+        # `apply` skips anything which is already set, or which the item
+        # can't have, so only count what it says it actually changed.
+        changed = item.apply(level=level, chaos_level=chaos, rerolled=rerolls)
+        if 'level' in changed:
+            counts['level'] += 1
+        if 'chaos_level' in changed:
+            counts['chaos'] += 1
+        if 'rerolled' in changed:
+            counts['rerolls'] += 1
+
     if not quiet:
-        remaining = num_items - actually_updated
-        if actually_updated == 1:
-            updated_verb = 'was'
-        else:
-            updated_verb = 'were'
-        if remaining > 0:
-            if remaining == 1:
-                remaining_verb = 'was'
+        if level is not None:
+            _report_updated(num_items, counts['level'], 'already at that level')
+        if chaos is not None:
+            _report_updated(num_items, counts['chaos'], 'already at that level')
+        if rerolls is not None:
+            if rerolls == 0:
+                _report_updated(num_items, counts['rerolls'], 'already at zero rerolls')
             else:
-                remaining_verb = 'were'
-            remaining_txt = ' ({} {} already at that level)'.format(remaining, remaining_verb)
-        else:
-            remaining_txt = ''
-        print('   - {} {} updated{}'.format(
-            actually_updated,
-            updated_verb,
-            remaining_txt,
-            ))
+                _report_updated(num_items, counts['rerolls'], 'already at that count')
+
+    return counts
+
+def update_item_levels(items, to_level, quiet=False):
+    """
+    Given a list of `items`, update their base level to `level`.  If `quiet`
+    is `True`, only errors will be printed.
+    """
+    normalize_items(items, level=to_level, quiet=quiet)
 
+def update_chaos_level(items, to_chaos_level, quiet=False):
+    """
+    Given a list of `items`, update their chaos level to `to_chaos_level`.  If `quiet`
+    is `True`, only errors will be printed.
+    """
+    normalize_items(items, chaos=to_chaos_level, quiet=quiet)
 
 def clear_rerolls(items, quiet=False):
     """
     Given a list of `items`, clear their enchantment reroll count.  If `quiet`
     is `True`, only errors will be printed.
     """
-    num_items = len(items)
-    if not quiet:
-        if num_items == 1:
-            plural = ''
-        else:
-            plural = 's'
-        print(' - Clearing reroll count for {} item{}'.format(
-            num_items,
-            plural,
-            ))
-    actually_updated = 0
-    for item in items:
-        if item.rerolled:
-            item.rerolled = 0
-            actually_updated += 1
-    if not quiet:
-        remaining = num_items - actually_updated
-        if actually_updated == 1:
-            updated_verb = 'was'
-        else:
-            updated_verb = 'were'
-        if remaining > 0:
-            if remaining == 1:
-                remaining_verb = 'was'
-            else:
-                remaining_verb = 'were'
-            remaining_txt = ' ({} {} already at zero rerolls)'.format(remaining, remaining_verb)
-        else:
-            remaining_txt = ''
-        print('   - {} {} updated{}'.format(
-            actually_updated,
-            updated_verb,
-            remaining_txt,
-            ))
+    normalize_items(items, rerolls=0, quiet=quiet)
 
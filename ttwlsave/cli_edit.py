@@ -26,7 +26,7 @@ import sys
 import ttwlsave
 import argparse
 from . import cli_common
-from . import plot_missions
+from .lookups import plot_missions
 from ttwlsave import InvSlot, SDU, ChaosLevel, HeroStats, Backstory
 from ttwlsave.ttwlsave import TTWLSave
 from ttwlsave.ttwlprofile import TTWLProfile
@@ -226,6 +226,17 @@ def main():
             help='Import items from file',
             )
 
+    parser.add_argument('--import-jobs',
+            type=int,
+            default=1,
+            help='Number of processes to use when decoding imported items',
+            )
+
+    parser.add_argument('--skip-duplicates',
+            action='store_true',
+            help='When importing items, skip any which are already in the inventory',
+            )
+
     parser.add_argument('--delete-mission',
             type=str,
             metavar='MISSIONPATH',
@@ -260,6 +271,8 @@ def main():
 
     # Parse args
     args = parser.parse_args()
+    if args.import_jobs < 1:
+        raise argparse.ArgumentTypeError('Number of import jobs must be at least 1')
     if args.level is not None:
         if args.level < 1 or args.level > ttwlsave.max_supported_level:
             raise argparse.ArgumentTypeError('Valid level range is 1 through {} (currently known in-game max of {})'.format(
@@ -570,34 +583,27 @@ def main():
                     save.add_item,
                     file_csv=args.csv,
                     quiet=args.quiet,
+                    jobs=args.import_jobs,
+                    is_duplicate_func=save.has_item if args.skip_duplicates else None,
                     )
 
-        # Setting item levels.  Keep in mind that we'll want to do this *after*
+        # Setting item levels, Chaos Levels (Chaotic, Volatile, etc...), and
+        # clearing reroll counts.  Keep in mind that we'll want to do this *after*
         # various of the actions above.  If we've been asked to up the level of
         # the character, we'll want items to follow suit, and if we've been asked
         # to change the level of items, we'll want to do it after the item import.
         # (cli_common provides the console output)
-        if args.items_to_char or args.item_levels:
+        if args.items_to_char or args.item_levels or args.items_chaos_level is not None or args.clear_rerolls:
             if args.items_to_char:
                 to_level = save.get_level()
-            else:
+            elif args.item_levels:
                 to_level = args.item_levels
-            cli_common.update_item_levels(save.get_items(),
-                    to_level,
-                    quiet=args.quiet,
-                    )
-
-        # Setting item Chaos Levels (Chaotic, Volatile, etc...)
-        # (cli_common provides the console output)
-        if args.items_chaos_level is not None:
-            cli_common.update_chaos_level(save.get_items(),
-                    args.items_chaos_level,
-                    quiet=args.quiet,
-                    )
-
-        # Clearing reroll counts (cli_common provides the console output)
-        if args.clear_rerolls:
-            cli_common.clear_rerolls(save.get_items(),
+            else:
+                to_level = None
+            cli_common.normalize_items(save.get_items(),
+                    level=to_level,
+                    chaos=args.items_chaos_level,
+                    rerolls=0 if args.clear_rerolls else None,
                     quiet=args.quiet,
                     )
 
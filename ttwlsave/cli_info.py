@@ -24,6 +24,7 @@
 import ttwlsave
 import argparse
 import itertools
+from ttwlsave import datalib
 from ttwlsave import InvSlot
 from ttwlsave.ttwlsave import TTWLSave
 
@@ -75,12 +76,21 @@ def main():
             help='Show currently-selected customizations (as raw object paths)',
             )
 
+    parser.add_argument('--serial-cache',
+            action='store_true',
+            help='Cache parsed item serials on disk, to speed up future runs over the same items',
+            )
+
     parser.add_argument('filename',
             help='Filename to process',
             )
 
     args = parser.parse_args()
 
+    # Turn on the serial cache, if we've been told to
+    if args.serial_cache:
+        datalib.DataWrapper.shared().enable_serial_cache()
+
     # Load the save
     save = TTWLSave(args.filename)
 
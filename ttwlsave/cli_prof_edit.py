@@ -140,6 +140,17 @@ def main():
             help='Import items from file',
             )
 
+    parser.add_argument('--import-jobs',
+            type=int,
+            default=1,
+            help='Number of processes to use when decoding imported items',
+            )
+
+    parser.add_argument('--skip-duplicates',
+            action='store_true',
+            help='When importing items, skip any which are already in the bank',
+            )
+
     parser.add_argument('--clear-customizations',
             action='store_true',
             help='Remove all unlocked customizations',
@@ -179,6 +190,8 @@ def main():
 
     # Parse args
     args = parser.parse_args()
+    if args.import_jobs < 1:
+        raise argparse.ArgumentTypeError('Number of import jobs must be at least 1')
 
     # Expand any of our "all" unlock actions
     if 'all' in args.unlock:
@@ -400,29 +413,20 @@ def main():
                     profile.add_bank_item,
                     file_csv=args.csv,
                     quiet=args.quiet,
+                    jobs=args.import_jobs,
+                    is_duplicate_func=profile.has_bank_item if args.skip_duplicates else None,
                     )
 
-        # Setting item levels.  Keep in mind that we'll want to do this *after*
+        # Setting item levels, Chaos Levels (Chaotic, Volatile, etc...), and
+        # clearing reroll counts.  Keep in mind that we'll want to do this *after*
         # various of the actions above.  If we've been asked to change the level
         # of items, we'll want to do it after the item import.
         # (cli_common provides the console output)
-        if args.item_levels:
-            cli_common.update_item_levels(profile.get_bank_items(),
-                    args.item_levels,
-                    quiet=args.quiet,
-                    )
-
-        # Setting item Chaos Levels (Chaotic, Volatile, etc...)
-        # (cli_common provides the console output)
-        if args.items_chaos_level is not None:
-            cli_common.update_chaos_level(profile.get_bank_items(),
-                    args.items_chaos_level,
-                    quiet=args.quiet,
-                    )
-
-        # Clearing reroll counts (cli_common provides the console output)
-        if args.clear_rerolls:
-            cli_common.clear_rerolls(profile.get_bank_items(),
+        if args.item_levels or args.items_chaos_level is not None or args.clear_rerolls:
+            cli_common.normalize_items(profile.get_bank_items(),
+                    level=args.item_levels if args.item_levels else None,
+                    chaos=args.items_chaos_level,
+                    rerolls=0 if args.clear_rerolls else None,
                     quiet=args.quiet,
                     )
 
@@ -23,10 +23,16 @@
 
 import io
 import json
+import array
+import atexit
+import collections
 import gzip
+import mmap
 import struct
 import base64
 import random
+import functools
+import threading
 import binascii
 import pkg_resources
 
@@ -102,6 +108,101 @@ class ArbitraryBits(object):
             byte_data.append(int(temp_data[i*8:(i*8)+8], 2))
         return bytearray(byte_data)
 
+class BitStream(object):
+    """
+    Integer-backed replacement for `ArbitraryBits`, which is what `WLSerial`
+    actually uses to parse and build serial numbers.  The semantics are
+    identical (including the reversed-byte packing), but rather than storing
+    a string of `0` and `1` characters, we keep the whole payload in a single
+    Python int, along with the number of bits it's meant to hold.
+
+    Thanks to the reversed-byte packing, the "front" of the data ends up
+    being the least-significant bits of a little-endian interpretation of
+    the data, so eating values off the front is just a mask and a shift,
+    and appending to the end is a shift and an or.  `ArbitraryBits` is still
+    kept around for comparison purposes (see `benchmarks/bench_bits.py`).
+    """
+
+    def __init__(self, data=b''):
+        self.value = int.from_bytes(data, 'little')
+        self.length = len(data)*8
+
+    def __len__(self):
+        """
+        Returns the number of bits remaining in the stream
+        """
+        return self.length
+
+    def copy(self):
+        """
+        Returns a new BitStream object with the same data as ours
+        """
+        new_bits = BitStream()
+        new_bits.value = self.value
+        new_bits.length = self.length
+        return new_bits
+
+    def eat(self, bits):
+        """
+        Eats the specified number of `bits` off the front of the
+        data and returns the value.  This is destructive; the data
+        eaten off the front will no longer be in the data.
+        """
+        if bits > self.length:
+            raise Exception('Attempted to read {} bits, but only {} remain'.format(bits, self.length))
+        val = self.value & ((1 << bits) - 1)
+        self.value >>= bits
+        self.length -= bits
+        return val
+
+    def append_value(self, value, bits):
+        """
+        Feeds the given `value` to the end of the data, using the given
+        number of `bits` to do so.  We're assuming that `value` is
+        an unsigned number.
+        """
+        self.value |= (value & ((1 << bits) - 1)) << self.length
+        self.length += bits
+
+    def append_data(self, new_data):
+        """
+        Appends the given `new_data` (from another BitStream object)
+        to the end of our data.
+        """
+        self.value |= new_data.value << self.length
+        self.length += new_data.length
+
+    def get_data(self):
+        """
+        Returns our current data in binary format.  Will pad the end with
+        `0` bits if we're not a multiple of 8.
+        """
+        return bytearray(self.value.to_bytes((self.length+7)//8, 'little'))
+
+# The values we pull out of a serial number in `WLSerial._parse_serial`.  The
+# part lists are stored as tuples of part indexes, rather than names, so that
+# these records stay immutable and can be shared (and cached) freely.
+ParsedSerial = collections.namedtuple('ParsedSerial', [
+    'version',
+    'balance_bits',
+    'balance_idx',
+    'invdata_bits',
+    'invdata_idx',
+    'manufacturer_bits',
+    'manufacturer_idx',
+    'level',
+    'can_parse_parts',
+    'parts_parsed',
+    'part_bits',
+    'parts',
+    'generic_bits',
+    'generic_parts',
+    'additional_data',
+    'num_customs',
+    'rerolled',
+    'chaos_level',
+    ])
+
 class WLSerial(object):
     """
     Class to handle serializing and deserializing WL item/weapon serial
@@ -128,6 +229,7 @@ class WLSerial(object):
         self.serial_db = datawrapper.serial_db
         self.name_db = datawrapper.name_db
         self.invkey_db = datawrapper.invkey_db
+        self._fingerprint_index = None
         self.set_serial(serial)
 
     def _update_superclass_serial(self):
@@ -143,8 +245,22 @@ class WLSerial(object):
         Sets our serial number
         """
 
+        old_fingerprint = self._current_fingerprint()
         self.serial = serial
-        (self.decrypted_serial, self.orig_seed, self.serial_version) = WLSerial._decrypt_serial(serial)
+
+        # See if we've already seen this serial elsewhere; if so we can skip
+        # de-obfuscating it, and possibly parsing it as well.
+        self._shared_record = None
+        entry = self.datawrapper.record_cache.get(serial)
+        if entry is None:
+            (decrypted, self.orig_seed, self.serial_version) = WLSerial._decrypt_serial(serial)
+            self.decrypted_serial = bytes(decrypted)
+            self.datawrapper.record_cache.put(serial,
+                    (self.decrypted_serial, self.orig_seed, self.serial_version, None))
+        else:
+            (self.decrypted_serial, self.orig_seed, self.serial_version, self._shared_record) = entry
+        self._fingerprint_changed(old_fingerprint)
+
         self.parsed = False
         self.parts_parsed = False
         self.can_parse = True
@@ -181,6 +297,27 @@ class WLSerial(object):
         # Call out to any superclass procedures here
         self._update_superclass_serial()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _xor_keystream(seed, length):
+        """
+        Returns the `length`-byte XOR keystream generated by the given
+        `seed`.  The keystream is the only bit of the obfuscation which
+        requires a per-byte Python loop, so we cache them; serials share a
+        relatively small number of seeds in practice (including `0` for
+        anything we've edited), and all serials are about the same length.
+        """
+
+        # Because our seed can be negative, we do have to do the
+        # & here, even though it might not seem to make sense to
+        # do so.
+        xor = (seed >> 5) & 0xFFFFFFFF
+        temp = bytearray(length)
+        for i in range(length):
+            xor = (xor * 0x10A860C1) % 0xFFFFFFFB
+            temp[i] = xor & 0xFF
+        return bytes(temp)
+
     @staticmethod
     def _xor_data(data, seed):
         """
@@ -191,17 +328,13 @@ class WLSerial(object):
         # If the seed is 0, we basically don't do anything (though
         # make sure we return the same datatype as below)
         if seed == 0:
-            return [d for d in data]
+            return bytes(data)
 
-        # Because our seed can be negative, we do have to do the
-        # & here, even though it might not seem to make sense to
-        # do so.
-        xor = (seed >> 5) & 0xFFFFFFFF
-        temp = []
-        for i, d in enumerate(data):
-            xor = (xor * 0x10A860C1) % 0xFFFFFFFB
-            temp.append((d ^ xor) & 0xFF)
-        return temp
+        # Apply the keystream to the whole buffer at once, by way of a
+        # couple of big ints.
+        length = len(data)
+        keystream = WLSerial._xor_keystream(seed, length)
+        return (int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')).to_bytes(length, 'big')
 
     @staticmethod
     def _bogodecrypt(data, seed):
@@ -290,56 +423,45 @@ class WLSerial(object):
         # Return the freshly-encrypted item
         return header + WLSerial._bogoencrypt(checksum + data, seed)
 
-    def _get_inv_db_header_part(self, category, bits):
-        """
-        Given the category name `category`, and the ArbitraryBits object `bits`,
-        containing serial number data, return a tuple containing:
-            1) The category value
-            2) The number of bits the category takes up
-            3) The numerical index of the value
-        This relies on being run during `_parse_serial`, so that `_version` is
-        populated in our object.
-        """
-        num_bits = self.serial_db.get_num_bits(category, self._version)
-        part_idx = bits.eat(num_bits)
-        part_val = self.serial_db.get_part(category, part_idx)
-        if not part_val:
-            part_val = 'unknown'
-        return (part_val, num_bits, part_idx)
-
-    def _get_inv_db_header_part_repeated(self, category, bits, count_bits):
+    def _read_parts(self, category, bits, count_bits):
         """
-        Given the category name `category` and the ArbitraryBits object `bits`,
+        Given the category name `category` and the BitStream object `bits`,
         containing serial number data, and `count_bits`, which specifies the
         number of bits which make up the count of parts to read, returns a
         tuple containing:
             1) The number of bits each part in the category takes up
-            2) A list containing tuples with the following:
-                1) The part name
-                2) The numerical index of the part
+            2) A tuple containing the numerical indexes of the parts
         """
         num_bits = self.serial_db.get_num_bits(category, self._version)
-        parts = []
         num_parts = bits.eat(count_bits)
-        # print(f"_get_inv_db_header_part_repeated {category} {bits} num_bits:{num_bits} count_bits:{count_bits} num_parts:{num_parts}, bits:{len(bits.data)} expected:{num_parts*num_bits}")
-        for _ in range(num_parts):
-            part_idx = bits.eat(num_bits)
+        return (num_bits, tuple([bits.eat(num_bits) for _ in range(num_parts)]))
+
+    def _get_part_names(self, category, part_indexes):
+        """
+        Given the category name `category` and a list of numerical
+        `part_indexes`, return a list of tuples containing:
+            1) The part name
+            2) The numerical index of the part
+        """
+        parts = []
+        for part_idx in part_indexes:
             part_val = self.serial_db.get_part(category, part_idx)
             if not part_val:
                 part_val = 'unknown'
             parts.append((part_val, part_idx))
-        return (num_bits, parts)
+        return parts
 
-    def _parse_serial(self):
+    def _decode_serial_data(self):
         """
-        Parse our serial number, at least up to the level.  We're not going
-        to care about actual parts in here.
+        Does the actual work of parsing our decrypted serial data, returning a
+        `ParsedSerial` record with everything we found, or `None` if the serial
+        is a newer version than we know about.  This doesn't touch any of our
+        attributes (apart from `_version`, which is needed for looking up bit
+        lengths), so the result can be cached and applied with
+        `_load_parsed_serial`.
         """
 
-        if not self.can_parse:
-            return
-
-        bits = ArbitraryBits(self.decrypted_serial)
+        bits = BitStream(self.decrypted_serial)
 
         # First value should always be 128, apparently
         assert(bits.eat(8) == 128)
@@ -347,106 +469,205 @@ class WLSerial(object):
         # Grab the serial version and check it against the max version we know about
         self._version = bits.eat(7)
         if self._version > self.serial_db.max_version:
-            self.can_parse = False
-            self.can_parse_parts = False
-            return
+            return None
 
         # Now the rest of the data we care about.
-        (self._balance,
-                self._balance_bits,
-                self._balance_idx) = self._get_inv_db_header_part('InventoryBalanceData', bits)
-        (self._invdata,
-                self._invdata_bits,
-                self._invdata_idx) = self._get_inv_db_header_part('InventoryData', bits)
-        (self._manufacturer,
-                self._manufacturer_bits,
-                self._manufacturer_idx) = self._get_inv_db_header_part('ManufacturerData', bits)
-        self._level = bits.eat(7)
-
-        # Parse out a "short" balance name, for convenience's sake
-        self._balance_short = self._balance.split('.')[-1]
-
-        # If we know of an English name for this balance, use it
-        self._eng_name = self.name_db.get(self._balance)
-
-        # Mark down that we've parsed the basic info (we have enough to level up
-        # gear at this point)
-        self.parsed = True
-
-        # Make a note of our remaining data - if we re-save without any parts
-        # changes, we can just use this rather than reconstructing the whole
-        # serial.
-        self._remaining_data = bits.data
+        get_num_bits = self.serial_db.get_num_bits
+        balance_bits = get_num_bits('InventoryBalanceData', self._version)
+        balance_idx = bits.eat(balance_bits)
+        invdata_bits = get_num_bits('InventoryData', self._version)
+        invdata_idx = bits.eat(invdata_bits)
+        manufacturer_bits = get_num_bits('ManufacturerData', self._version)
+        manufacturer_idx = bits.eat(manufacturer_bits)
+        level = bits.eat(7)
+
+        # Everything after this will only get filled in if we can parse parts
+        can_parse_parts = True
+        parts_parsed = False
+        part_bits = None
+        parts = None
+        generic_bits = None
+        generic_parts = None
+        additional_data = None
+        num_customs = None
+        rerolled = None
+        chaos_level = None
 
         # Now let's see if we can parse parts
-        self._part_invkey = self.invkey_db.get(self._balance)
-        if self._part_invkey is None:
-            self.can_parse_parts = False
+        balance = self.serial_db.get_part('InventoryBalanceData', balance_idx)
+        if not balance:
+            balance = 'unknown'
+        part_invkey = self.invkey_db.get(balance)
+        if part_invkey is None:
+            can_parse_parts = False
         else:
 
             # Let's assume at first that we're going to correctly parse all this
-            self.parts_parsed = True
+            parts_parsed = True
 
             # Read parts
-            (self._part_bits, self._parts) = self._get_inv_db_header_part_repeated(
-                    self._part_invkey, bits, 6)
-            # print((self._part_bits, self._parts))
-            # print(len(bits.data))
+            (part_bits, parts) = self._read_parts(part_invkey, bits, 6)
+
             # Read generics (enchantments)
-            (self._generic_bits, self._generic_parts) = self._get_inv_db_header_part_repeated(
-                    'InventoryGenericPartData', bits, 4)
+            (generic_bits, generic_parts) = self._read_parts('InventoryGenericPartData', bits, 4)
 
             # Read additional data (no idea for the most part; some item "wear"
             # is in here, we think.  Maybe other stuff, too?)
             additional_count = bits.eat(8)
-            self._additional_data = []
-            for _ in range(additional_count):
-                self._additional_data.append(bits.eat(8))
+            additional_data = tuple([bits.eat(8) for _ in range(additional_count)])
 
             # Read in "customization" parts; this presumably used to be
             # trinkets+weaponskins, but was removed at some point.  If we
             # have anything but 0 in here, we're going to force `can_parse_parts`
             # to false, 'cause we don't know how many bits these things
             # might take if they're present.
-            self._num_customs = bits.eat(4)
-            if self._num_customs != 0:
-                self.parts_parsed = False
-                self.can_parse_parts = False
+            num_customs = bits.eat(4)
+            if num_customs != 0:
+                parts_parsed = False
+                can_parse_parts = False
 
             # Read in the number of times we've been re-rolled
-            if (len(bits.data) >= 8):
-                self._rerolled = bits.eat(8)
+            if (len(bits) >= 8):
+                rerolled = bits.eat(8)
 
             # Enhancement / Chaos Level (? - not sure what to call this)
-            self._chaos_level = bits.eat(7)
+            chaos_level = bits.eat(7)
 
             # And read in our remaining data.  If there's more than 7 bits
             # left, we've done something wrong, because it should only be
             # zero-padding after all the "real" data is in place.
-            if len(bits.data) > 7:
-                self.parts_parsed = False
-                self.can_parse_parts = False
-                pass
-            elif '1' in bits.data:
+            if len(bits) > 7:
+                parts_parsed = False
+                can_parse_parts = False
+            elif bits.value != 0:
                 # This is supposed to only be zero-padding at the moment, if
                 # we see something else, abort
-                self.parts_parsed = False
-                self.can_parse_parts = False
+                parts_parsed = False
+                can_parse_parts = False
             else:
                 # Okay, we're good!  Don't bother saving the remaining 0 bits.
                 pass
 
+        return ParsedSerial(
+                self._version,
+                balance_bits, balance_idx,
+                invdata_bits, invdata_idx,
+                manufacturer_bits, manufacturer_idx,
+                level,
+                can_parse_parts, parts_parsed,
+                part_bits, parts,
+                generic_bits, generic_parts,
+                additional_data,
+                num_customs,
+                rerolled,
+                chaos_level,
+                )
+
+    def _load_parsed_serial(self, record):
+        """
+        Populates all our parsed attributes from the given `ParsedSerial`
+        `record`.  The record itself is never modified (and may be shared
+        with other objects); anything we change later on just replaces our
+        own attributes.
+        """
+        self._version = record.version
+        self._balance_bits = record.balance_bits
+        self._balance_idx = record.balance_idx
+        self._balance = self.serial_db.get_part('InventoryBalanceData', record.balance_idx)
+        if not self._balance:
+            self._balance = 'unknown'
+        self._invdata_bits = record.invdata_bits
+        self._invdata_idx = record.invdata_idx
+        self._invdata = self.serial_db.get_part('InventoryData', record.invdata_idx)
+        if not self._invdata:
+            self._invdata = 'unknown'
+        self._manufacturer_bits = record.manufacturer_bits
+        self._manufacturer_idx = record.manufacturer_idx
+        self._manufacturer = self.serial_db.get_part('ManufacturerData', record.manufacturer_idx)
+        if not self._manufacturer:
+            self._manufacturer = 'unknown'
+        self._level = record.level
+
+        # Parse out a "short" balance name, for convenience's sake
+        self._balance_short = self._balance.split('.')[-1]
+
+        # If we know of an English name for this balance, use it
+        self._eng_name = self.name_db.get(self._balance)
+
+        # Mark down that we've parsed the basic info (we have enough to level up
+        # gear at this point)
+        self.parsed = True
+
+        # Make a note of our remaining data - if we re-save without any parts
+        # changes, we can just use this rather than reconstructing the whole
+        # serial.
+        self._remaining_data = BitStream(self.decrypted_serial)
+        self._remaining_data.eat(8 + 7
+                + record.balance_bits
+                + record.invdata_bits
+                + record.manufacturer_bits
+                + 7)
+
+        # Now the parts info
+        self._part_invkey = self.invkey_db.get(self._balance)
+        self.can_parse_parts = record.can_parse_parts
+        self.parts_parsed = record.parts_parsed
+        self._part_bits = record.part_bits
+        if record.parts is not None:
+            self._parts = self._get_part_names(self._part_invkey, record.parts)
+        self._generic_bits = record.generic_bits
+        if record.generic_parts is not None:
+            self._generic_parts = self._get_part_names('InventoryGenericPartData', record.generic_parts)
+        if record.additional_data is not None:
+            self._additional_data = list(record.additional_data)
+        self._num_customs = record.num_customs
+        self._rerolled = record.rerolled
+        self._chaos_level = record.chaos_level
+
+    def _parse_serial(self):
+        """
+        Parse our serial number, at least up to the level.  We're not going
+        to care about actual parts in here.  If the datawrapper has a serial
+        cache enabled, we'll check that first (and populate it afterwards).
+        """
+
+        if not self.can_parse:
+            return
+
+        record = self._shared_record
+        if record is None:
+            cache = self.datawrapper.serial_cache
+            if cache is not None:
+                record = cache.get(self.decrypted_serial)
+            if record is None:
+                record = self._decode_serial_data()
+                if record is None:
+                    self.can_parse = False
+                    self.can_parse_parts = False
+                    return
+                if cache is not None:
+                    cache.put(self.decrypted_serial, record)
+            self._shared_record = record
+            self.datawrapper.record_cache.put(self.serial,
+                    (self.decrypted_serial, self.orig_seed, self.serial_version, record))
+
+        self._load_parsed_serial(record)
+
     def _deparse_serial(self):
         """
         De-parses a serial; used after we make changes to the data that gets
-        pulled out during `_parse_serial`.  At the moment, that's both level
-        changes and chaos level changes.  Will end up calling out to the
-        superclass's `_update_superclass_serial` to propagate the serial change
-        to whatever containing structure needs it, and set the object to trigger a
-        re-parse if anything else needs to read more.  That's probably overkill
-        and makes this technically quite inefficient, especially when making
-        multiple edits to the same item, but given the scale of processing,
-        we'll probably be fine.
+        pulled out during `_parse_serial`.  At the moment, that's level, chaos
+        level, reroll, and enchantment changes.  This doesn't propagate the
+        new serial anywhere -- callers need to call `_update_superclass_serial`
+        themselves afterwards, once they're done making changes.
+
+        We already know everything that's in the new serial, so rather than
+        going through `set_serial` (which would de-obfuscate and re-parse the
+        data we just built), we re-encode it in-place with a seed of `0`,
+        update `decrypted_serial` to match, and all our parsed attributes
+        remain valid.  A new `ParsedSerial` for the result gets stored as our
+        `_shared_record` and put into the datawrapper's `record_cache`, so
+        anything else which comes across the new serial can skip parsing it.
         """
 
         if not self.can_parse:
@@ -467,7 +688,7 @@ class WLSerial(object):
             self._generic_bits = self.serial_db.get_num_bits('InventoryGenericPartData', self._version)
 
         # Construct a new header
-        bits = ArbitraryBits()
+        bits = BitStream()
         bits.append_value(128, 8)
         bits.append_value(self._version, 7)
         bits.append_value(self._balance_idx, self._balance_bits)
@@ -480,44 +701,95 @@ class WLSerial(object):
 
         if self.changed_parts:
             # If we've changed parts, just write out everything again.  First parts
-            bits.append_value(len(self._parts), 6)
+            remaining = BitStream()
+            remaining.append_value(len(self._parts), 6)
             for (part_val, part_idx) in self._parts:
-                bits.append_value(part_idx, self._part_bits)
+                remaining.append_value(part_idx, self._part_bits)
 
             # Then generics
-            bits.append_value(len(self._generic_parts), 4)
+            remaining.append_value(len(self._generic_parts), 4)
             for (part_val, part_idx) in self._generic_parts:
-                bits.append_value(part_idx, self._generic_bits)
+                remaining.append_value(part_idx, self._generic_bits)
 
             # Then additional data
-            bits.append_value(len(self._additional_data), 8)
+            remaining.append_value(len(self._additional_data), 8)
             for value in self._additional_data:
-                bits.append_value(value, 8)
+                remaining.append_value(value, 8)
 
             # Then our number of customs (should always be zero)
-            bits.append_value(self._num_customs, 4)
+            remaining.append_value(self._num_customs, 4)
 
             # Then the number of times we've been rerolled
-            bits.append_value(self._rerolled, 8)
+            remaining.append_value(self._rerolled, 8)
 
             # Then the chaos evel
-            bits.append_value(self._chaos_level, 7)
+            remaining.append_value(self._chaos_level, 7)
 
-        else:
-            # Otherwise, we can re-use our original remaining data
-            bits.append_data(self._remaining_data)
+            # The padding out to a full byte would've been read back in as
+            # part of the remaining data, so include that too.
+            remaining.append_value(0, (-(len(bits) + len(remaining))) % 8)
+            self._remaining_data = remaining
+            self.changed_parts = False
+
+        # Add on the rest of the data
+        bits.append_data(self._remaining_data)
 
         # Read the serial back out of our structure
-        new_data = bits.get_data()
+        new_data = bytes(bits.get_data())
+
+        # Encode the new serial (using seed 0; unencrypted), and update our
+        # own data to match.  A seed of 0 leaves the data as-is, so we can just
+        # keep using what we've got.
+        old_fingerprint = self._current_fingerprint()
+        self.serial = WLSerial._encrypt_serial(new_data, self.serial_version, 0)
+        self.decrypted_serial = new_data
+        self.orig_seed = 0
+        self._fingerprint_changed(old_fingerprint)
+
+        # Let anything else which comes across this serial make use of what
+        # we already know about it.
+        self._shared_record = ParsedSerial(
+                self._version,
+                self._balance_bits, self._balance_idx,
+                self._invdata_bits, self._invdata_idx,
+                self._manufacturer_bits, self._manufacturer_idx,
+                self._level,
+                self.can_parse_parts, self.parts_parsed,
+                self._part_bits, None if self._parts is None else tuple([idx for (_, idx) in self._parts]),
+                self._generic_bits, None if self._generic_parts is None else tuple([idx for (_, idx) in self._generic_parts]),
+                None if self._additional_data is None else tuple(self._additional_data),
+                self._num_customs,
+                self._rerolled,
+                self._chaos_level,
+                )
+        self.datawrapper.record_cache.put(self.serial,
+                (self.decrypted_serial, self.orig_seed, self.serial_version, self._shared_record))
+
+    @property
+    def fingerprint(self):
+        """
+        Returns a fingerprint for this serial: the de-obfuscated payload along
+        with the serial version.  The seed isn't part of it, so the same item
+        obfuscated with two different seeds will have the same fingerprint.
+        """
+        return bytes([self.serial_version]) + self.decrypted_serial
 
-        # Encode the new serial (using seed 0; unencrypted)
-        new_serial = WLSerial._encrypt_serial(new_data, self.serial_version, 0)
+    def _current_fingerprint(self):
+        """
+        Returns our fingerprint if we've got one yet (and something's
+        interested in it), otherwise `None`
+        """
+        if self._fingerprint_index is None or not hasattr(self, 'decrypted_serial'):
+            return None
+        return self.fingerprint
 
-        # Load in the new serial (this will set `parsed` to `False`)
-        # It bothers me that I've just done an `_encrypt_serial` in the
-        # previous statement, when this call to `set_serial` will just
-        # turn right around and decrypt it again.  Alas.
-        self.set_serial(new_serial)
+    def _fingerprint_changed(self, old_fingerprint):
+        """
+        Lets the FingerprintIndex we belong to (if any) know that our
+        fingerprint may have changed from `old_fingerprint`.
+        """
+        if self._fingerprint_index is not None and old_fingerprint is not None:
+            self._fingerprint_index.update(old_fingerprint, self.fingerprint)
 
     @property
     def balance(self):
@@ -666,6 +938,16 @@ class WLSerial(object):
         else:
             raise Exception('Unknown item format: {}'.format(new_data))
 
+    @staticmethod
+    def decode_many(serials, datawrapper):
+        """
+        Decodes the header info for an iterable of `serials` (which may be
+        either binary serials or `WL()`-encoded strings) all in one go,
+        without constructing a WLSerial object for each.  Returns a
+        `SerialBatch` object.
+        """
+        return SerialBatch(serials, datawrapper)
+
     def can_have_enchantment(self):
         """
         Returns `True` if this is an item type which can have an enchantment,
@@ -676,7 +958,8 @@ class WLSerial(object):
             self._parse_serial()
             if not self.can_parse or not self.can_parse_parts:
                 return False
-        return self._invdata.lower() in enchantment_invdata_lower_types
+        from . import customizations
+        return self._invdata.lower() in customizations.enchantment_invdata_lower_types
 
     def can_have_chaos_level(self):
         """
@@ -779,6 +1062,65 @@ class WLSerial(object):
         # return!
         return True
         
+    def apply(self, level=None, chaos_level=None, rerolled=None, enchantment=None):
+        """
+        Applies a number of changes to the item all at once, so that the serial
+        only gets re-encoded (and written back to whatever's holding it) a
+        single time, rather than once per change.  Any argument left as `None`
+        will be left alone, as will any value which is already what's been
+        asked for.  Chaos levels and enchantments will only be set on items
+        which can have them, as with the `chaos_level` and `set_enchantment`
+        equivalents, and reroll counts will only be set on items whose parts
+        we can parse.  Returns a set containing the names of the arguments
+        whose values actually got changed.
+        """
+        # Check for enchantment part validity first thing, before we do anything
+        # else (same as `set_enchantment`).
+        if enchantment is not None:
+            new_enchantment_part = self.serial_db.get_part_index(
+                    'InventoryGenericPartData',
+                    enchantment,
+                    )
+            if not new_enchantment_part:
+                raise Exception('ERROR: {} is not a known enchantment'.format(enchantment))
+
+        if not self.parsed:
+            self._parse_serial()
+            if not self.can_parse:
+                return set()
+
+        # Figure out what this item can have before we touch anything.  If
+        # we can't parse the item's parts, these checks will re-parse the
+        # serial, which would wipe out any changes we'd already made.
+        can_chaos = chaos_level is not None and self.can_have_chaos_level()
+        can_enchant = enchantment is not None and self.can_have_enchantment()
+        can_reroll = rerolled is not None and self.can_parse_parts
+
+        changed = set()
+        if level is not None and self._level != level:
+            self._level = level
+            changed.add('level')
+        if can_chaos and self._chaos_level != chaos_level:
+            self._chaos_level = chaos_level
+            self.changed_parts = True
+            changed.add('chaos_level')
+        if can_reroll and self._rerolled != rerolled:
+            self._rerolled = rerolled
+            self.changed_parts = True
+            changed.add('rerolled')
+        if can_enchant:
+            new_parts = [(enchantment, new_enchantment_part)]
+            if self._generic_parts != new_parts:
+                self._generic_parts = new_parts
+                self.changed_parts = True
+                changed.add('enchantment')
+
+        # Re-serialize, if we need to
+        if changed:
+            self._deparse_serial()
+            self._update_superclass_serial()
+        return changed
+
     def get_level_eng(self):
         """
         Returns an English representation of our level, including Chaos level,
@@ -799,6 +1141,121 @@ class WLSerial(object):
         else:
             return to_ret
 
+class SerialBatch(object):
+    """
+    Columnar decode of a whole pile of serial numbers at once, for things
+    like dedupe passes or bank audits over large item libraries, where
+    building a WLSerial object per item would be wasteful.  Each serial
+    gets de-obfuscated, CRC-checked, and parsed far enough to get at its
+    header values plus the chaos level and reroll count (which live after
+    the parts, so the parts get skipped over rather than looked up).
+
+    Results are stored in parallel `array.array` columns, one entry per
+    input serial:
+
+        `valid` - 1 if the serial decoded properly, 0 otherwise
+        `balance_idx`, `invdata_idx`, `manufacturer_idx` - serial DB indexes
+        `level`, `chaos_level`, `rerolled` - the values themselves
+
+    Any value which couldn't be determined (invalid serials, or items whose
+    parts we can't parse) is stored as -1.  Error messages for invalid
+    serials are available in the `errors` dict, keyed by index.
+    """
+
+    columns = [
+            'balance_idx',
+            'invdata_idx',
+            'manufacturer_idx',
+            'level',
+            'chaos_level',
+            'rerolled',
+            ]
+
+    def __init__(self, serials, datawrapper):
+        self.serial_db = datawrapper.serial_db
+        self.invkey_db = datawrapper.invkey_db
+        self.bits_tables = {}
+        self.valid = array.array('b')
+        for column in SerialBatch.columns:
+            setattr(self, column, array.array('i'))
+        self.errors = {}
+        for idx, serial in enumerate(serials):
+            try:
+                row = self._decode(serial)
+                self.valid.append(1)
+            except Exception as e:
+                row = (-1,)*len(SerialBatch.columns)
+                self.valid.append(0)
+                self.errors[idx] = str(e)
+            for column, value in zip(SerialBatch.columns, row):
+                getattr(self, column).append(value)
+
+    def _decode(self, serial):
+        """
+        Decodes a single `serial`, returning a tuple with values for each of
+        our columns.  Raises an Exception if the serial can't be decoded.
+        """
+        if isinstance(serial, str):
+            serial = WLSerial.decode_serial_base64(serial)
+        (decrypted, _, _) = WLSerial._decrypt_serial(serial)
+        bits = BitStream(decrypted)
+        if bits.eat(8) != 128:
+            raise Exception('Invalid serial header')
+        version = bits.eat(7)
+        if version > self.serial_db.max_version:
+            raise Exception('Unknown serial version: {}'.format(version))
+        if version not in self.bits_tables:
+            self.bits_tables[version] = self.serial_db.bits_table(version)
+        num_bits = self.bits_tables[version]
+        balance_idx = bits.eat(num_bits['InventoryBalanceData'])
+        invdata_idx = bits.eat(num_bits['InventoryData'])
+        manufacturer_idx = bits.eat(num_bits['ManufacturerData'])
+        level = bits.eat(7)
+
+        # Now skip over parts, if we can, to get to chaos level + rerolls
+        chaos_level = -1
+        rerolled = -1
+        balance = self.serial_db.get_part('InventoryBalanceData', balance_idx)
+        part_invkey = None
+        if balance:
+            part_invkey = self.invkey_db.get(balance)
+        if part_invkey is not None:
+            bits.eat(bits.eat(6)*num_bits[part_invkey])
+            bits.eat(bits.eat(4)*num_bits['InventoryGenericPartData'])
+            bits.eat(bits.eat(8)*8)
+            num_customs = bits.eat(4)
+            if len(bits) >= 8:
+                rerolled = bits.eat(8)
+            chaos_level = bits.eat(7)
+            # Same sanity checks as `_parse_serial`; if these fail, the chaos
+            # level can't be trusted.
+            if num_customs != 0 or len(bits) > 7 or bits.value != 0:
+                chaos_level = -1
+
+        return (balance_idx, invdata_idx, manufacturer_idx, level, chaos_level, rerolled)
+
+    def __len__(self):
+        return len(self.valid)
+
+    def row(self, idx):
+        """
+        Returns a dict containing all our column values for the serial at
+        index `idx`
+        """
+        to_ret = {'valid': bool(self.valid[idx])}
+        for column in SerialBatch.columns:
+            to_ret[column] = getattr(self, column)[idx]
+        return to_ret
+
+    def balance(self, idx):
+        """
+        Returns the balance name for the serial at index `idx`, or `None`
+        if it wasn't decoded.
+        """
+        if not self.valid[idx]:
+            return None
+        return self.serial_db.get_part('InventoryBalanceData', self.balance_idx[idx])
+
 class WLItem(WLSerial):
     """
     Pretty thin wrapper around the protobuf `OakInventoryItemSaveGameData`
@@ -822,6 +1279,34 @@ class WLItem(WLSerial):
         """
         Creates a new item with the specified serial number, and pickup_order_idx
         """
+        return WLItem(OakShared_pb2.OakInventoryItemSaveGameData(
+                item_serial_number=serial_number,
+                pickup_order_index=pickup_order_idx,
+                flags=WLItem.get_flags(is_seen, is_favorite, is_trash),
+                ), datawrapper)
+
+    @staticmethod
+    def create_in(container, datawrapper, serial_number, pickup_order_idx, is_seen=True, is_favorite=False, is_trash=False):
+        """
+        Like `create`, but constructs the new item's protobuf directly inside
+        the repeated field `container` (such as a savegame's `inventory_items`),
+        rather than building it separately and having it copied in.  Note that
+        the protobuf gets added to `container` before the serial is loaded, so
+        if the serial turns out to be invalid, the caller is responsible for
+        removing it again.  The caller is also responsible for any other
+        bookkeeping.
+        """
+        return WLItem(container.add(
+                item_serial_number=serial_number,
+                pickup_order_index=pickup_order_idx,
+                flags=WLItem.get_flags(is_seen, is_favorite, is_trash),
+                ), datawrapper)
+
+    @staticmethod
+    def get_flags(is_seen=True, is_favorite=False, is_trash=False):
+        """
+        Returns the item flags value to use for the given attributes
+        """
 
         # Start constructing flags
         flags = 0
@@ -834,12 +1319,7 @@ class WLItem(WLSerial):
         elif is_trash:
             flags |= 0x4
 
-        # Now do the creation
-        return WLItem(OakShared_pb2.OakInventoryItemSaveGameData(
-                item_serial_number=serial_number,
-                pickup_order_index=pickup_order_idx,
-                flags=flags,
-                ), datawrapper)
+        return flags
 
     def get_pickup_order_idx(self):
         return self.protobuf.pickup_order_index
@@ -853,31 +1333,184 @@ class WLItem(WLSerial):
 
 class InventorySerialDB(object):
     """
-    Little wrapper to provide access to our inventory serial number DB
+    Little wrapper to provide access to our inventory serial number DB.
+
+    By default this reads from `inventoryserialdb.bin`, a precompiled binary
+    version of the DB which gets mmapped, and which only has its categories
+    decoded as they're asked for.  If that isn't available for whatever
+    reason, we'll fall back to reading the full `inventoryserialdb.json.gz`.
+    Both are generated by `resources/gen_inventory_db.py`, which also has
+    the binary format documented.
     """
 
+    binary_magic = b'TTWLISDB'
+    binary_version = 1
+
     def __init__(self):
         self.initialized = False
-        self.db = None
+        self.db = {}
         self._max_version = -1
         self.part_cache = {}
+        self.part_cache_nocase = {}
+        self.bits_lookup = {}
+        self._mapped = None
+        self._index = {}
+        self._data_file = None
+        # Reentrant, since filling in the lazy caches can end up initializing
+        # the DB or decoding other categories while we're holding it.
+        self._lock = threading.RLock()
 
     def _initialize(self):
         """
         Actually read in our data.  Not doing this automatically because I
         only want to do it if we're doing an operation which requires it.
         """
+        with self._lock:
+            if not self.initialized:
+                if self._initialize_binary():
+                    self._data_file = 'resources/inventoryserialdb.bin'
+                else:
+                    self._data_file = 'resources/inventoryserialdb.json.gz'
+                    with gzip.open(io.BytesIO(pkg_resources.resource_string(
+                            __name__, self._data_file
+                            ))) as df:
+                        self.db = json.load(df)
+
+                    # I generally shy away from complex one-liners like this, but eh?
+                    self._max_version = max(
+                            [max([v['version'] for v in category['versions']]) for category in self.db.values()]
+                            )
+                self.initialized = True
+
+    def _initialize_binary(self):
+        """
+        Attempts to map in our binary DB and read its category index.  Returns
+        `True` if that worked, or `False` if we should fall back to the JSON.
+        """
+        try:
+            filename = pkg_resources.resource_filename(__name__, 'resources/inventoryserialdb.bin')
+            with open(filename, 'rb') as df:
+                mapped = mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, NotImplementedError):
+            return False
+        if mapped[:len(self.binary_magic)] != self.binary_magic:
+            mapped.close()
+            return False
+        offset = len(self.binary_magic)
+        version, num_categories, max_version = struct.unpack_from('<III', mapped, offset)
+        if version != self.binary_version:
+            mapped.close()
+            return False
+        offset += 12
+        index = {}
+        for _ in range(num_categories):
+            name_len = struct.unpack_from('<H', mapped, offset)[0]
+            offset += 2
+            name = mapped[offset:offset+name_len].decode('utf-8')
+            offset += name_len
+            index[name] = struct.unpack_from('<I', mapped, offset)[0]
+            offset += 4
+        self._mapped = mapped
+        self._index = index
+        self._max_version = max_version
+        return True
+
+    def _decode_versions(self, offset):
+        """
+        Decodes a category's version list from the binary DB at `offset`,
+        returning the list and the offset just past it.
+        """
+        mapped = self._mapped
+        num_versions = struct.unpack_from('<H', mapped, offset)[0]
+        offset += 2
+        versions = []
+        for version, bits in struct.iter_unpack('<II', mapped[offset:offset+num_versions*8]):
+            versions.append({'version': version, 'bits': bits})
+        return (versions, offset+num_versions*8)
+
+    def _get_category(self, category):
+        """
+        Returns the data for the given `category`, in the same format as the
+        JSON DB (a dict with `versions` and `assets`), decoding it from the
+        binary DB if need be.
+        """
         if not self.initialized:
-            with gzip.open(io.BytesIO(pkg_resources.resource_string(
-                    __name__, 'resources/inventoryserialdb.json.gz'
-                    ))) as df:
-                self.db = json.load(df)
-            self.initialized = True
-
-            # I generally shy away from complex one-liners like this, but eh?
-            self._max_version = max(
-                    [max([v['version'] for v in category['versions']]) for category in self.db.values()]
-                    )
+            self._initialize()
+        if category not in self.db:
+            with self._lock:
+                if category not in self.db:
+                    if category not in self._index:
+                        raise KeyError(category)
+                    mapped = self._mapped
+                    versions, offset = self._decode_versions(self._index[category])
+                    num_assets = struct.unpack_from('<I', mapped, offset)[0]
+                    offset += 4
+                    assets = []
+                    for _ in range(num_assets):
+                        asset_len = struct.unpack_from('<H', mapped, offset)[0]
+                        offset += 2
+                        assets.append(mapped[offset:offset+asset_len].decode('utf-8'))
+                        offset += asset_len
+                    self.db[category] = {'versions': versions, 'assets': assets}
+        return self.db[category]
+
+    def _get_bits_lookup(self, category):
+        """
+        Returns a list of the number of bits used for `category`, indexed by
+        serial version, from zero up to our max version.  Built the first time
+        it's asked for.  This doesn't need the category's assets, so they
+        won't get decoded from the binary DB just for this.
+        """
+        if category not in self.bits_lookup:
+            if not self.initialized:
+                self._initialize()
+            with self._lock:
+                if category not in self.bits_lookup:
+                    if category in self.db:
+                        versions = self.db[category]['versions']
+                    elif category in self._index:
+                        versions = self._decode_versions(self._index[category])[0]
+                    else:
+                        raise KeyError(category)
+                    lookup = []
+                    cur_bits = versions[0]['bits']
+                    ver_idx = 0
+                    for version in range(self._max_version+1):
+                        while ver_idx < len(versions) and versions[ver_idx]['version'] <= version:
+                            cur_bits = versions[ver_idx]['bits']
+                            ver_idx += 1
+                        lookup.append(cur_bits)
+                    self.bits_lookup[category] = lookup
+        return self.bits_lookup[category]
+
+    @property
+    def data_file(self):
+        """
+        Returns the resource path of the DB file we've actually loaded (either
+        the binary DB or the JSON fallback)
+        """
+        if not self.initialized:
+            self._initialize()
+        return self._data_file
+
+    def get_categories(self):
+        """
+        Returns a list of all the categories in the DB
+        """
+        if not self.initialized:
+            self._initialize()
+        if self._mapped is not None:
+            return list(self._index.keys())
+        else:
+            return list(self.db.keys())
+
+    def bits_table(self, version):
+        """
+        Returns a dict mapping every category to the number of bits it uses
+        for serials with the given `version`.  Handy for hoisting lookups out
+        of loops which process a lot of serials.
+        """
+        return dict([(category, self.get_num_bits(category, version)) for category in self.get_categories()])
 
     @property
     def max_version(self):
@@ -893,48 +1526,70 @@ class InventorySerialDB(object):
         Returns the number of bits used for the specified `category`, using
         a serial with version `version`
         """
-        if not self.initialized:
-            self._initialize()
-        cur_bits = self.db[category]['versions'][0]['bits']
-        for cat_version in self.db[category]['versions']:
-            if cat_version['version'] > version:
-                return cur_bits
-            elif version >= cat_version['version']:
-                cur_bits = cat_version['bits']
-        return cur_bits
+        try:
+            return self.bits_lookup[category][version]
+        except (KeyError, IndexError):
+            lookup = self._get_bits_lookup(category)
+            return lookup[min(version, len(lookup)-1)]
 
     def get_part(self, category, index):
         """
         Given the specified `category`, return the part for `index`
         """
-        if not self.initialized:
-            self._initialize()
         if index < 1:
             return None
         else:
-            if index > len(self.db[category]['assets']):
+            assets = self._get_category(category)['assets']
+            if index > len(assets):
                 return None
             else:
-                return self.db[category]['assets'][index-1]
+                return assets[index-1]
 
-    def get_part_index(self, category, part_name):
+    def _get_part_lookup(self, category, case_insensitive=False):
+        """
+        Returns a dict mapping part names to indexes for the given `category`,
+        building it the first time it's asked for.  If `case_insensitive` is
+        `True`, the keys will be lowercased.  If a name happens to appear more
+        than once, the first index wins.
+        """
+        if case_insensitive:
+            cache = self.part_cache_nocase
+        else:
+            cache = self.part_cache
+        if category not in cache:
+            with self._lock:
+                if category not in cache:
+                    lookup = {}
+                    for idx, asset_part_name in enumerate(self._get_category(category)['assets']):
+                        if case_insensitive:
+                            asset_part_name = asset_part_name.lower()
+                        if asset_part_name not in lookup:
+                            lookup[asset_part_name] = idx+1
+                    cache[category] = lookup
+        return cache[category]
+
+    def get_part_index(self, category, part_name, case_insensitive=False):
         """
         Find the correct index to use for the given `part_name`, inside the given
-        `category`.  Will return `None` if the part cannot be found.
+        `category`.  Will return `None` if the part cannot be found.  If
+        `case_insensitive` is `True`, the part name will be matched without
+        regard to case.
         """
-        if not self.initialized:
-            self._initialize()
-        if category not in self.part_cache:
-            self.part_cache[category] = {}
-        if part_name not in self.part_cache[category]:
-            for idx, asset_part_name in enumerate(self.db[category]['assets']):
-                if part_name == asset_part_name:
-                    self.part_cache[category][part_name] = idx+1
-                    return idx+1
-        if part_name in self.part_cache[category]:
-            return self.part_cache[category][part_name]
+        if case_insensitive:
+            part_name = part_name.lower()
+        return self._get_part_lookup(category, case_insensitive).get(part_name)
+
+    def get_part_indices(self, category, part_names, case_insensitive=False):
+        """
+        Bulk version of `get_part_index`: returns a list of indexes for each of
+        the given `part_names` inside `category`, with `None` for any part which
+        can't be found.
+        """
+        lookup = self._get_part_lookup(category, case_insensitive)
+        if case_insensitive:
+            return [lookup.get(part_name.lower()) for part_name in part_names]
         else:
-            return None
+            return [lookup.get(part_name) for part_name in part_names]
 
 class BalanceToName(object):
     """
@@ -945,18 +1600,20 @@ class BalanceToName(object):
     def __init__(self):
         self.initialized = False
         self.mapping = None
+        self._lock = threading.Lock()
 
     def _initialize(self):
         """
         Actually read in our data.  Not doing this automatically because I
         only want to do it if we're doing an operation which requires it.
         """
-        if not self.initialized:
-            with gzip.open(io.BytesIO(pkg_resources.resource_string(
-                    __name__, 'resources/balance_name_mapping.json.gz'
-                    ))) as df:
-                self.mapping = json.load(df)
-            self.initialized = True
+        with self._lock:
+            if not self.initialized:
+                with gzip.open(io.BytesIO(pkg_resources.resource_string(
+                        __name__, 'resources/balance_name_mapping.json.gz'
+                        ))) as df:
+                    self.mapping = json.load(df)
+                self.initialized = True
 
     def get(self, balance):
         """
@@ -981,18 +1638,20 @@ class BalanceToInvKey(object):
     def __init__(self):
         self.initialized = False
         self.mapping = None
+        self._lock = threading.Lock()
 
     def _initialize(self):
         """
         Actually read in our data.  Not doing this automatically because I
         only want to do it if we're doing an operation which requires it.
         """
-        if not self.initialized:
-            with gzip.open(io.BytesIO(pkg_resources.resource_string(
-                    __name__, 'resources/balance_to_inv_key.json.gz'
-                    ))) as df:
-                self.mapping = json.load(df)
-            self.initialized = True
+        with self._lock:
+            if not self.initialized:
+                with gzip.open(io.BytesIO(pkg_resources.resource_string(
+                        __name__, 'resources/balance_to_inv_key.json.gz'
+                        ))) as df:
+                    self.mapping = json.load(df)
+                self.initialized = True
 
     def get(self, balance):
         """
@@ -1008,6 +1667,152 @@ class BalanceToInvKey(object):
         else:
             return None
 
+class FingerprintIndex(object):
+    """
+    Index of the serial fingerprints (see `WLSerial.fingerprint`) found in
+    a single container of items -- a savegame's inventory, a profile's bank,
+    Lost Loot, etc.  Lets us check whether an item's already present without
+    comparing decoded serials pairwise.
+
+    Items added to the index keep a reference back to it, so if they get
+    edited later on, the index gets updated along with them.  Containers
+    are expected to call `add()`/`remove()` as items come and go.
+    """
+
+    def __init__(self, items=None):
+        self.counts = collections.Counter()
+        if items is not None:
+            for item in items:
+                self.add(item)
+
+    def __len__(self):
+        return sum(self.counts.values())
+
+    def __contains__(self, item):
+        """
+        Returns `True` if the given WLSerial (or raw fingerprint) is present
+        """
+        if isinstance(item, WLSerial):
+            item = item.fingerprint
+        return self.counts[item] > 0
+
+    def add(self, item):
+        """
+        Adds the given WLSerial to the index
+        """
+        self.counts[item.fingerprint] += 1
+        item._fingerprint_index = self
+
+    def remove(self, item):
+        """
+        Removes the given WLSerial from the index
+        """
+        self._decrement(item.fingerprint)
+        if item._fingerprint_index is self:
+            item._fingerprint_index = None
+
+    def update(self, old_fingerprint, new_fingerprint):
+        """
+        Called by an item in the index whose fingerprint has changed
+        """
+        if old_fingerprint != new_fingerprint:
+            self._decrement(old_fingerprint)
+            self.counts[new_fingerprint] += 1
+
+    def clear(self):
+        """
+        Empties the index
+        """
+        self.counts.clear()
+
+    def _decrement(self, fingerprint):
+        self.counts[fingerprint] -= 1
+        if self.counts[fingerprint] <= 0:
+            del self.counts[fingerprint]
+
+class SerialRecordCache(object):
+    """
+    Bounded, process-wide LRU cache of serial numbers we've already seen,
+    so that identical serials (bank duplicates, the same gear showing up in
+    an archive full of saves, etc) only get de-obfuscated and parsed once.
+    Keyed on the binary serial, each entry holds a tuple of the decrypted
+    data, the original seed, the serial version, and the `ParsedSerial`
+    record (or `None` if nothing's parsed the serial yet).
+
+    All of that is immutable, so `WLSerial` objects can share it freely.
+    Their own attributes get populated from the record, so any edits just
+    replace those attributes (and then produce a whole new serial), leaving
+    the cached data alone.
+    """
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, serial):
+        """
+        Returns the cache entry for the binary `serial`, or `None`
+        """
+        if not isinstance(serial, bytes):
+            return None
+        with self._lock:
+            entry = self.entries.get(serial)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(serial)
+            return entry
+
+    def put(self, serial, entry):
+        """
+        Stores the given `entry` for the binary `serial`
+        """
+        if not isinstance(serial, bytes) or self.max_entries < 1:
+            return
+        with self._lock:
+            self.entries[serial] = entry
+            self.entries.move_to_end(serial)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Clears out the cache, and its stats
+        """
+        with self._lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """
+        Returns the fraction of lookups which were found in the cache
+        """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0
+        return self.hits/total
+
+    def report(self):
+        """
+        Returns a string describing how well the cache has been doing
+        """
+        return 'Serial cache: {} hits, {} misses ({:.1f}% hit rate), {}/{} entries'.format(
+                self.hits,
+                self.misses,
+                self.hit_rate*100,
+                len(self.entries),
+                self.max_entries,
+                )
+
 class DataWrapper(object):
     """
     Weird little metaclass which just has an instance of each of our file-backed
@@ -1017,8 +1822,58 @@ class DataWrapper(object):
     BalanceToName, and we instantiate a fair number of those.)
     """
 
+    _shared = None
+    _shared_lock = threading.Lock()
+
     def __init__(self):
         self.serial_db = InventorySerialDB()
         self.name_db = BalanceToName()
         self.invkey_db = BalanceToInvKey()
+        self.record_cache = SerialRecordCache()
+        self.serial_cache = None
+
+    def enable_serial_cache(self, filename=None, max_entries=50000):
+        """
+        Turns on the persistent on-disk cache of parsed serial numbers (see
+        `serialcache.PersistentSerialCache`), optionally stored at `filename`
+        rather than in the default user cache dir.  The cache will be flushed
+        out when the process exits.
+        """
+        if self.serial_cache is None:
+            from .serialcache import PersistentSerialCache
+            self.serial_cache = PersistentSerialCache(ParsedSerial,
+                    filename=filename,
+                    max_entries=max_entries,
+                    data_files=[
+                        self.serial_db.data_file,
+                        'resources/balance_to_inv_key.json.gz',
+                        ],
+                    )
+            atexit.register(self.serial_cache.close)
+        return self.serial_cache
+
+    @staticmethod
+    def shared():
+        """
+        Returns a process-wide DataWrapper, creating it the first time it's
+        asked for.  Savegames and profiles all use this one, so the data files
+        only ever get read in once, no matter how many we open.  The data
+        itself is still only loaded when something needs it (or when
+        `preload` is called).
+        """
+        if DataWrapper._shared is None:
+            with DataWrapper._shared_lock:
+                if DataWrapper._shared is None:
+                    DataWrapper._shared = DataWrapper()
+        return DataWrapper._shared
+
+    def preload(self):
+        """
+        Loads all our data right away, rather than waiting for it to be
+        needed.  Useful for long-running processes which would rather pay
+        that cost up-front.
+        """
+        self.serial_db._initialize()
+        self.name_db._initialize()
+        self.invkey_db._initialize()
 
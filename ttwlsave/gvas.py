@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+
+# GVAS header handling shared by TTWLSave and TTWLProfile.  The format was
+# gleaned from 13xforever/Ilya's "gvas-converter" project:
+# https://github.com/13xforever/gvas-converter
+#
+# Files are mapped into memory rather than read in, and the header is parsed
+# straight out of a memoryview, so the (obfuscated) protobuf body can be
+# handed over to the cipher without being copied first.  That also means
+# that header-only reads only ever touch the first page or so of the file.
+
+import mmap
+import struct
+from . import cipher
+
+class GvasContainer(object):
+    """
+    The GVAS wrapper around a savegame or profile.  This holds on to all the
+    header info so that it can be written back out unchanged; the actual
+    protobuf body is dealt with by whoever's using us.
+    """
+
+    magic = b'GVAS'
+
+    def __init__(self):
+        self.sg_version = 0
+        self.pkg_version = 0
+        self.engine_major = 0
+        self.engine_minor = 0
+        self.engine_patch = 0
+        self.engine_build = 0
+        self.build_id = None
+        self.fmt_version = 0
+        self.custom_format_data = []
+        self.sg_type = None
+        self.body_offset = 0
+        self.body_len = 0
+
+    @staticmethod
+    def read(filename, body_func=None, label='Savegame', debug=False):
+        """
+        Reads the GVAS file at `filename`.  If `body_func` is given, it will
+        be called with a memoryview of the raw body data (which is only
+        valid for the duration of the call).  Returns a tuple of the new
+        container and whatever `body_func` returned (or `None`).  `label`
+        is just used for the debug output.
+        """
+        container = GvasContainer()
+        result = None
+        with open(filename, 'rb') as df:
+            try:
+                mapped = mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Zero-length files can't be mapped, and some platforms
+                # (pyodide, for instance) may not support it at all.
+                mapped = df.read()
+            view = memoryview(mapped)
+            try:
+                container.parse_header(view, label=label, debug=debug)
+                end = container.body_offset + container.body_len
+                # Make sure that was all there was
+                assert(end == len(view))
+                if body_func is not None:
+                    body = view[container.body_offset:end]
+                    try:
+                        result = body_func(body)
+                    finally:
+                        body.release()
+            finally:
+                view.release()
+                if isinstance(mapped, mmap.mmap):
+                    mapped.close()
+        return (container, result)
+
+    @staticmethod
+    def read_header(filename, label='Savegame', debug=False):
+        """
+        Reads just the header from the GVAS file at `filename`, returning
+        a new container.
+        """
+        return GvasContainer.read(filename, label=label, debug=debug)[0]
+
+    @staticmethod
+    def peek(filename, message_class, prefix_magic, xor_magic, fields=None, label='Savegame'):
+        """
+        Reads the header from the GVAS file at `filename`, and optionally
+        pulls out the top-level protobuf `fields` (a list of field names
+        from `message_class`) without parsing the rest of the body.  The
+        body is only decrypted where we actually need to look at it (using
+        `prefix_magic` and `xor_magic`).  Returns a tuple of the new
+        container and a dict of field values.
+        """
+        if not fields:
+            return (GvasContainer.read_header(filename, label=label), {})
+        return GvasContainer.read(filename,
+                body_func=lambda body: peek_fields(body, message_class, fields,
+                    lambda start, end: cipher.decrypt_range(body, start, end, prefix_magic, xor_magic)),
+                label=label,
+                )
+
+    def parse_header(self, view, label='Savegame', debug=False):
+        """
+        Parses our header out of the bytes-like `view`, which should be the
+        start of a GVAS file.  Afterwards, `body_offset` and `body_len` will
+        point at the body data.
+        """
+        if bytes(view[:4]) != self.magic:
+            raise Exception('Not a GVAS file (header: {})'.format(bytes(view[:4])))
+        offset = 4
+
+        (self.sg_version,
+                self.pkg_version,
+                self.engine_major,
+                self.engine_minor,
+                self.engine_patch,
+                self.engine_build) = struct.unpack_from('<IIHHHI', view, offset)
+        offset += 18
+        if debug:
+            print('{} version: {}'.format(label, self.sg_version))
+            print('Package version: {}'.format(self.pkg_version))
+            print('Engine version: {}.{}.{}.{}'.format(
+                self.engine_major,
+                self.engine_minor,
+                self.engine_patch,
+                self.engine_build,
+                ))
+        self.build_id, offset = self._read_str(view, offset)
+        if debug:
+            print('Build ID: {}'.format(self.build_id))
+        self.fmt_version, fmt_count = struct.unpack_from('<II', view, offset)
+        offset += 8
+        if debug:
+            print('Custom Format Version: {}'.format(self.fmt_version))
+            print('Custom Format Data Count: {}'.format(fmt_count))
+        self.custom_format_data = []
+        for _ in range(fmt_count):
+            guid = bytes(view[offset:offset+16])
+            entry = struct.unpack_from('<I', view, offset+16)[0]
+            offset += 20
+            if debug:
+                print(' - GUID {}: {}'.format(guid, entry))
+            self.custom_format_data.append((guid, entry))
+        self.sg_type, offset = self._read_str(view, offset)
+        if debug:
+            print('{} type: {}'.format(label, self.sg_type))
+
+        self.body_len = struct.unpack_from('<I', view, offset)[0]
+        self.body_offset = offset + 4
+
+    def _read_str(self, view, offset):
+        """
+        Reads a length-prefixed string from `view` at `offset`, returning
+        the string and the offset just past it.
+        """
+        datalen = struct.unpack_from('<I', view, offset)[0]
+        offset += 4
+        if datalen == 0:
+            return (None, offset)
+        elif datalen == 1:
+            return ('', offset)
+        else:
+            return (bytes(view[offset:offset+datalen-1]).decode('utf-8'), offset+datalen)
+
+    def _pack_str(self, value):
+        if value is None:
+            return struct.pack('<I', 0)
+        elif value == '':
+            return struct.pack('<I', 1)
+        else:
+            data = value.encode('utf-8') + b'\0'
+            return struct.pack('<I', len(data)) + data
+
+    def get_header_bytes(self):
+        """
+        Returns our header as a bytes-like object, up to (but not including)
+        the body length.
+        """
+        parts = [
+                self.magic,
+                struct.pack('<IIHHHI',
+                    self.sg_version,
+                    self.pkg_version,
+                    self.engine_major,
+                    self.engine_minor,
+                    self.engine_patch,
+                    self.engine_build,
+                    ),
+                self._pack_str(self.build_id),
+                struct.pack('<II', self.fmt_version, len(self.custom_format_data)),
+                ]
+        for guid, entry in self.custom_format_data:
+            parts.append(bytes(guid))
+            parts.append(struct.pack('<I', entry))
+        parts.append(self._pack_str(self.sg_type))
+        return b''.join(parts)
+
+    def save_to(self, filename, body):
+        """
+        Writes ourselves out to `filename`, with the already-encrypted
+        `body` data.
+        """
+        with open(filename, 'wb') as df:
+            df.write(self.get_header_bytes())
+            df.write(struct.pack('<I', len(body)))
+            df.write(body)
+
+def _read_varint(read, pos, length):
+    """
+    Reads a protobuf varint at `pos` using the `read` function (see
+    `peek_fields`).  Returns the value and the position just past it.
+    """
+    data = read(pos, min(pos+10, length))
+    value = 0
+    for idx, byte in enumerate(data):
+        value |= (byte & 0x7F) << (7*idx)
+        if not byte & 0x80:
+            return (value, pos+idx+1)
+    raise Exception('Invalid varint found at protobuf offset {}'.format(pos))
+
+def peek_fields(body, message_class, fields, read=None):
+    """
+    Scans the protobuf wire format in `body` for the given top-level `fields`
+    (a list of field names from `message_class`), and returns a dict mapping
+    the field names to their values.  Fields which aren't present get their
+    protobuf defaults.  `read`, if given, should be a function taking a start
+    and end position and returning the plaintext bytes in that range, which
+    lets us decrypt only the bits we actually look at.  Everything else just
+    gets skipped over.
+
+    The wanted fields (tags and all) are collected up and parsed into a
+    mostly-empty `message_class`, so protobuf itself handles the decoding.
+    """
+    if read is None:
+        read = lambda start, end: bytes(body[start:end])
+
+    # Most fields are small, so decrypt in chunks rather than piecemeal.
+    chunk_start = 0
+    chunk = b''
+    def read_chunked(start, end):
+        nonlocal chunk_start, chunk
+        if start < chunk_start or end > chunk_start + len(chunk):
+            chunk_start = start
+            chunk = read(start, max(end, start+4096))
+        return chunk[start-chunk_start:end-chunk_start]
+
+    descriptor = message_class.DESCRIPTOR
+    wanted = {}
+    for name in fields:
+        if name not in descriptor.fields_by_name:
+            raise Exception('Unknown field for {}: {}'.format(descriptor.name, name))
+        field = descriptor.fields_by_name[name]
+        wanted[field.number] = field
+    # Serializers write singular fields once, so we can stop as soon as we've
+    # seen them all.  Repeated fields mean we have to go all the way through.
+    stop_early = all([f.label != f.LABEL_REPEATED for f in wanted.values()])
+    remaining = set(wanted.keys())
+
+    length = len(body)
+    pos = 0
+    found = []
+    while pos < length:
+        start = pos
+        tag, pos = _read_varint(read_chunked, pos, length)
+        number = tag >> 3
+        wire_type = tag & 0x7
+        if wire_type == 0:
+            _, pos = _read_varint(read_chunked, pos, length)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            datalen, pos = _read_varint(read_chunked, pos, length)
+            pos += datalen
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise Exception('Unsupported protobuf wire type {} at offset {}'.format(wire_type, start))
+        if pos > length:
+            raise Exception('Truncated protobuf data at offset {}'.format(start))
+        if number in wanted:
+            found.append(read_chunked(start, pos))
+            remaining.discard(number)
+            if stop_early and not remaining:
+                break
+
+    message = message_class()
+    message.ParseFromString(b''.join(found))
+    values = {}
+    for field in wanted.values():
+        value = getattr(message, field.name)
+        if field.label == field.LABEL_REPEATED:
+            value = list(value)
+        values[field.name] = value
+    return values
@@ -0,0 +1,1028 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+#
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+
+# AUTOGENERATED by resources/gen_lookups.py, from the tables in __init__.py.
+# Don't edit this by hand -- update those tables and re-run the script.
+
+import types
+
+# Mission class paths (as found in savegames, and lowercased) to English
+mission_to_name = types.MappingProxyType({
+        '/Game/Missions/Major/Beanstalk/Mission_Skybound.Mission_Skybound_C': 'Walk the Stalk',
+        '/Game/Missions/Major/Goblin/Mission_GTFO.Mission_GTFO_C': 'Goblins Tired of Forced Oppression',
+        '/Game/Missions/Major/Goblin/Mission_GTFOP2.Mission_GTFOP2_C': 'The Slayer of Vorcanar',
+        '/Game/Missions/Major/Oasis/Mission_Doomed.Mission_Doomed_C': 'The Ditcher',
+        '/Game/Missions/Major/Pirate/Mission_CrookedEyePhil.Mission_CrookedEyePhil_C': 'The Trial of Crooked-Eye Phil',
+        '/Game/Missions/Plot/Mission_Plot00.Mission_Plot00_C': 'Bunkers & Badasses',
+        '/Game/Missions/Plot/Mission_Plot01.Mission_Plot01_C': 'Hero of Brighthoof',
+        '/Game/Missions/Plot/Mission_Plot02.Mission_Plot02_C': "A Hard Day's Knight",
+        '/Game/Missions/Plot/Mission_Plot04.Mission_Plot04_C': 'Thy Bard, with a Vengeance',
+        '/Game/Missions/Plot/Mission_Plot05.Mission_Plot05_C': 'Emotion of the Ocean',
+        '/Game/Missions/Plot/Mission_Plot06.Mission_Plot06_C': 'Ballad of Bones',
+        '/Game/Missions/Plot/Mission_Plot07.Mission_Plot07_C': 'Mortal Coil',
+        '/Game/Missions/Plot/Mission_Plot08.Mission_Plot08_C': 'The Son of a Witch',
+        '/Game/Missions/Plot/Mission_Plot09.Mission_Plot09_C': 'Soul Purpose',
+        '/Game/Missions/Plot/Mission_Plot10.Mission_Plot10_C': 'Fatebreaker',
+        '/Game/Missions/Plot/Mission_Plot11.Mission_Plot11_C': 'Epilogue',
+        '/Game/Missions/Side/Overworld/Overworld/AB1_MinersProblem/Mission_OW_AB1_MinersProblem.Mission_OW_AB1_MinersProblem_C': 'Alchemy: Precious Metals',
+        '/Game/Missions/Side/Overworld/Overworld/AB2_MiracleGrow/Mission_OW_AB2_MiracleGrow.Mission_OW_AB2_MiracleGrow_C': 'Alchemy: Miracle Growth',
+        '/Game/Missions/Side/Overworld/Overworld/AB3_SolarCream/Mission_OW_AB3_SolarCream.Mission_OW_AB3_SolarCream_C': 'Alchemy: To Block the Sun',
+        '/Game/Missions/Side/Overworld/Overworld/AKnifeAtTheirBacks/Mission_OW_AKnifeAtTheirBacks.Mission_OW_AKnifeAtTheirBacks_C': 'Knife to Meet You',
+        '/Game/Missions/Side/Overworld/Overworld/BlessedBeThySword/Mission_OW_BlessedBeThySword.Mission_OW_BlessedBeThySword_C': 'A Realm in Peril',
+        '/Game/Missions/Side/Overworld/Overworld/ClericallyLost/Mission_OW_ClericallyLost.Mission_OW_ClericallyLost_C': 'Clerical Error',
+        '/Game/Missions/Side/Overworld/Overworld/CrabyThePet/Mission_OW_CrabyThePet.Mission_OW_CrabyThePet_C': "A Pet's Rest",
+        '/Game/Missions/Side/Overworld/Overworld/DestructionRainsFromTheHeaven/Mission_OW_DestructionRainsFromTheHeaven.Mission_OW_DestructionRainsFromTheHeaven_C': 'Destruction Rains from the Heavens',
+        '/Game/Missions/Side/Overworld/Overworld/EyeLostIt/Mission_OW_EyeLostIt.Mission_OW_EyeLostIt_C': 'Eye Lost It',
+        '/Game/Missions/Side/Overworld/Overworld/FumblingAround/Mission_OW_FumblingAround.Mission_OW_FumblingAround_C': 'Working Blueprint',
+        '/Game/Missions/Side/Overworld/Overworld/IBelieveIcanTouchTheSky/Mission_OW_IBelieveIcanTouchTheSky.Mission_OW_IBelieveIcanTouchTheSky_C': 'On Wings and Dreams',
+        '/Game/Missions/Side/Overworld/Overworld/InMyImage/Mission_OW_InMyImage.Mission_OW_InMyImage_C': 'In My Image',
+        '/Game/Missions/Side/Overworld/Overworld/ItFellFromTheSkies/Mission_OW_ItFellFromTheSkies.Mission_OW_ItFellFromTheSkies_C': 'Cheesy Pick-Up',
+        '/Game/Missions/Side/Overworld/Overworld/PocketSandstorm/Mission_OW_PocketSandstorm.Mission_OW_PocketSandstorm_C': 'Pocket Sandstorm',
+        '/Game/Missions/Side/Overworld/Overworld/TheLegendaryBow/Mission_OW_TheLegendaryBow.Mission_OW_TheLegendaryBow_C': 'Legendary Bow',
+        '/Game/Missions/Side/Overworld/Overworld/VisionOfDeception/Mission_OW_VisionOfDeception.Mission_OW_VisionOfDeception_C': 'Lens of the Deceiver',
+        '/Game/Missions/Side/Zone_1/Goblin/Mission_MurderHobos.Mission_MurderHobos_C': 'Non-Violent Offender',
+        '/Game/Missions/Side/Zone_1/Goblin/Mission_SmithsCharade.Mission_SmithsCharade_C': 'Forgery',
+        '/Game/Missions/Side/Zone_1/Hubtown/Mission_InnerDemons.Mission_InnerDemons_C': 'Inner Daemons',
+        '/Game/Missions/Side/Zone_1/Intro/Mission_RatQuestPt1.Mission_RatQuestPt1_C': 'Goblins in the Garden',
+        '/Game/Missions/Side/Zone_1/Intro/Mission_RatQuestPt2.Mission_RatQuestPt2_C': "A Farmer's Ardor",
+        '/Game/Missions/Side/Zone_1/Mushroom/Mission_BlueOnes.Mission_BlueOnes_C': 'Little Boys Blue',
+        '/Game/Missions/Side/Zone_1/Mushroom/Mission_ClaptrapGrenade.Mission_ClaptrapGrenade_C': "A Knight's Toil",
+        '/Game/Missions/Side/Zone_1/Mushroom/Mission_MinstrelMetal.Mission_MinstrelMetal_C': 'Lyre and Brimstone',
+        '/Game/Missions/Side/Zone_1/Mushroom/Mission_ToothFairy.Mission_ToothFairy_C': 'Cash 4 Teeth',
+        '/Game/Missions/Side/Zone_1/Sewers/Mission_CloggageOfTheDammed.Mission_CloggageOfTheDammed_C': 'On the Wink of Destruction',
+        '/Game/Missions/Side/Zone_2/Abyss/Mission_CurseOfTheTwistedSisters.Mission_CurseOfTheTwistedSisters_C': 'Of Curse and Claw',
+        '/Game/Missions/Side/Zone_2/Abyss/Mission_Diplomacy.Mission_Diplomacy_C': 'Diplomatic Relations',
+        '/Game/Missions/Side/Zone_2/Beanstalk/Mission_DeRat.Mission_DeRat_C': 'A Small Favor',
+        '/Game/Missions/Side/Zone_2/Beanstalk/Mission_ElderWyvern.Mission_ElderWyvern_C': 'Burning Hunger',
+        '/Game/Missions/Side/Zone_2/Beanstalk/Mission_RonRivote.Mission_RonRivote_C': 'Ron Rivote',
+        '/Game/Missions/Side/Zone_2/Pirate/MIssion_PirateLife.MIssion_PirateLife_C': 'A Wandering Aye',
+        '/Game/Missions/Side/Zone_2/Pirate/Mission_JaggedToothCrew.Mission_JaggedToothCrew_C': 'All Swashed Up',
+        '/Game/Missions/Side/Zone_2/Pirate/Mission_LittlePookie.Mission_LittlePookie_C': 'A Walk to Dismember',
+        '/Game/Missions/Side/Zone_2/Pirate/Mission_WhaleTale.Mission_WhaleTale_C': 'In the Belly Is a Beast',
+        '/Game/Missions/Side/Zone_2/SeaBed/Mission_DyingWish.Mission_DyingWish_C': 'Twenty Thousand Years Under the Sea',
+        '/Game/Missions/Side/Zone_2/SeaBed/Mission_SharkPearls.Mission_SharkPearls_C': 'Raiders of the Lost Shark',
+        '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowers.Mission_AncientPowers_C': 'Ancient Powers',
+        '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersCombat1.Mission_AncientPowersCombat1_C': 'Ancient Powers (Part 2)',
+        '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersCombat2.Mission_AncientPowersCombat2_C': 'Ancient Powers (Part 3)',
+        '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersDreadLord.Mission_AncientPowersDreadLord_C': 'Ancient Powers (Part 4)',
+        '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersDreadLordRepeatable.Mission_AncientPowersDreadLordRepeatable_C': 'Ancient Powers (Part 5)',
+        '/Game/Missions/Side/Zone_3/Climb/Mission_LavaGoodTime.Mission_LavaGoodTime_C': 'Spell to Pay',
+        '/Game/Missions/Side/Zone_3/Climb/Mission_MonsterLover.Mission_MonsterLover_C': 'Necromance Her',
+        '/Game/Missions/Side/Zone_3/Oasis/Mission_LowTideBoil.Mission_LowTideBoil_C': 'Gumbo No. 5',
+        '/Game/Missions/Side/Zone_3/Sands/Mission_BlueHatCult.Mission_BlueHatCult_C': 'Armageddon Distracted',
+        '/Game/Missions/Side/Zone_3/Sands/Mission_ElementalBeer.Mission_ElementalBeer_C': 'Hot Fizz',
+        '/Game/PatchDLC/Indigo1/Common/Missions/Mission_Indigo_Epilogue.Mission_Indigo_Epilogue_C': "Vesper's Epilogue",
+        '/Game/PatchDLC/Indigo1/Common/Missions/Mission_Indigo_FirstWheelUse.Mission_Indigo_FirstWheelUse_C': 'Meet the Wheel of Fate',
+        '/Game/PatchDLC/Indigo1/Common/Missions/Mission_PLC_Completion.Mission_PLC_Completion_C': 'Nightmare in Dreamveil',
+        '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV1.Mission_PLC1_CompletionV1_C': 'Defeated Chums: Difficulty 1',
+        '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV2.Mission_PLC1_CompletionV2_C': 'Defeated Chums: Difficulty 2',
+        '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV3.Mission_PLC1_CompletionV3_C': 'Defeated Chums: Difficulty 3',
+        '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV4.Mission_PLC1_CompletionV4_C': 'Defeated Chums: Difficulty 4',
+        '/Game/PatchDLC/Indigo1/Missions/Mission_PLC1.Mission_PLC1_C': 'Best Chums',
+        '/Game/PatchDLC/Indigo2/Missions/Mission_PLC2.Mission_PLC2_C': 'Pesto Chango',
+        '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV1.Mission_PLC2_CompletionV1_C': 'Defeated Imelda: Difficulty 1',
+        '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV2.Mission_PLC2_CompletionV2_C': 'Defeated Imelda: Difficulty 2',
+        '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV3.Mission_PLC2_CompletionV3_C': 'Defeated Imelda: Difficulty 3',
+        '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV4.Mission_PLC2_CompletionV4_C': 'Defeated Imelda: Difficulty 4',
+        '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV1.Mission_PLC3_CompletionV1_C': 'Defeated Fyodor: Difficulty 1',
+        '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV2.Mission_PLC3_CompletionV2_C': 'Defeated Fyodor: Difficulty 2',
+        '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV3.Mission_PLC3_CompletionV3_C': 'Defeated Fyodor: Difficulty 3',
+        '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV4.Mission_PLC3_CompletionV4_C': 'Defeated Fyodor: Difficulty 4',
+        '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3.Mission_PLC3_C': 'Puns and Crimeishment',
+        '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_1.Mission_PLC3_3_1_C': "Puns and Crimeishment: Misery's Mine",
+        '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_2.Mission_PLC3_3_2_C': 'Puns and Crimeishment: Crystal Chasm',
+        '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_3.Mission_PLC3_3_3_C': 'Puns and Crimeishment: Slammer Central',
+        '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_4.Mission_PLC3_3_4_C': 'Puns and Crimeishment: Firedeep Forge',
+        '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV1.Mission_PLC4_CompletionV1_C': 'Defeated Redmourne: Difficulty 1',
+        '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV2.Mission_PLC4_CompletionV2_C': 'Defeated Redmourne: Difficulty 2',
+        '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV3.Mission_PLC4_CompletionV3_C': 'Defeated Redmourne: Difficulty 3',
+        '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV4.Mission_PLC4_CompletionV4_C': 'Defeated Redmourne: Difficulty 4',
+        '/Game/PatchDLC/Indigo4/Missions/Mission_PLC4.Mission_PLC4_C': 'Outer Daemons',
+        '/game/missions/major/beanstalk/mission_skybound.mission_skybound_c': 'Walk the Stalk',
+        '/game/missions/major/goblin/mission_gtfo.mission_gtfo_c': 'Goblins Tired of Forced Oppression',
+        '/game/missions/major/goblin/mission_gtfop2.mission_gtfop2_c': 'The Slayer of Vorcanar',
+        '/game/missions/major/oasis/mission_doomed.mission_doomed_c': 'The Ditcher',
+        '/game/missions/major/pirate/mission_crookedeyephil.mission_crookedeyephil_c': 'The Trial of Crooked-Eye Phil',
+        '/game/missions/plot/mission_plot00.mission_plot00_c': 'Bunkers & Badasses',
+        '/game/missions/plot/mission_plot01.mission_plot01_c': 'Hero of Brighthoof',
+        '/game/missions/plot/mission_plot02.mission_plot02_c': "A Hard Day's Knight",
+        '/game/missions/plot/mission_plot04.mission_plot04_c': 'Thy Bard, with a Vengeance',
+        '/game/missions/plot/mission_plot05.mission_plot05_c': 'Emotion of the Ocean',
+        '/game/missions/plot/mission_plot06.mission_plot06_c': 'Ballad of Bones',
+        '/game/missions/plot/mission_plot07.mission_plot07_c': 'Mortal Coil',
+        '/game/missions/plot/mission_plot08.mission_plot08_c': 'The Son of a Witch',
+        '/game/missions/plot/mission_plot09.mission_plot09_c': 'Soul Purpose',
+        '/game/missions/plot/mission_plot10.mission_plot10_c': 'Fatebreaker',
+        '/game/missions/plot/mission_plot11.mission_plot11_c': 'Epilogue',
+        '/game/missions/side/overworld/overworld/ab1_minersproblem/mission_ow_ab1_minersproblem.mission_ow_ab1_minersproblem_c': 'Alchemy: Precious Metals',
+        '/game/missions/side/overworld/overworld/ab2_miraclegrow/mission_ow_ab2_miraclegrow.mission_ow_ab2_miraclegrow_c': 'Alchemy: Miracle Growth',
+        '/game/missions/side/overworld/overworld/ab3_solarcream/mission_ow_ab3_solarcream.mission_ow_ab3_solarcream_c': 'Alchemy: To Block the Sun',
+        '/game/missions/side/overworld/overworld/aknifeattheirbacks/mission_ow_aknifeattheirbacks.mission_ow_aknifeattheirbacks_c': 'Knife to Meet You',
+        '/game/missions/side/overworld/overworld/blessedbethysword/mission_ow_blessedbethysword.mission_ow_blessedbethysword_c': 'A Realm in Peril',
+        '/game/missions/side/overworld/overworld/clericallylost/mission_ow_clericallylost.mission_ow_clericallylost_c': 'Clerical Error',
+        '/game/missions/side/overworld/overworld/crabythepet/mission_ow_crabythepet.mission_ow_crabythepet_c': "A Pet's Rest",
+        '/game/missions/side/overworld/overworld/destructionrainsfromtheheaven/mission_ow_destructionrainsfromtheheaven.mission_ow_destructionrainsfromtheheaven_c': 'Destruction Rains from the Heavens',
+        '/game/missions/side/overworld/overworld/eyelostit/mission_ow_eyelostit.mission_ow_eyelostit_c': 'Eye Lost It',
+        '/game/missions/side/overworld/overworld/fumblingaround/mission_ow_fumblingaround.mission_ow_fumblingaround_c': 'Working Blueprint',
+        '/game/missions/side/overworld/overworld/ibelieveicantouchthesky/mission_ow_ibelieveicantouchthesky.mission_ow_ibelieveicantouchthesky_c': 'On Wings and Dreams',
+        '/game/missions/side/overworld/overworld/inmyimage/mission_ow_inmyimage.mission_ow_inmyimage_c': 'In My Image',
+        '/game/missions/side/overworld/overworld/itfellfromtheskies/mission_ow_itfellfromtheskies.mission_ow_itfellfromtheskies_c': 'Cheesy Pick-Up',
+        '/game/missions/side/overworld/overworld/pocketsandstorm/mission_ow_pocketsandstorm.mission_ow_pocketsandstorm_c': 'Pocket Sandstorm',
+        '/game/missions/side/overworld/overworld/thelegendarybow/mission_ow_thelegendarybow.mission_ow_thelegendarybow_c': 'Legendary Bow',
+        '/game/missions/side/overworld/overworld/visionofdeception/mission_ow_visionofdeception.mission_ow_visionofdeception_c': 'Lens of the Deceiver',
+        '/game/missions/side/zone_1/goblin/mission_murderhobos.mission_murderhobos_c': 'Non-Violent Offender',
+        '/game/missions/side/zone_1/goblin/mission_smithscharade.mission_smithscharade_c': 'Forgery',
+        '/game/missions/side/zone_1/hubtown/mission_innerdemons.mission_innerdemons_c': 'Inner Daemons',
+        '/game/missions/side/zone_1/intro/mission_ratquestpt1.mission_ratquestpt1_c': 'Goblins in the Garden',
+        '/game/missions/side/zone_1/intro/mission_ratquestpt2.mission_ratquestpt2_c': "A Farmer's Ardor",
+        '/game/missions/side/zone_1/mushroom/mission_blueones.mission_blueones_c': 'Little Boys Blue',
+        '/game/missions/side/zone_1/mushroom/mission_claptrapgrenade.mission_claptrapgrenade_c': "A Knight's Toil",
+        '/game/missions/side/zone_1/mushroom/mission_minstrelmetal.mission_minstrelmetal_c': 'Lyre and Brimstone',
+        '/game/missions/side/zone_1/mushroom/mission_toothfairy.mission_toothfairy_c': 'Cash 4 Teeth',
+        '/game/missions/side/zone_1/sewers/mission_cloggageofthedammed.mission_cloggageofthedammed_c': 'On the Wink of Destruction',
+        '/game/missions/side/zone_2/abyss/mission_curseofthetwistedsisters.mission_curseofthetwistedsisters_c': 'Of Curse and Claw',
+        '/game/missions/side/zone_2/abyss/mission_diplomacy.mission_diplomacy_c': 'Diplomatic Relations',
+        '/game/missions/side/zone_2/beanstalk/mission_derat.mission_derat_c': 'A Small Favor',
+        '/game/missions/side/zone_2/beanstalk/mission_elderwyvern.mission_elderwyvern_c': 'Burning Hunger',
+        '/game/missions/side/zone_2/beanstalk/mission_ronrivote.mission_ronrivote_c': 'Ron Rivote',
+        '/game/missions/side/zone_2/pirate/mission_jaggedtoothcrew.mission_jaggedtoothcrew_c': 'All Swashed Up',
+        '/game/missions/side/zone_2/pirate/mission_littlepookie.mission_littlepookie_c': 'A Walk to Dismember',
+        '/game/missions/side/zone_2/pirate/mission_piratelife.mission_piratelife_c': 'A Wandering Aye',
+        '/game/missions/side/zone_2/pirate/mission_whaletale.mission_whaletale_c': 'In the Belly Is a Beast',
+        '/game/missions/side/zone_2/seabed/mission_dyingwish.mission_dyingwish_c': 'Twenty Thousand Years Under the Sea',
+        '/game/missions/side/zone_2/seabed/mission_sharkpearls.mission_sharkpearls_c': 'Raiders of the Lost Shark',
+        '/game/missions/side/zone_3/climb/mission_ancientpowers.mission_ancientpowers_c': 'Ancient Powers',
+        '/game/missions/side/zone_3/climb/mission_ancientpowerscombat1.mission_ancientpowerscombat1_c': 'Ancient Powers (Part 2)',
+        '/game/missions/side/zone_3/climb/mission_ancientpowerscombat2.mission_ancientpowerscombat2_c': 'Ancient Powers (Part 3)',
+        '/game/missions/side/zone_3/climb/mission_ancientpowersdreadlord.mission_ancientpowersdreadlord_c': 'Ancient Powers (Part 4)',
+        '/game/missions/side/zone_3/climb/mission_ancientpowersdreadlordrepeatable.mission_ancientpowersdreadlordrepeatable_c': 'Ancient Powers (Part 5)',
+        '/game/missions/side/zone_3/climb/mission_lavagoodtime.mission_lavagoodtime_c': 'Spell to Pay',
+        '/game/missions/side/zone_3/climb/mission_monsterlover.mission_monsterlover_c': 'Necromance Her',
+        '/game/missions/side/zone_3/oasis/mission_lowtideboil.mission_lowtideboil_c': 'Gumbo No. 5',
+        '/game/missions/side/zone_3/sands/mission_bluehatcult.mission_bluehatcult_c': 'Armageddon Distracted',
+        '/game/missions/side/zone_3/sands/mission_elementalbeer.mission_elementalbeer_c': 'Hot Fizz',
+        '/game/patchdlc/indigo1/common/missions/mission_indigo_epilogue.mission_indigo_epilogue_c': "Vesper's Epilogue",
+        '/game/patchdlc/indigo1/common/missions/mission_indigo_firstwheeluse.mission_indigo_firstwheeluse_c': 'Meet the Wheel of Fate',
+        '/game/patchdlc/indigo1/common/missions/mission_plc_completion.mission_plc_completion_c': 'Nightmare in Dreamveil',
+        '/game/patchdlc/indigo1/missions/completionmission/mission_plc1_completionv1.mission_plc1_completionv1_c': 'Defeated Chums: Difficulty 1',
+        '/game/patchdlc/indigo1/missions/completionmission/mission_plc1_completionv2.mission_plc1_completionv2_c': 'Defeated Chums: Difficulty 2',
+        '/game/patchdlc/indigo1/missions/completionmission/mission_plc1_completionv3.mission_plc1_completionv3_c': 'Defeated Chums: Difficulty 3',
+        '/game/patchdlc/indigo1/missions/completionmission/mission_plc1_completionv4.mission_plc1_completionv4_c': 'Defeated Chums: Difficulty 4',
+        '/game/patchdlc/indigo1/missions/mission_plc1.mission_plc1_c': 'Best Chums',
+        '/game/patchdlc/indigo2/missions/mission_plc2.mission_plc2_c': 'Pesto Chango',
+        '/game/patchdlc/indigo2/missions/nonrepeatablemissions/mission_plc2_completionv1.mission_plc2_completionv1_c': 'Defeated Imelda: Difficulty 1',
+        '/game/patchdlc/indigo2/missions/nonrepeatablemissions/mission_plc2_completionv2.mission_plc2_completionv2_c': 'Defeated Imelda: Difficulty 2',
+        '/game/patchdlc/indigo2/missions/nonrepeatablemissions/mission_plc2_completionv3.mission_plc2_completionv3_c': 'Defeated Imelda: Difficulty 3',
+        '/game/patchdlc/indigo2/missions/nonrepeatablemissions/mission_plc2_completionv4.mission_plc2_completionv4_c': 'Defeated Imelda: Difficulty 4',
+        '/game/patchdlc/indigo3/missions/completionmissions/mission_plc3_completionv1.mission_plc3_completionv1_c': 'Defeated Fyodor: Difficulty 1',
+        '/game/patchdlc/indigo3/missions/completionmissions/mission_plc3_completionv2.mission_plc3_completionv2_c': 'Defeated Fyodor: Difficulty 2',
+        '/game/patchdlc/indigo3/missions/completionmissions/mission_plc3_completionv3.mission_plc3_completionv3_c': 'Defeated Fyodor: Difficulty 3',
+        '/game/patchdlc/indigo3/missions/completionmissions/mission_plc3_completionv4.mission_plc3_completionv4_c': 'Defeated Fyodor: Difficulty 4',
+        '/game/patchdlc/indigo3/missions/mission_plc3.mission_plc3_c': 'Puns and Crimeishment',
+        '/game/patchdlc/indigo3/missions/mission_plc3_3_1.mission_plc3_3_1_c': "Puns and Crimeishment: Misery's Mine",
+        '/game/patchdlc/indigo3/missions/mission_plc3_3_2.mission_plc3_3_2_c': 'Puns and Crimeishment: Crystal Chasm',
+        '/game/patchdlc/indigo3/missions/mission_plc3_3_3.mission_plc3_3_3_c': 'Puns and Crimeishment: Slammer Central',
+        '/game/patchdlc/indigo3/missions/mission_plc3_3_4.mission_plc3_3_4_c': 'Puns and Crimeishment: Firedeep Forge',
+        '/game/patchdlc/indigo4/missions/completionmissions/mission_plc4_completionv1.mission_plc4_completionv1_c': 'Defeated Redmourne: Difficulty 1',
+        '/game/patchdlc/indigo4/missions/completionmissions/mission_plc4_completionv2.mission_plc4_completionv2_c': 'Defeated Redmourne: Difficulty 2',
+        '/game/patchdlc/indigo4/missions/completionmissions/mission_plc4_completionv3.mission_plc4_completionv3_c': 'Defeated Redmourne: Difficulty 3',
+        '/game/patchdlc/indigo4/missions/completionmissions/mission_plc4_completionv4.mission_plc4_completionv4_c': 'Defeated Redmourne: Difficulty 4',
+        '/game/patchdlc/indigo4/missions/mission_plc4.mission_plc4_c': 'Outer Daemons',
+        })
+
+# English mission names to mission class paths
+name_to_mission = types.MappingProxyType({
+        "A Farmer's Ardor": '/Game/Missions/Side/Zone_1/Intro/Mission_RatQuestPt2.Mission_RatQuestPt2_C',
+        "A Hard Day's Knight": '/Game/Missions/Plot/Mission_Plot02.Mission_Plot02_C',
+        "A Knight's Toil": '/Game/Missions/Side/Zone_1/Mushroom/Mission_ClaptrapGrenade.Mission_ClaptrapGrenade_C',
+        "A Pet's Rest": '/Game/Missions/Side/Overworld/Overworld/CrabyThePet/Mission_OW_CrabyThePet.Mission_OW_CrabyThePet_C',
+        'A Realm in Peril': '/Game/Missions/Side/Overworld/Overworld/BlessedBeThySword/Mission_OW_BlessedBeThySword.Mission_OW_BlessedBeThySword_C',
+        'A Small Favor': '/Game/Missions/Side/Zone_2/Beanstalk/Mission_DeRat.Mission_DeRat_C',
+        'A Walk to Dismember': '/Game/Missions/Side/Zone_2/Pirate/Mission_LittlePookie.Mission_LittlePookie_C',
+        'A Wandering Aye': '/Game/Missions/Side/Zone_2/Pirate/MIssion_PirateLife.MIssion_PirateLife_C',
+        'Alchemy: Miracle Growth': '/Game/Missions/Side/Overworld/Overworld/AB2_MiracleGrow/Mission_OW_AB2_MiracleGrow.Mission_OW_AB2_MiracleGrow_C',
+        'Alchemy: Precious Metals': '/Game/Missions/Side/Overworld/Overworld/AB1_MinersProblem/Mission_OW_AB1_MinersProblem.Mission_OW_AB1_MinersProblem_C',
+        'Alchemy: To Block the Sun': '/Game/Missions/Side/Overworld/Overworld/AB3_SolarCream/Mission_OW_AB3_SolarCream.Mission_OW_AB3_SolarCream_C',
+        'All Swashed Up': '/Game/Missions/Side/Zone_2/Pirate/Mission_JaggedToothCrew.Mission_JaggedToothCrew_C',
+        'Ancient Powers': '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowers.Mission_AncientPowers_C',
+        'Ancient Powers (Part 2)': '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersCombat1.Mission_AncientPowersCombat1_C',
+        'Ancient Powers (Part 3)': '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersCombat2.Mission_AncientPowersCombat2_C',
+        'Ancient Powers (Part 4)': '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersDreadLord.Mission_AncientPowersDreadLord_C',
+        'Ancient Powers (Part 5)': '/Game/Missions/Side/Zone_3/Climb/Mission_AncientPowersDreadLordRepeatable.Mission_AncientPowersDreadLordRepeatable_C',
+        'Armageddon Distracted': '/Game/Missions/Side/Zone_3/Sands/Mission_BlueHatCult.Mission_BlueHatCult_C',
+        'Ballad of Bones': '/Game/Missions/Plot/Mission_Plot06.Mission_Plot06_C',
+        'Best Chums': '/Game/PatchDLC/Indigo1/Missions/Mission_PLC1.Mission_PLC1_C',
+        'Bunkers & Badasses': '/Game/Missions/Plot/Mission_Plot00.Mission_Plot00_C',
+        'Burning Hunger': '/Game/Missions/Side/Zone_2/Beanstalk/Mission_ElderWyvern.Mission_ElderWyvern_C',
+        'Cash 4 Teeth': '/Game/Missions/Side/Zone_1/Mushroom/Mission_ToothFairy.Mission_ToothFairy_C',
+        'Cheesy Pick-Up': '/Game/Missions/Side/Overworld/Overworld/ItFellFromTheSkies/Mission_OW_ItFellFromTheSkies.Mission_OW_ItFellFromTheSkies_C',
+        'Clerical Error': '/Game/Missions/Side/Overworld/Overworld/ClericallyLost/Mission_OW_ClericallyLost.Mission_OW_ClericallyLost_C',
+        'Defeated Chums: Difficulty 1': '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV1.Mission_PLC1_CompletionV1_C',
+        'Defeated Chums: Difficulty 2': '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV2.Mission_PLC1_CompletionV2_C',
+        'Defeated Chums: Difficulty 3': '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV3.Mission_PLC1_CompletionV3_C',
+        'Defeated Chums: Difficulty 4': '/Game/PatchDLC/Indigo1/Missions/CompletionMission/Mission_PLC1_CompletionV4.Mission_PLC1_CompletionV4_C',
+        'Defeated Fyodor: Difficulty 1': '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV1.Mission_PLC3_CompletionV1_C',
+        'Defeated Fyodor: Difficulty 2': '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV2.Mission_PLC3_CompletionV2_C',
+        'Defeated Fyodor: Difficulty 3': '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV3.Mission_PLC3_CompletionV3_C',
+        'Defeated Fyodor: Difficulty 4': '/Game/PatchDLC/Indigo3/Missions/CompletionMissions/Mission_PLC3_CompletionV4.Mission_PLC3_CompletionV4_C',
+        'Defeated Imelda: Difficulty 1': '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV1.Mission_PLC2_CompletionV1_C',
+        'Defeated Imelda: Difficulty 2': '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV2.Mission_PLC2_CompletionV2_C',
+        'Defeated Imelda: Difficulty 3': '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV3.Mission_PLC2_CompletionV3_C',
+        'Defeated Imelda: Difficulty 4': '/Game/PatchDLC/Indigo2/Missions/NonRepeatableMissions/Mission_PLC2_CompletionV4.Mission_PLC2_CompletionV4_C',
+        'Defeated Redmourne: Difficulty 1': '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV1.Mission_PLC4_CompletionV1_C',
+        'Defeated Redmourne: Difficulty 2': '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV2.Mission_PLC4_CompletionV2_C',
+        'Defeated Redmourne: Difficulty 3': '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV3.Mission_PLC4_CompletionV3_C',
+        'Defeated Redmourne: Difficulty 4': '/Game/PatchDLC/Indigo4/Missions/CompletionMissions/Mission_PLC4_CompletionV4.Mission_PLC4_CompletionV4_C',
+        'Destruction Rains from the Heavens': '/Game/Missions/Side/Overworld/Overworld/DestructionRainsFromTheHeaven/Mission_OW_DestructionRainsFromTheHeaven.Mission_OW_DestructionRainsFromTheHeaven_C',
+        'Diplomatic Relations': '/Game/Missions/Side/Zone_2/Abyss/Mission_Diplomacy.Mission_Diplomacy_C',
+        'Emotion of the Ocean': '/Game/Missions/Plot/Mission_Plot05.Mission_Plot05_C',
+        'Epilogue': '/Game/Missions/Plot/Mission_Plot11.Mission_Plot11_C',
+        'Eye Lost It': '/Game/Missions/Side/Overworld/Overworld/EyeLostIt/Mission_OW_EyeLostIt.Mission_OW_EyeLostIt_C',
+        'Fatebreaker': '/Game/Missions/Plot/Mission_Plot10.Mission_Plot10_C',
+        'Forgery': '/Game/Missions/Side/Zone_1/Goblin/Mission_SmithsCharade.Mission_SmithsCharade_C',
+        'Goblins Tired of Forced Oppression': '/Game/Missions/Major/Goblin/Mission_GTFO.Mission_GTFO_C',
+        'Goblins in the Garden': '/Game/Missions/Side/Zone_1/Intro/Mission_RatQuestPt1.Mission_RatQuestPt1_C',
+        'Gumbo No. 5': '/Game/Missions/Side/Zone_3/Oasis/Mission_LowTideBoil.Mission_LowTideBoil_C',
+        'Hero of Brighthoof': '/Game/Missions/Plot/Mission_Plot01.Mission_Plot01_C',
+        'Hot Fizz': '/Game/Missions/Side/Zone_3/Sands/Mission_ElementalBeer.Mission_ElementalBeer_C',
+        'In My Image': '/Game/Missions/Side/Overworld/Overworld/InMyImage/Mission_OW_InMyImage.Mission_OW_InMyImage_C',
+        'In the Belly Is a Beast': '/Game/Missions/Side/Zone_2/Pirate/Mission_WhaleTale.Mission_WhaleTale_C',
+        'Inner Daemons': '/Game/Missions/Side/Zone_1/Hubtown/Mission_InnerDemons.Mission_InnerDemons_C',
+        'Knife to Meet You': '/Game/Missions/Side/Overworld/Overworld/AKnifeAtTheirBacks/Mission_OW_AKnifeAtTheirBacks.Mission_OW_AKnifeAtTheirBacks_C',
+        'Legendary Bow': '/Game/Missions/Side/Overworld/Overworld/TheLegendaryBow/Mission_OW_TheLegendaryBow.Mission_OW_TheLegendaryBow_C',
+        'Lens of the Deceiver': '/Game/Missions/Side/Overworld/Overworld/VisionOfDeception/Mission_OW_VisionOfDeception.Mission_OW_VisionOfDeception_C',
+        'Little Boys Blue': '/Game/Missions/Side/Zone_1/Mushroom/Mission_BlueOnes.Mission_BlueOnes_C',
+        'Lyre and Brimstone': '/Game/Missions/Side/Zone_1/Mushroom/Mission_MinstrelMetal.Mission_MinstrelMetal_C',
+        'Meet the Wheel of Fate': '/Game/PatchDLC/Indigo1/Common/Missions/Mission_Indigo_FirstWheelUse.Mission_Indigo_FirstWheelUse_C',
+        'Mortal Coil': '/Game/Missions/Plot/Mission_Plot07.Mission_Plot07_C',
+        'Necromance Her': '/Game/Missions/Side/Zone_3/Climb/Mission_MonsterLover.Mission_MonsterLover_C',
+        'Nightmare in Dreamveil': '/Game/PatchDLC/Indigo1/Common/Missions/Mission_PLC_Completion.Mission_PLC_Completion_C',
+        'Non-Violent Offender': '/Game/Missions/Side/Zone_1/Goblin/Mission_MurderHobos.Mission_MurderHobos_C',
+        'Of Curse and Claw': '/Game/Missions/Side/Zone_2/Abyss/Mission_CurseOfTheTwistedSisters.Mission_CurseOfTheTwistedSisters_C',
+        'On Wings and Dreams': '/Game/Missions/Side/Overworld/Overworld/IBelieveIcanTouchTheSky/Mission_OW_IBelieveIcanTouchTheSky.Mission_OW_IBelieveIcanTouchTheSky_C',
+        'On the Wink of Destruction': '/Game/Missions/Side/Zone_1/Sewers/Mission_CloggageOfTheDammed.Mission_CloggageOfTheDammed_C',
+        'Outer Daemons': '/Game/PatchDLC/Indigo4/Missions/Mission_PLC4.Mission_PLC4_C',
+        'Pesto Chango': '/Game/PatchDLC/Indigo2/Missions/Mission_PLC2.Mission_PLC2_C',
+        'Pocket Sandstorm': '/Game/Missions/Side/Overworld/Overworld/PocketSandstorm/Mission_OW_PocketSandstorm.Mission_OW_PocketSandstorm_C',
+        'Puns and Crimeishment': '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3.Mission_PLC3_C',
+        'Puns and Crimeishment: Crystal Chasm': '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_2.Mission_PLC3_3_2_C',
+        'Puns and Crimeishment: Firedeep Forge': '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_4.Mission_PLC3_3_4_C',
+        "Puns and Crimeishment: Misery's Mine": '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_1.Mission_PLC3_3_1_C',
+        'Puns and Crimeishment: Slammer Central': '/Game/PatchDLC/Indigo3/Missions/Mission_PLC3_3_3.Mission_PLC3_3_3_C',
+        'Raiders of the Lost Shark': '/Game/Missions/Side/Zone_2/SeaBed/Mission_SharkPearls.Mission_SharkPearls_C',
+        'Ron Rivote': '/Game/Missions/Side/Zone_2/Beanstalk/Mission_RonRivote.Mission_RonRivote_C',
+        'Soul Purpose': '/Game/Missions/Plot/Mission_Plot09.Mission_Plot09_C',
+        'Spell to Pay': '/Game/Missions/Side/Zone_3/Climb/Mission_LavaGoodTime.Mission_LavaGoodTime_C',
+        'The Ditcher': '/Game/Missions/Major/Oasis/Mission_Doomed.Mission_Doomed_C',
+        'The Slayer of Vorcanar': '/Game/Missions/Major/Goblin/Mission_GTFOP2.Mission_GTFOP2_C',
+        'The Son of a Witch': '/Game/Missions/Plot/Mission_Plot08.Mission_Plot08_C',
+        'The Trial of Crooked-Eye Phil': '/Game/Missions/Major/Pirate/Mission_CrookedEyePhil.Mission_CrookedEyePhil_C',
+        'Thy Bard, with a Vengeance': '/Game/Missions/Plot/Mission_Plot04.Mission_Plot04_C',
+        'Twenty Thousand Years Under the Sea': '/Game/Missions/Side/Zone_2/SeaBed/Mission_DyingWish.Mission_DyingWish_C',
+        "Vesper's Epilogue": '/Game/PatchDLC/Indigo1/Common/Missions/Mission_Indigo_Epilogue.Mission_Indigo_Epilogue_C',
+        'Walk the Stalk': '/Game/Missions/Major/Beanstalk/Mission_Skybound.Mission_Skybound_C',
+        'Working Blueprint': '/Game/Missions/Side/Overworld/Overworld/FumblingAround/Mission_OW_FumblingAround.Mission_OW_FumblingAround_C',
+        })
+
+# Plot missions, lowercased
+plot_missions = frozenset([
+        '/game/missions/plot/mission_plot00.mission_plot00_c',
+        '/game/missions/plot/mission_plot01.mission_plot01_c',
+        '/game/missions/plot/mission_plot02.mission_plot02_c',
+        '/game/missions/plot/mission_plot04.mission_plot04_c',
+        '/game/missions/plot/mission_plot05.mission_plot05_c',
+        '/game/missions/plot/mission_plot06.mission_plot06_c',
+        '/game/missions/plot/mission_plot07.mission_plot07_c',
+        '/game/missions/plot/mission_plot08.mission_plot08_c',
+        '/game/missions/plot/mission_plot09.mission_plot09_c',
+        '/game/missions/plot/mission_plot10.mission_plot10_c',
+        '/game/missions/plot/mission_plot11.mission_plot11_c',
+        ])
+
+# Map names (as-is and lowercased) to English
+map_to_eng = types.MappingProxyType({
+        'AbyssBoss_P': 'The Godswell',
+        'Abyss_P': 'Drowned Abyss',
+        'Beanstalk_P': 'Tangledrift',
+        'Climb_P': "Karnok's Wall",
+        'D_LootRoom_P': 'Loot of Chaos',
+        'EndlessDungeon_P': 'The Chaos Chamber',
+        'Goblin_P': 'Mount Craw',
+        'Graveyard_P': 'Shattergrave Barrow',
+        'Hubtown_P': 'Brighthoof',
+        'Ind_CaravanHub_01_P': 'Dreamveil Overlook',
+        'Intro_P': "Queen's Gate",
+        'Mushroom_P': 'Weepwild Dankness',
+        'Oasis_P': 'Sunfang Oasis',
+        'Overworld_P': 'Overworld',
+        'Pirate_P': 'Crackmast Cove',
+        'PyramidBoss_P': 'Crest of Fate',
+        'Pyramid_P': 'The Fearamid',
+        'Sands_P': 'Ossu-Gol Necropolis',
+        'SeaBed_P': 'Wargtooth Shallows',
+        'Tutorial_P': 'Snoring Valley',
+        'abyss_p': 'Drowned Abyss',
+        'abyssboss_p': 'The Godswell',
+        'beanstalk_p': 'Tangledrift',
+        'climb_p': "Karnok's Wall",
+        'd_lootroom_p': 'Loot of Chaos',
+        'endlessdungeon_p': 'The Chaos Chamber',
+        'goblin_p': 'Mount Craw',
+        'graveyard_p': 'Shattergrave Barrow',
+        'hubtown_p': 'Brighthoof',
+        'ind_caravanhub_01_p': 'Dreamveil Overlook',
+        'intro_p': "Queen's Gate",
+        'mushroom_p': 'Weepwild Dankness',
+        'oasis_p': 'Sunfang Oasis',
+        'overworld_p': 'Overworld',
+        'pirate_p': 'Crackmast Cove',
+        'pyramid_p': 'The Fearamid',
+        'pyramidboss_p': 'Crest of Fate',
+        'sands_p': 'Ossu-Gol Necropolis',
+        'seabed_p': 'Wargtooth Shallows',
+        'tutorial_p': 'Snoring Valley',
+        })
+
+# English map names to map names
+eng_to_map = types.MappingProxyType({
+        'Brighthoof': 'Hubtown_P',
+        'Crackmast Cove': 'Pirate_P',
+        'Crest of Fate': 'PyramidBoss_P',
+        'Dreamveil Overlook': 'Ind_CaravanHub_01_P',
+        'Drowned Abyss': 'Abyss_P',
+        "Karnok's Wall": 'Climb_P',
+        'Loot of Chaos': 'D_LootRoom_P',
+        'Mount Craw': 'Goblin_P',
+        'Ossu-Gol Necropolis': 'Sands_P',
+        'Overworld': 'Overworld_P',
+        "Queen's Gate": 'Intro_P',
+        'Shattergrave Barrow': 'Graveyard_P',
+        'Snoring Valley': 'Tutorial_P',
+        'Sunfang Oasis': 'Oasis_P',
+        'Tangledrift': 'Beanstalk_P',
+        'The Chaos Chamber': 'EndlessDungeon_P',
+        'The Fearamid': 'Pyramid_P',
+        'The Godswell': 'AbyssBoss_P',
+        'Wargtooth Shallows': 'SeaBed_P',
+        'Weepwild Dankness': 'Mushroom_P',
+        })
+
+# Fast Travel stations (lowercased) to map names
+fts_to_map = types.MappingProxyType({
+        '/game/gamedata/fasttravel/fts_abyss_01.fts_abyss_01': 'Abyss_P',
+        '/game/gamedata/fasttravel/fts_abyss_02.fts_abyss_02': 'Abyss_P',
+        '/game/gamedata/fasttravel/fts_abyss_03.fts_abyss_03': 'Abyss_P',
+        '/game/gamedata/fasttravel/fts_abyssboss_01.fts_abyssboss_01': 'AbyssBoss_P',
+        '/game/gamedata/fasttravel/fts_abyssboss_02.fts_abyssboss_02': 'AbyssBoss_P',
+        '/game/gamedata/fasttravel/fts_beanstalk-sendonly.fts_beanstalk-sendonly': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/fts_beanstalk_01.fts_beanstalk_01': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/fts_beanstalk_02.fts_beanstalk_02': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/fts_beanstalk_03.fts_beanstalk_03': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/fts_climb_01.fts_climb_01': 'Climb_P',
+        '/game/gamedata/fasttravel/fts_climb_02.fts_climb_02': 'Climb_P',
+        '/game/gamedata/fasttravel/fts_climb_03.fts_climb_03': 'Climb_P',
+        '/game/gamedata/fasttravel/fts_dungeon.fts_dungeon': 'Overworld_P',
+        '/game/gamedata/fasttravel/fts_endlessdungeon.fts_endlessdungeon': 'EndlessDungeon_P',
+        '/game/gamedata/fasttravel/fts_goblin_01.fts_goblin_01': 'Goblin_P',
+        '/game/gamedata/fasttravel/fts_goblin_02.fts_goblin_02': 'Goblin_P',
+        '/game/gamedata/fasttravel/fts_goblin_03.fts_goblin_03': 'Goblin_P',
+        '/game/gamedata/fasttravel/fts_graveyard_01.fts_graveyard_01': 'Graveyard_P',
+        '/game/gamedata/fasttravel/fts_graveyard_02.fts_graveyard_02': 'Graveyard_P',
+        '/game/gamedata/fasttravel/fts_hubtown_01.fts_hubtown_01': 'Hubtown_P',
+        '/game/gamedata/fasttravel/fts_hubtown_02.fts_hubtown_02': 'Hubtown_P',
+        '/game/gamedata/fasttravel/fts_hubtown_03.fts_hubtown_03': 'Hubtown_P',
+        '/game/gamedata/fasttravel/fts_hubtown_04.fts_hubtown_04': 'Hubtown_P',
+        '/game/gamedata/fasttravel/fts_hubtown_05.fts_hubtown_05': 'Hubtown_P',
+        '/game/gamedata/fasttravel/fts_intro_01.fts_intro_01': 'Intro_P',
+        '/game/gamedata/fasttravel/fts_intro_02.fts_intro_02': 'Intro_P',
+        '/game/gamedata/fasttravel/fts_intro_03.fts_intro_03': 'Intro_P',
+        '/game/gamedata/fasttravel/fts_mushroom_01.fts_mushroom_01': 'Mushroom_P',
+        '/game/gamedata/fasttravel/fts_mushroom_02.fts_mushroom_02': 'Mushroom_P',
+        '/game/gamedata/fasttravel/fts_mushroom_03.fts_mushroom_03': 'Mushroom_P',
+        '/game/gamedata/fasttravel/fts_oasis_01.fts_oasis_01': 'Oasis_P',
+        '/game/gamedata/fasttravel/fts_oasis_02.fts_oasis_02': 'Oasis_P',
+        '/game/gamedata/fasttravel/fts_oasis_03.fts_oasis_03': 'Oasis_P',
+        '/game/gamedata/fasttravel/fts_overworld1.fts_overworld1': 'Overworld_P',
+        '/game/gamedata/fasttravel/fts_overworld2.fts_overworld2': 'Overworld_P',
+        '/game/gamedata/fasttravel/fts_overworld2a.fts_overworld2a': 'Overworld_P',
+        '/game/gamedata/fasttravel/fts_overworld3.fts_overworld3': 'Overworld_P',
+        '/game/gamedata/fasttravel/fts_pirate-sendonly.fts_pirate-sendonly': 'Pirate_P',
+        '/game/gamedata/fasttravel/fts_pirate_01.fts_pirate_01': 'Pirate_P',
+        '/game/gamedata/fasttravel/fts_pirate_02.fts_pirate_02': 'Pirate_P',
+        '/game/gamedata/fasttravel/fts_pirate_03.fts_pirate_03': 'Pirate_P',
+        '/game/gamedata/fasttravel/fts_pyramid_01.fts_pyramid_01': 'Pyramid_P',
+        '/game/gamedata/fasttravel/fts_pyramid_02.fts_pyramid_02': 'Pyramid_P',
+        '/game/gamedata/fasttravel/fts_pyramid_03.fts_pyramid_03': 'Pyramid_P',
+        '/game/gamedata/fasttravel/fts_pyramidboss-sendonly.fts_pyramidboss-sendonly': 'PyramidBoss_P',
+        '/game/gamedata/fasttravel/fts_pyramidboss.fts_pyramidboss': 'PyramidBoss_P',
+        '/game/gamedata/fasttravel/fts_sands_01.fts_sands_01': 'Sands_P',
+        '/game/gamedata/fasttravel/fts_sands_02.fts_sands_02': 'Sands_P',
+        '/game/gamedata/fasttravel/fts_sands_03.fts_sands_03': 'Sands_P',
+        '/game/gamedata/fasttravel/fts_seabed_01.fts_seabed_01': 'SeaBed_P',
+        '/game/gamedata/fasttravel/fts_seabed_02.fts_seabed_02': 'SeaBed_P',
+        '/game/gamedata/fasttravel/fts_seabed_03.fts_seabed_03': 'SeaBed_P',
+        '/game/gamedata/fasttravel/fts_tutorial_01.fts_tutorial_01': 'Tutorial_P',
+        '/game/gamedata/fasttravel/fts_tutorial_02.fts_tutorial_02': 'Tutorial_P',
+        '/game/gamedata/fasttravel/fts_tutorial_03.fts_tutorial_03': 'Tutorial_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyss_abyssboss.lts_abyss_abyssboss': 'Abyss_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyss_overworld.lts_abyss_overworld': 'Abyss_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyssboss_abyss.lts_abyssboss_abyss': 'AbyssBoss_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyssboss_overworld.lts_abyssboss_overworld': 'AbyssBoss_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_beanstalk_overworld.lts_beanstalk_overworld': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_climb_overworld.lts_climb_overworld': 'Climb_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_climb_overworld2.lts_climb_overworld2': 'Climb_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_endlessdungeon_hubtown.lts_endlessdungeon_hubtown': 'EndlessDungeon_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_endlessdungeon_lootroom.lts_endlessdungeon_lootroom': 'EndlessDungeon_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_goblin_overworld.lts_goblin_overworld': 'Goblin_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_graveyard_overworld.lts_graveyard_overworld': 'Graveyard_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_endlessdungeon.lts_hubtown_endlessdungeon': 'Hubtown_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_intro.lts_hubtown_intro': 'Hubtown_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_overworld.lts_hubtown_overworld': 'Hubtown_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_overworld2.lts_hubtown_overworld2': 'Hubtown_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_pyrboss.lts_hubtown_pyrboss': 'Hubtown_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtownportal.lts_hubtownportal': 'Hubtown_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_intro_hubtown.lts_intro_hubtown': 'Intro_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_intro_overworld.lts_intro_overworld': 'Intro_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_lootroom_endlessdungeon.lts_lootroom_endlessdungeon': 'D_LootRoom_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_mushroom_overworld.lts_mushroom_overworld': 'Mushroom_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_mushroom_seabed.lts_mushroom_seabed': 'Mushroom_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_oasis_overworld.lts_oasis_overworld': 'Oasis_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld2_climb.lts_overworld2_climb': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_abyss.lts_overworld_abyss': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_abyssboss.lts_overworld_abyssboss': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_beanstalk.lts_overworld_beanstalk': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_climb.lts_overworld_climb': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_goblin.lts_overworld_goblin': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_graveyard.lts_overworld_graveyard': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_hubtown.lts_overworld_hubtown': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_hubtown2.lts_overworld_hubtown2': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_intro.lts_overworld_intro': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_mushroom.lts_overworld_mushroom': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_oasis.lts_overworld_oasis': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_pirate.lts_overworld_pirate': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_pyramid.lts_overworld_pyramid': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_sands.lts_overworld_sands': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_sands2.lts_overworld_sands2': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_seabed.lts_overworld_seabed': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_seabed2.lts_overworld_seabed2': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_tutorial.lts_overworld_tutorial': 'Overworld_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pirate_overworld.lts_pirate_overworld': 'Pirate_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyramid_overworld.lts_pyramid_overworld': 'Pyramid_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyramid_pyramidboss.lts_pyramid_pyramidboss': 'Pyramid_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyramidboss_pyramid.lts_pyramidboss_pyramid': 'PyramidBoss_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyrboss_hubtown.lts_pyrboss_hubtown': 'PyramidBoss_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_sands2_overworld.lts_sands2_overworld': 'Sands_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_sands_overworld.lts_sands_overworld': 'Sands_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_seabed2_overworld.lts_seabed2_overworld': 'SeaBed_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_seabed_mushroom.lts_seabed_mushroom': 'SeaBed_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_seabed_overworld.lts_seabed_overworld': 'SeaBed_P',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_tutorial_overworld.lts_tutorial_overworld': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_13.rts_abyss_p_resurrecttravelstation_daffodil_13': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_2.rts_abyss_p_resurrecttravelstation_daffodil_2': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_3.rts_abyss_p_resurrecttravelstation_daffodil_3': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_4.rts_abyss_p_resurrecttravelstation_daffodil_4': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_5.rts_abyss_p_resurrecttravelstation_daffodil_5': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_6.rts_abyss_p_resurrecttravelstation_daffodil_6': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_7.rts_abyss_p_resurrecttravelstation_daffodil_7': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_9.rts_abyss_p_resurrecttravelstation_daffodil_9': 'Abyss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyssboss/rts_abyssboss_combat_7.rts_abyssboss_combat_7': 'AbyssBoss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_castle_resurrecttravelstation_daffodil_finalslide.rts_beanstalk_castle_resurrecttravelstation_daffodil_finalslide': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlefinale.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlefinale': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlemid.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlemid': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlestart.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlestart': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedral.rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedral': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedralreveal.rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedralreveal': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_derattop.rts_beanstalk_combat_resurrecttravelstation_daffodil_derattop': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_farm.rts_beanstalk_combat_resurrecttravelstation_daffodil_farm': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_firstslideending.rts_beanstalk_combat_resurrecttravelstation_daffodil_firstslideending': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthouse.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthouse': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal_0.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal_0': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_obeliskstart.rts_beanstalk_combat_resurrecttravelstation_daffodil_obeliskstart': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_combat_resurrecttravelstation_daffodil_ronrivote': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_townentrance.rts_beanstalk_combat_resurrecttravelstation_daffodil_townentrance': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_elderwyvern_resurrecttravelstation_daffodil_elderwyvernentrance.rts_beanstalk_geo_elderwyvern_resurrecttravelstation_daffodil_elderwyvernentrance': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_ronrivote_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_geo_ronrivote_resurrecttravelstation_daffodil_ronrivote': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_ronrivote_resurrecttravelstation_rr_insidecastle.rts_beanstalk_geo_ronrivote_resurrecttravelstation_rr_insidecastle': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_m_derat_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_m_derat_resurrecttravelstation_daffodil_ronrivote': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_m_elderwyvern_resurrecttravelstation_daffodil_3.rts_beanstalk_m_elderwyvern_resurrecttravelstation_daffodil_3': 'Beanstalk_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_m_ancientpowers_resurrecttravelstation_daffodil_5.rts_climb_m_ancientpowers_resurrecttravelstation_daffodil_5': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil.rts_climb_p_resurrecttravelstation_daffodil': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_0.rts_climb_p_resurrecttravelstation_daffodil_0': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_1.rts_climb_p_resurrecttravelstation_daffodil_1': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_10.rts_climb_p_resurrecttravelstation_daffodil_10': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_11.rts_climb_p_resurrecttravelstation_daffodil_11': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_14.rts_climb_p_resurrecttravelstation_daffodil_14': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_15.rts_climb_p_resurrecttravelstation_daffodil_15': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_2.rts_climb_p_resurrecttravelstation_daffodil_2': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_3.rts_climb_p_resurrecttravelstation_daffodil_3': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_4.rts_climb_p_resurrecttravelstation_daffodil_4': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_5.rts_climb_p_resurrecttravelstation_daffodil_5': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_6.rts_climb_p_resurrecttravelstation_daffodil_6': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_7.rts_climb_p_resurrecttravelstation_daffodil_7': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_8.rts_climb_p_resurrecttravelstation_daffodil_8': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_9.rts_climb_p_resurrecttravelstation_daffodil_9': 'Climb_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_10.rts_goblin_dynamic_10': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_11.rts_goblin_dynamic_11': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_12.rts_goblin_dynamic_12': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_13.rts_goblin_dynamic_13': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_14.rts_goblin_dynamic_14': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_15.rts_goblin_dynamic_15': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_16.rts_goblin_dynamic_16': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_17.rts_goblin_dynamic_17': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_18.rts_goblin_dynamic_18': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_19.rts_goblin_dynamic_19': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_20.rts_goblin_dynamic_20': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_3.rts_goblin_dynamic_3': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_0.rts_goblin_p_0': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_1.rts_goblin_p_1': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_2.rts_goblin_p_2': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_3.rts_goblin_p_3': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_4.rts_goblin_p_4': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_5.rts_goblin_p_5': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_6.rts_goblin_p_6': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_7.rts_goblin_p_7': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_8.rts_goblin_p_8': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_9.rts_goblin_p_9': 'Goblin_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_crypt_resurrecttravelstation_daffodil_11.rts_graveyard_blockout_crypt_resurrecttravelstation_daffodil_11': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_resurrecttravelstation_daffodil_2.rts_graveyard_blockout_resurrecttravelstation_daffodil_2': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_resurrecttravelstation_daffodil_3.rts_graveyard_blockout_resurrecttravelstation_daffodil_3': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_bossarena_resurrecttravelstation_daffodil_5.rts_graveyard_bossarena_resurrecttravelstation_daffodil_5': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_11.rts_graveyard_dynamic_resurrecttravelstation_daffodil_11': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_2.rts_graveyard_dynamic_resurrecttravelstation_daffodil_2': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_3.rts_graveyard_dynamic_resurrecttravelstation_daffodil_3': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_4.rts_graveyard_dynamic_resurrecttravelstation_daffodil_4': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_p_resurrecttravelstation_daffodil_2.rts_graveyard_p_resurrecttravelstation_daffodil_2': 'Graveyard_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_combat_resurrecttravelstation_daffodil_2.rts_hubtown_combat_resurrecttravelstation_daffodil_2': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_0.rts_hubtown_dynamic_resurrecttravelstation_daffodil_0': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_2.rts_hubtown_dynamic_resurrecttravelstation_daffodil_2': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_3.rts_hubtown_dynamic_resurrecttravelstation_daffodil_3': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_4.rts_hubtown_dynamic_resurrecttravelstation_daffodil_4': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_m_dockblocked_resurrecttravelstation_daffodil_4.rts_hubtown_m_dockblocked_resurrecttravelstation_daffodil_4': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_m_plot04_resurrecttravelstation_daffodil_4.rts_hubtown_m_plot04_resurrecttravelstation_daffodil_4': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_0.rts_hubtown_p_resurrecttravelstation_daffodil_0': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_1.rts_hubtown_p_resurrecttravelstation_daffodil_1': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_2.rts_hubtown_p_resurrecttravelstation_daffodil_2': 'Hubtown_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_0.rts_intro_dynamic_resurrecttravelstation_daffodil_0': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_1.rts_intro_dynamic_resurrecttravelstation_daffodil_1': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_2.rts_intro_dynamic_resurrecttravelstation_daffodil_2': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_3.rts_intro_dynamic_resurrecttravelstation_daffodil_3': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_4.rts_intro_dynamic_resurrecttravelstation_daffodil_4': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_5.rts_intro_dynamic_resurrecttravelstation_daffodil_5': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_6.rts_intro_dynamic_resurrecttravelstation_daffodil_6': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_7.rts_intro_dynamic_resurrecttravelstation_daffodil_7': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_8.rts_intro_dynamic_resurrecttravelstation_daffodil_8': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_9.rts_intro_dynamic_resurrecttravelstation_daffodil_9': 'Intro_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_0.rts_mushroom_dynamic_0': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_1.rts_mushroom_dynamic_1': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_2.rts_mushroom_dynamic_2': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_4.rts_mushroom_dynamic_4': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_6.rts_mushroom_dynamic_6': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_7.rts_mushroom_dynamic_7': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_0.rts_mushroom_p_0': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_1.rts_mushroom_p_1': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_2.rts_mushroom_p_2': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_3.rts_mushroom_p_3': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_4.rts_mushroom_p_4': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_5.rts_mushroom_p_5': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_6.rts_mushroom_p_6': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_7.rts_mushroom_p_7': 'Mushroom_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_0.rts_oasis_dynamic_resurrecttravelstation_daffodil_0': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_1.rts_oasis_dynamic_resurrecttravelstation_daffodil_1': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_10.rts_oasis_dynamic_resurrecttravelstation_daffodil_10': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_2.rts_oasis_dynamic_resurrecttravelstation_daffodil_2': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_3.rts_oasis_dynamic_resurrecttravelstation_daffodil_3': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_4.rts_oasis_dynamic_resurrecttravelstation_daffodil_4': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_5.rts_oasis_dynamic_resurrecttravelstation_daffodil_5': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_6.rts_oasis_dynamic_resurrecttravelstation_daffodil_6': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_7.rts_oasis_dynamic_resurrecttravelstation_daffodil_7': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_8.rts_oasis_dynamic_resurrecttravelstation_daffodil_8': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_9.rts_oasis_dynamic_resurrecttravelstation_daffodil_9': 'Oasis_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_1.rts_pirate_dynamic_resurrecttravelstation_daffodil_1': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_2.rts_pirate_dynamic_resurrecttravelstation_daffodil_2': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_3.rts_pirate_dynamic_resurrecttravelstation_daffodil_3': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_4.rts_pirate_dynamic_resurrecttravelstation_daffodil_4': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_5.rts_pirate_dynamic_resurrecttravelstation_daffodil_5': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_6.rts_pirate_dynamic_resurrecttravelstation_daffodil_6': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_7.rts_pirate_dynamic_resurrecttravelstation_daffodil_7': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_0.rts_pirate_p_resurrecttravelstation_daffodil_0': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_1.rts_pirate_p_resurrecttravelstation_daffodil_1': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_2.rts_pirate_p_resurrecttravelstation_daffodil_2': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_3.rts_pirate_p_resurrecttravelstation_daffodil_3': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_4.rts_pirate_p_resurrecttravelstation_daffodil_4': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_5.rts_pirate_p_resurrecttravelstation_daffodil_5': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_6.rts_pirate_p_resurrecttravelstation_daffodil_6': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_7.rts_pirate_p_resurrecttravelstation_daffodil_7': 'Pirate_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil.rts_pyramid_p_resurrecttravelstation_daffodil': 'Pyramid_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_0.rts_pyramid_p_resurrecttravelstation_daffodil_0': 'Pyramid_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_1.rts_pyramid_p_resurrecttravelstation_daffodil_1': 'Pyramid_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_3.rts_pyramid_p_resurrecttravelstation_daffodil_3': 'Pyramid_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_4.rts_pyramid_p_resurrecttravelstation_daffodil_4': 'Pyramid_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramidboss/rts_pyramidboss_dynamic_p_resurrecttravelstation_daffodil_0.rts_pyramidboss_dynamic_p_resurrecttravelstation_daffodil_0': 'PyramidBoss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramidboss/rts_pyramidboss_p_resurrecttravelstation_daffodil_0.rts_pyramidboss_p_resurrecttravelstation_daffodil_0': 'PyramidBoss_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_outpost_approach.rts_sands_dynamic_resurrecttravelstation_outpost_approach': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-basement.rts_sands_dynamic_resurrecttravelstation_slums-basement': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-blueh.rts_sands_dynamic_resurrecttravelstation_slums-blueh': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-blueh_0.rts_sands_dynamic_resurrecttravelstation_slums-blueh_0': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-fire.rts_sands_dynamic_resurrecttravelstation_slums-fire': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-gate.rts_sands_dynamic_resurrecttravelstation_slums-gate': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-ice.rts_sands_dynamic_resurrecttravelstation_slums-ice': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-ice_1.rts_sands_dynamic_resurrecttravelstation_slums-ice_1': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-tunnel.rts_sands_dynamic_resurrecttravelstation_slums-tunnel': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums_bluehat.rts_sands_dynamic_resurrecttravelstation_slums_bluehat': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums_wall.rts_sands_dynamic_resurrecttravelstation_slums_wall': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-downbeat.rts_sands_dynamic_resurrecttravelstation_under-downbeat': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-downbeat_2.rts_sands_dynamic_resurrecttravelstation_under-downbeat_2': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-obelisk.rts_sands_dynamic_resurrecttravelstation_under-obelisk': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-temple.rts_sands_dynamic_resurrecttravelstation_under-temple': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_m_plot09_travelstation_onetimeforcedteleport_2.rts_sands_m_plot09_travelstation_onetimeforcedteleport_2': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_m_plot09_travelstation_onetimeforcedteleport_5.rts_sands_m_plot09_travelstation_onetimeforcedteleport_5': 'Sands_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_boss_resurrecttravelstation_daffodil_2.rts_seabed_boss_resurrecttravelstation_daffodil_2': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_4.rts_seabed_combat_4': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_generouslyhighhalfheight.rts_seabed_combat_generouslyhighhalfheight': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_11.rts_seabed_combat_resurrecttravelstation_daffodil_11': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_15.rts_seabed_combat_resurrecttravelstation_daffodil_15': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_19.rts_seabed_combat_resurrecttravelstation_daffodil_19': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_3.rts_seabed_combat_resurrecttravelstation_daffodil_3': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_5.rts_seabed_combat_resurrecttravelstation_daffodil_5': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstationobjectdaff.rts_seabed_combat_resurrecttravelstationobjectdaff': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstationobjectdaff_0.rts_seabed_combat_resurrecttravelstationobjectdaff_0': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_intro_4.rts_seabed_geo_intro_4': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_0.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_0': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_1.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_1': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_3.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_3': 'SeaBed_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_0.rts_tutorial_geo_resurrecttravelstation_daffodil_0': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_1.rts_tutorial_geo_resurrecttravelstation_daffodil_1': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_2.rts_tutorial_geo_resurrecttravelstation_daffodil_2': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_3.rts_tutorial_geo_resurrecttravelstation_daffodil_3': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_0.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_0': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_2.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_2': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_3.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_3': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_4.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_4': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_0.rts_tutorial_p_resurrecttravelstation_daffodil_0': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_1.rts_tutorial_p_resurrecttravelstation_daffodil_1': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_2.rts_tutorial_p_resurrecttravelstation_daffodil_2': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_3.rts_tutorial_p_resurrecttravelstation_daffodil_3': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_4.rts_tutorial_p_resurrecttravelstation_daffodil_4': 'Tutorial_P',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_5.rts_tutorial_p_resurrecttravelstation_daffodil_5': 'Tutorial_P',
+        '/game/patchdlc/indigo1/gamedata/fasttravel/fts_caravanhub.fts_caravanhub': 'Ind_CaravanHub_01_P',
+        '/game/patchdlc/indigo1/gamedata/fasttravel/leveltravelstations/lts_caravanhub_overworld_overworld.lts_caravanhub_overworld_overworld': 'Ind_CaravanHub_01_P',
+        '/game/patchdlc/indigo1/gamedata/fasttravel/leveltravelstations/lts_overworld_caravanhub.lts_overworld_caravanhub': 'Overworld_P',
+        })
+
+# Fast Travel stations (lowercased) straight to English map names
+fts_to_eng = types.MappingProxyType({
+        '/game/gamedata/fasttravel/fts_abyss_01.fts_abyss_01': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/fts_abyss_02.fts_abyss_02': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/fts_abyss_03.fts_abyss_03': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/fts_abyssboss_01.fts_abyssboss_01': 'The Godswell',
+        '/game/gamedata/fasttravel/fts_abyssboss_02.fts_abyssboss_02': 'The Godswell',
+        '/game/gamedata/fasttravel/fts_beanstalk-sendonly.fts_beanstalk-sendonly': 'Tangledrift',
+        '/game/gamedata/fasttravel/fts_beanstalk_01.fts_beanstalk_01': 'Tangledrift',
+        '/game/gamedata/fasttravel/fts_beanstalk_02.fts_beanstalk_02': 'Tangledrift',
+        '/game/gamedata/fasttravel/fts_beanstalk_03.fts_beanstalk_03': 'Tangledrift',
+        '/game/gamedata/fasttravel/fts_climb_01.fts_climb_01': "Karnok's Wall",
+        '/game/gamedata/fasttravel/fts_climb_02.fts_climb_02': "Karnok's Wall",
+        '/game/gamedata/fasttravel/fts_climb_03.fts_climb_03': "Karnok's Wall",
+        '/game/gamedata/fasttravel/fts_dungeon.fts_dungeon': 'Overworld',
+        '/game/gamedata/fasttravel/fts_endlessdungeon.fts_endlessdungeon': 'The Chaos Chamber',
+        '/game/gamedata/fasttravel/fts_goblin_01.fts_goblin_01': 'Mount Craw',
+        '/game/gamedata/fasttravel/fts_goblin_02.fts_goblin_02': 'Mount Craw',
+        '/game/gamedata/fasttravel/fts_goblin_03.fts_goblin_03': 'Mount Craw',
+        '/game/gamedata/fasttravel/fts_graveyard_01.fts_graveyard_01': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/fts_graveyard_02.fts_graveyard_02': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/fts_hubtown_01.fts_hubtown_01': 'Brighthoof',
+        '/game/gamedata/fasttravel/fts_hubtown_02.fts_hubtown_02': 'Brighthoof',
+        '/game/gamedata/fasttravel/fts_hubtown_03.fts_hubtown_03': 'Brighthoof',
+        '/game/gamedata/fasttravel/fts_hubtown_04.fts_hubtown_04': 'Brighthoof',
+        '/game/gamedata/fasttravel/fts_hubtown_05.fts_hubtown_05': 'Brighthoof',
+        '/game/gamedata/fasttravel/fts_intro_01.fts_intro_01': "Queen's Gate",
+        '/game/gamedata/fasttravel/fts_intro_02.fts_intro_02': "Queen's Gate",
+        '/game/gamedata/fasttravel/fts_intro_03.fts_intro_03': "Queen's Gate",
+        '/game/gamedata/fasttravel/fts_mushroom_01.fts_mushroom_01': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/fts_mushroom_02.fts_mushroom_02': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/fts_mushroom_03.fts_mushroom_03': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/fts_oasis_01.fts_oasis_01': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/fts_oasis_02.fts_oasis_02': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/fts_oasis_03.fts_oasis_03': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/fts_overworld1.fts_overworld1': 'Overworld',
+        '/game/gamedata/fasttravel/fts_overworld2.fts_overworld2': 'Overworld',
+        '/game/gamedata/fasttravel/fts_overworld2a.fts_overworld2a': 'Overworld',
+        '/game/gamedata/fasttravel/fts_overworld3.fts_overworld3': 'Overworld',
+        '/game/gamedata/fasttravel/fts_pirate-sendonly.fts_pirate-sendonly': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/fts_pirate_01.fts_pirate_01': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/fts_pirate_02.fts_pirate_02': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/fts_pirate_03.fts_pirate_03': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/fts_pyramid_01.fts_pyramid_01': 'The Fearamid',
+        '/game/gamedata/fasttravel/fts_pyramid_02.fts_pyramid_02': 'The Fearamid',
+        '/game/gamedata/fasttravel/fts_pyramid_03.fts_pyramid_03': 'The Fearamid',
+        '/game/gamedata/fasttravel/fts_pyramidboss-sendonly.fts_pyramidboss-sendonly': 'Crest of Fate',
+        '/game/gamedata/fasttravel/fts_pyramidboss.fts_pyramidboss': 'Crest of Fate',
+        '/game/gamedata/fasttravel/fts_sands_01.fts_sands_01': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/fts_sands_02.fts_sands_02': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/fts_sands_03.fts_sands_03': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/fts_seabed_01.fts_seabed_01': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/fts_seabed_02.fts_seabed_02': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/fts_seabed_03.fts_seabed_03': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/fts_tutorial_01.fts_tutorial_01': 'Snoring Valley',
+        '/game/gamedata/fasttravel/fts_tutorial_02.fts_tutorial_02': 'Snoring Valley',
+        '/game/gamedata/fasttravel/fts_tutorial_03.fts_tutorial_03': 'Snoring Valley',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyss_abyssboss.lts_abyss_abyssboss': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyss_overworld.lts_abyss_overworld': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyssboss_abyss.lts_abyssboss_abyss': 'The Godswell',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_abyssboss_overworld.lts_abyssboss_overworld': 'The Godswell',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_beanstalk_overworld.lts_beanstalk_overworld': 'Tangledrift',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_climb_overworld.lts_climb_overworld': "Karnok's Wall",
+        '/game/gamedata/fasttravel/leveltravelstations/lts_climb_overworld2.lts_climb_overworld2': "Karnok's Wall",
+        '/game/gamedata/fasttravel/leveltravelstations/lts_endlessdungeon_hubtown.lts_endlessdungeon_hubtown': 'The Chaos Chamber',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_endlessdungeon_lootroom.lts_endlessdungeon_lootroom': 'The Chaos Chamber',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_goblin_overworld.lts_goblin_overworld': 'Mount Craw',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_graveyard_overworld.lts_graveyard_overworld': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_endlessdungeon.lts_hubtown_endlessdungeon': 'Brighthoof',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_intro.lts_hubtown_intro': 'Brighthoof',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_overworld.lts_hubtown_overworld': 'Brighthoof',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_overworld2.lts_hubtown_overworld2': 'Brighthoof',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_pyrboss.lts_hubtown_pyrboss': 'Brighthoof',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_hubtownportal.lts_hubtownportal': 'Brighthoof',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_intro_hubtown.lts_intro_hubtown': "Queen's Gate",
+        '/game/gamedata/fasttravel/leveltravelstations/lts_intro_overworld.lts_intro_overworld': "Queen's Gate",
+        '/game/gamedata/fasttravel/leveltravelstations/lts_lootroom_endlessdungeon.lts_lootroom_endlessdungeon': 'Loot of Chaos',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_mushroom_overworld.lts_mushroom_overworld': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_mushroom_seabed.lts_mushroom_seabed': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_oasis_overworld.lts_oasis_overworld': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld2_climb.lts_overworld2_climb': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_abyss.lts_overworld_abyss': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_abyssboss.lts_overworld_abyssboss': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_beanstalk.lts_overworld_beanstalk': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_climb.lts_overworld_climb': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_goblin.lts_overworld_goblin': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_graveyard.lts_overworld_graveyard': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_hubtown.lts_overworld_hubtown': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_hubtown2.lts_overworld_hubtown2': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_intro.lts_overworld_intro': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_mushroom.lts_overworld_mushroom': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_oasis.lts_overworld_oasis': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_pirate.lts_overworld_pirate': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_pyramid.lts_overworld_pyramid': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_sands.lts_overworld_sands': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_sands2.lts_overworld_sands2': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_seabed.lts_overworld_seabed': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_seabed2.lts_overworld_seabed2': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_tutorial.lts_overworld_tutorial': 'Overworld',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pirate_overworld.lts_pirate_overworld': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyramid_overworld.lts_pyramid_overworld': 'The Fearamid',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyramid_pyramidboss.lts_pyramid_pyramidboss': 'The Fearamid',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyramidboss_pyramid.lts_pyramidboss_pyramid': 'Crest of Fate',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_pyrboss_hubtown.lts_pyrboss_hubtown': 'Crest of Fate',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_sands2_overworld.lts_sands2_overworld': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_sands_overworld.lts_sands_overworld': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_seabed2_overworld.lts_seabed2_overworld': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_seabed_mushroom.lts_seabed_mushroom': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_seabed_overworld.lts_seabed_overworld': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/leveltravelstations/lts_tutorial_overworld.lts_tutorial_overworld': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_13.rts_abyss_p_resurrecttravelstation_daffodil_13': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_2.rts_abyss_p_resurrecttravelstation_daffodil_2': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_3.rts_abyss_p_resurrecttravelstation_daffodil_3': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_4.rts_abyss_p_resurrecttravelstation_daffodil_4': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_5.rts_abyss_p_resurrecttravelstation_daffodil_5': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_6.rts_abyss_p_resurrecttravelstation_daffodil_6': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_7.rts_abyss_p_resurrecttravelstation_daffodil_7': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_9.rts_abyss_p_resurrecttravelstation_daffodil_9': 'Drowned Abyss',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyssboss/rts_abyssboss_combat_7.rts_abyssboss_combat_7': 'The Godswell',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_castle_resurrecttravelstation_daffodil_finalslide.rts_beanstalk_castle_resurrecttravelstation_daffodil_finalslide': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlefinale.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlefinale': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlemid.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlemid': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlestart.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlestart': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedral.rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedral': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedralreveal.rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedralreveal': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_derattop.rts_beanstalk_combat_resurrecttravelstation_daffodil_derattop': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_farm.rts_beanstalk_combat_resurrecttravelstation_daffodil_farm': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_firstslideending.rts_beanstalk_combat_resurrecttravelstation_daffodil_firstslideending': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthouse.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthouse': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal_0.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal_0': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_obeliskstart.rts_beanstalk_combat_resurrecttravelstation_daffodil_obeliskstart': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_combat_resurrecttravelstation_daffodil_ronrivote': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_townentrance.rts_beanstalk_combat_resurrecttravelstation_daffodil_townentrance': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_elderwyvern_resurrecttravelstation_daffodil_elderwyvernentrance.rts_beanstalk_geo_elderwyvern_resurrecttravelstation_daffodil_elderwyvernentrance': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_ronrivote_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_geo_ronrivote_resurrecttravelstation_daffodil_ronrivote': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_ronrivote_resurrecttravelstation_rr_insidecastle.rts_beanstalk_geo_ronrivote_resurrecttravelstation_rr_insidecastle': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_m_derat_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_m_derat_resurrecttravelstation_daffodil_ronrivote': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_m_elderwyvern_resurrecttravelstation_daffodil_3.rts_beanstalk_m_elderwyvern_resurrecttravelstation_daffodil_3': 'Tangledrift',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_m_ancientpowers_resurrecttravelstation_daffodil_5.rts_climb_m_ancientpowers_resurrecttravelstation_daffodil_5': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil.rts_climb_p_resurrecttravelstation_daffodil': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_0.rts_climb_p_resurrecttravelstation_daffodil_0': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_1.rts_climb_p_resurrecttravelstation_daffodil_1': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_10.rts_climb_p_resurrecttravelstation_daffodil_10': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_11.rts_climb_p_resurrecttravelstation_daffodil_11': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_14.rts_climb_p_resurrecttravelstation_daffodil_14': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_15.rts_climb_p_resurrecttravelstation_daffodil_15': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_2.rts_climb_p_resurrecttravelstation_daffodil_2': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_3.rts_climb_p_resurrecttravelstation_daffodil_3': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_4.rts_climb_p_resurrecttravelstation_daffodil_4': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_5.rts_climb_p_resurrecttravelstation_daffodil_5': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_6.rts_climb_p_resurrecttravelstation_daffodil_6': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_7.rts_climb_p_resurrecttravelstation_daffodil_7': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_8.rts_climb_p_resurrecttravelstation_daffodil_8': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_9.rts_climb_p_resurrecttravelstation_daffodil_9': "Karnok's Wall",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_10.rts_goblin_dynamic_10': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_11.rts_goblin_dynamic_11': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_12.rts_goblin_dynamic_12': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_13.rts_goblin_dynamic_13': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_14.rts_goblin_dynamic_14': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_15.rts_goblin_dynamic_15': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_16.rts_goblin_dynamic_16': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_17.rts_goblin_dynamic_17': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_18.rts_goblin_dynamic_18': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_19.rts_goblin_dynamic_19': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_20.rts_goblin_dynamic_20': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_3.rts_goblin_dynamic_3': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_0.rts_goblin_p_0': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_1.rts_goblin_p_1': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_2.rts_goblin_p_2': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_3.rts_goblin_p_3': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_4.rts_goblin_p_4': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_5.rts_goblin_p_5': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_6.rts_goblin_p_6': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_7.rts_goblin_p_7': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_8.rts_goblin_p_8': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_9.rts_goblin_p_9': 'Mount Craw',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_crypt_resurrecttravelstation_daffodil_11.rts_graveyard_blockout_crypt_resurrecttravelstation_daffodil_11': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_resurrecttravelstation_daffodil_2.rts_graveyard_blockout_resurrecttravelstation_daffodil_2': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_resurrecttravelstation_daffodil_3.rts_graveyard_blockout_resurrecttravelstation_daffodil_3': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_bossarena_resurrecttravelstation_daffodil_5.rts_graveyard_bossarena_resurrecttravelstation_daffodil_5': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_11.rts_graveyard_dynamic_resurrecttravelstation_daffodil_11': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_2.rts_graveyard_dynamic_resurrecttravelstation_daffodil_2': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_3.rts_graveyard_dynamic_resurrecttravelstation_daffodil_3': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_4.rts_graveyard_dynamic_resurrecttravelstation_daffodil_4': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_p_resurrecttravelstation_daffodil_2.rts_graveyard_p_resurrecttravelstation_daffodil_2': 'Shattergrave Barrow',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_combat_resurrecttravelstation_daffodil_2.rts_hubtown_combat_resurrecttravelstation_daffodil_2': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_0.rts_hubtown_dynamic_resurrecttravelstation_daffodil_0': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_2.rts_hubtown_dynamic_resurrecttravelstation_daffodil_2': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_3.rts_hubtown_dynamic_resurrecttravelstation_daffodil_3': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_4.rts_hubtown_dynamic_resurrecttravelstation_daffodil_4': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_m_dockblocked_resurrecttravelstation_daffodil_4.rts_hubtown_m_dockblocked_resurrecttravelstation_daffodil_4': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_m_plot04_resurrecttravelstation_daffodil_4.rts_hubtown_m_plot04_resurrecttravelstation_daffodil_4': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_0.rts_hubtown_p_resurrecttravelstation_daffodil_0': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_1.rts_hubtown_p_resurrecttravelstation_daffodil_1': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_2.rts_hubtown_p_resurrecttravelstation_daffodil_2': 'Brighthoof',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_0.rts_intro_dynamic_resurrecttravelstation_daffodil_0': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_1.rts_intro_dynamic_resurrecttravelstation_daffodil_1': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_2.rts_intro_dynamic_resurrecttravelstation_daffodil_2': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_3.rts_intro_dynamic_resurrecttravelstation_daffodil_3': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_4.rts_intro_dynamic_resurrecttravelstation_daffodil_4': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_5.rts_intro_dynamic_resurrecttravelstation_daffodil_5': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_6.rts_intro_dynamic_resurrecttravelstation_daffodil_6': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_7.rts_intro_dynamic_resurrecttravelstation_daffodil_7': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_8.rts_intro_dynamic_resurrecttravelstation_daffodil_8': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_9.rts_intro_dynamic_resurrecttravelstation_daffodil_9': "Queen's Gate",
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_0.rts_mushroom_dynamic_0': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_1.rts_mushroom_dynamic_1': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_2.rts_mushroom_dynamic_2': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_4.rts_mushroom_dynamic_4': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_6.rts_mushroom_dynamic_6': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_7.rts_mushroom_dynamic_7': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_0.rts_mushroom_p_0': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_1.rts_mushroom_p_1': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_2.rts_mushroom_p_2': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_3.rts_mushroom_p_3': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_4.rts_mushroom_p_4': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_5.rts_mushroom_p_5': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_6.rts_mushroom_p_6': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_7.rts_mushroom_p_7': 'Weepwild Dankness',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_0.rts_oasis_dynamic_resurrecttravelstation_daffodil_0': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_1.rts_oasis_dynamic_resurrecttravelstation_daffodil_1': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_10.rts_oasis_dynamic_resurrecttravelstation_daffodil_10': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_2.rts_oasis_dynamic_resurrecttravelstation_daffodil_2': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_3.rts_oasis_dynamic_resurrecttravelstation_daffodil_3': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_4.rts_oasis_dynamic_resurrecttravelstation_daffodil_4': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_5.rts_oasis_dynamic_resurrecttravelstation_daffodil_5': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_6.rts_oasis_dynamic_resurrecttravelstation_daffodil_6': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_7.rts_oasis_dynamic_resurrecttravelstation_daffodil_7': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_8.rts_oasis_dynamic_resurrecttravelstation_daffodil_8': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_9.rts_oasis_dynamic_resurrecttravelstation_daffodil_9': 'Sunfang Oasis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_1.rts_pirate_dynamic_resurrecttravelstation_daffodil_1': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_2.rts_pirate_dynamic_resurrecttravelstation_daffodil_2': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_3.rts_pirate_dynamic_resurrecttravelstation_daffodil_3': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_4.rts_pirate_dynamic_resurrecttravelstation_daffodil_4': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_5.rts_pirate_dynamic_resurrecttravelstation_daffodil_5': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_6.rts_pirate_dynamic_resurrecttravelstation_daffodil_6': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_7.rts_pirate_dynamic_resurrecttravelstation_daffodil_7': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_0.rts_pirate_p_resurrecttravelstation_daffodil_0': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_1.rts_pirate_p_resurrecttravelstation_daffodil_1': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_2.rts_pirate_p_resurrecttravelstation_daffodil_2': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_3.rts_pirate_p_resurrecttravelstation_daffodil_3': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_4.rts_pirate_p_resurrecttravelstation_daffodil_4': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_5.rts_pirate_p_resurrecttravelstation_daffodil_5': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_6.rts_pirate_p_resurrecttravelstation_daffodil_6': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_7.rts_pirate_p_resurrecttravelstation_daffodil_7': 'Crackmast Cove',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil.rts_pyramid_p_resurrecttravelstation_daffodil': 'The Fearamid',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_0.rts_pyramid_p_resurrecttravelstation_daffodil_0': 'The Fearamid',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_1.rts_pyramid_p_resurrecttravelstation_daffodil_1': 'The Fearamid',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_3.rts_pyramid_p_resurrecttravelstation_daffodil_3': 'The Fearamid',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_4.rts_pyramid_p_resurrecttravelstation_daffodil_4': 'The Fearamid',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramidboss/rts_pyramidboss_dynamic_p_resurrecttravelstation_daffodil_0.rts_pyramidboss_dynamic_p_resurrecttravelstation_daffodil_0': 'Crest of Fate',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramidboss/rts_pyramidboss_p_resurrecttravelstation_daffodil_0.rts_pyramidboss_p_resurrecttravelstation_daffodil_0': 'Crest of Fate',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_outpost_approach.rts_sands_dynamic_resurrecttravelstation_outpost_approach': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-basement.rts_sands_dynamic_resurrecttravelstation_slums-basement': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-blueh.rts_sands_dynamic_resurrecttravelstation_slums-blueh': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-blueh_0.rts_sands_dynamic_resurrecttravelstation_slums-blueh_0': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-fire.rts_sands_dynamic_resurrecttravelstation_slums-fire': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-gate.rts_sands_dynamic_resurrecttravelstation_slums-gate': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-ice.rts_sands_dynamic_resurrecttravelstation_slums-ice': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-ice_1.rts_sands_dynamic_resurrecttravelstation_slums-ice_1': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-tunnel.rts_sands_dynamic_resurrecttravelstation_slums-tunnel': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums_bluehat.rts_sands_dynamic_resurrecttravelstation_slums_bluehat': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums_wall.rts_sands_dynamic_resurrecttravelstation_slums_wall': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-downbeat.rts_sands_dynamic_resurrecttravelstation_under-downbeat': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-downbeat_2.rts_sands_dynamic_resurrecttravelstation_under-downbeat_2': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-obelisk.rts_sands_dynamic_resurrecttravelstation_under-obelisk': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-temple.rts_sands_dynamic_resurrecttravelstation_under-temple': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_m_plot09_travelstation_onetimeforcedteleport_2.rts_sands_m_plot09_travelstation_onetimeforcedteleport_2': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_m_plot09_travelstation_onetimeforcedteleport_5.rts_sands_m_plot09_travelstation_onetimeforcedteleport_5': 'Ossu-Gol Necropolis',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_boss_resurrecttravelstation_daffodil_2.rts_seabed_boss_resurrecttravelstation_daffodil_2': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_4.rts_seabed_combat_4': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_generouslyhighhalfheight.rts_seabed_combat_generouslyhighhalfheight': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_11.rts_seabed_combat_resurrecttravelstation_daffodil_11': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_15.rts_seabed_combat_resurrecttravelstation_daffodil_15': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_19.rts_seabed_combat_resurrecttravelstation_daffodil_19': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_3.rts_seabed_combat_resurrecttravelstation_daffodil_3': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_5.rts_seabed_combat_resurrecttravelstation_daffodil_5': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstationobjectdaff.rts_seabed_combat_resurrecttravelstationobjectdaff': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstationobjectdaff_0.rts_seabed_combat_resurrecttravelstationobjectdaff_0': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_intro_4.rts_seabed_geo_intro_4': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_0.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_0': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_1.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_1': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_3.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_3': 'Wargtooth Shallows',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_0.rts_tutorial_geo_resurrecttravelstation_daffodil_0': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_1.rts_tutorial_geo_resurrecttravelstation_daffodil_1': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_2.rts_tutorial_geo_resurrecttravelstation_daffodil_2': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_3.rts_tutorial_geo_resurrecttravelstation_daffodil_3': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_0.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_0': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_2.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_2': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_3.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_3': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_4.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_4': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_0.rts_tutorial_p_resurrecttravelstation_daffodil_0': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_1.rts_tutorial_p_resurrecttravelstation_daffodil_1': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_2.rts_tutorial_p_resurrecttravelstation_daffodil_2': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_3.rts_tutorial_p_resurrecttravelstation_daffodil_3': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_4.rts_tutorial_p_resurrecttravelstation_daffodil_4': 'Snoring Valley',
+        '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_5.rts_tutorial_p_resurrecttravelstation_daffodil_5': 'Snoring Valley',
+        '/game/patchdlc/indigo1/gamedata/fasttravel/fts_caravanhub.fts_caravanhub': 'Dreamveil Overlook',
+        '/game/patchdlc/indigo1/gamedata/fasttravel/leveltravelstations/lts_caravanhub_overworld_overworld.lts_caravanhub_overworld_overworld': 'Dreamveil Overlook',
+        '/game/patchdlc/indigo1/gamedata/fasttravel/leveltravelstations/lts_overworld_caravanhub.lts_overworld_caravanhub': 'Overworld',
+        })
+
+# Map names to their Fast Travel stations (lowercased)
+map_to_fts = types.MappingProxyType({
+        'AbyssBoss_P': ('/game/gamedata/fasttravel/fts_abyssboss_01.fts_abyssboss_01', '/game/gamedata/fasttravel/fts_abyssboss_02.fts_abyssboss_02', '/game/gamedata/fasttravel/leveltravelstations/lts_abyssboss_abyss.lts_abyssboss_abyss', '/game/gamedata/fasttravel/leveltravelstations/lts_abyssboss_overworld.lts_abyssboss_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyssboss/rts_abyssboss_combat_7.rts_abyssboss_combat_7'),
+        'Abyss_P': ('/game/gamedata/fasttravel/fts_abyss_01.fts_abyss_01', '/game/gamedata/fasttravel/fts_abyss_02.fts_abyss_02', '/game/gamedata/fasttravel/fts_abyss_03.fts_abyss_03', '/game/gamedata/fasttravel/leveltravelstations/lts_abyss_abyssboss.lts_abyss_abyssboss', '/game/gamedata/fasttravel/leveltravelstations/lts_abyss_overworld.lts_abyss_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_13.rts_abyss_p_resurrecttravelstation_daffodil_13', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_2.rts_abyss_p_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_3.rts_abyss_p_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_4.rts_abyss_p_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_5.rts_abyss_p_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_6.rts_abyss_p_resurrecttravelstation_daffodil_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_7.rts_abyss_p_resurrecttravelstation_daffodil_7', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/abyss/rts_abyss_p_resurrecttravelstation_daffodil_9.rts_abyss_p_resurrecttravelstation_daffodil_9'),
+        'Beanstalk_P': ('/game/gamedata/fasttravel/fts_beanstalk-sendonly.fts_beanstalk-sendonly', '/game/gamedata/fasttravel/fts_beanstalk_01.fts_beanstalk_01', '/game/gamedata/fasttravel/fts_beanstalk_02.fts_beanstalk_02', '/game/gamedata/fasttravel/fts_beanstalk_03.fts_beanstalk_03', '/game/gamedata/fasttravel/leveltravelstations/lts_beanstalk_overworld.lts_beanstalk_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_castle_resurrecttravelstation_daffodil_finalslide.rts_beanstalk_castle_resurrecttravelstation_daffodil_finalslide', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlefinale.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlefinale', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlemid.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlemid', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_castlestart.rts_beanstalk_combat_resurrecttravelstation_daffodil_castlestart', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedral.rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedral', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedralreveal.rts_beanstalk_combat_resurrecttravelstation_daffodil_cathedralreveal', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_derattop.rts_beanstalk_combat_resurrecttravelstation_daffodil_derattop', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_farm.rts_beanstalk_combat_resurrecttravelstation_daffodil_farm', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_firstslideending.rts_beanstalk_combat_resurrecttravelstation_daffodil_firstslideending', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthouse.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthouse', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal_0.rts_beanstalk_combat_resurrecttravelstation_daffodil_lighthousereveal_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_obeliskstart.rts_beanstalk_combat_resurrecttravelstation_daffodil_obeliskstart', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_combat_resurrecttravelstation_daffodil_ronrivote', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_combat_resurrecttravelstation_daffodil_townentrance.rts_beanstalk_combat_resurrecttravelstation_daffodil_townentrance', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_elderwyvern_resurrecttravelstation_daffodil_elderwyvernentrance.rts_beanstalk_geo_elderwyvern_resurrecttravelstation_daffodil_elderwyvernentrance', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_ronrivote_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_geo_ronrivote_resurrecttravelstation_daffodil_ronrivote', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_geo_ronrivote_resurrecttravelstation_rr_insidecastle.rts_beanstalk_geo_ronrivote_resurrecttravelstation_rr_insidecastle', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_m_derat_resurrecttravelstation_daffodil_ronrivote.rts_beanstalk_m_derat_resurrecttravelstation_daffodil_ronrivote', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/beanstalk/rts_beanstalk_m_elderwyvern_resurrecttravelstation_daffodil_3.rts_beanstalk_m_elderwyvern_resurrecttravelstation_daffodil_3'),
+        'Climb_P': ('/game/gamedata/fasttravel/fts_climb_01.fts_climb_01', '/game/gamedata/fasttravel/fts_climb_02.fts_climb_02', '/game/gamedata/fasttravel/fts_climb_03.fts_climb_03', '/game/gamedata/fasttravel/leveltravelstations/lts_climb_overworld.lts_climb_overworld', '/game/gamedata/fasttravel/leveltravelstations/lts_climb_overworld2.lts_climb_overworld2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_m_ancientpowers_resurrecttravelstation_daffodil_5.rts_climb_m_ancientpowers_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil.rts_climb_p_resurrecttravelstation_daffodil', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_0.rts_climb_p_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_1.rts_climb_p_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_10.rts_climb_p_resurrecttravelstation_daffodil_10', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_11.rts_climb_p_resurrecttravelstation_daffodil_11', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_14.rts_climb_p_resurrecttravelstation_daffodil_14', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_15.rts_climb_p_resurrecttravelstation_daffodil_15', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_2.rts_climb_p_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_3.rts_climb_p_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_4.rts_climb_p_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_5.rts_climb_p_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_6.rts_climb_p_resurrecttravelstation_daffodil_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_7.rts_climb_p_resurrecttravelstation_daffodil_7', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_8.rts_climb_p_resurrecttravelstation_daffodil_8', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/climb/rts_climb_p_resurrecttravelstation_daffodil_9.rts_climb_p_resurrecttravelstation_daffodil_9'),
+        'D_LootRoom_P': ('/game/gamedata/fasttravel/leveltravelstations/lts_lootroom_endlessdungeon.lts_lootroom_endlessdungeon',),
+        'EndlessDungeon_P': ('/game/gamedata/fasttravel/fts_endlessdungeon.fts_endlessdungeon', '/game/gamedata/fasttravel/leveltravelstations/lts_endlessdungeon_hubtown.lts_endlessdungeon_hubtown', '/game/gamedata/fasttravel/leveltravelstations/lts_endlessdungeon_lootroom.lts_endlessdungeon_lootroom'),
+        'Goblin_P': ('/game/gamedata/fasttravel/fts_goblin_01.fts_goblin_01', '/game/gamedata/fasttravel/fts_goblin_02.fts_goblin_02', '/game/gamedata/fasttravel/fts_goblin_03.fts_goblin_03', '/game/gamedata/fasttravel/leveltravelstations/lts_goblin_overworld.lts_goblin_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_10.rts_goblin_dynamic_10', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_11.rts_goblin_dynamic_11', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_12.rts_goblin_dynamic_12', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_13.rts_goblin_dynamic_13', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_14.rts_goblin_dynamic_14', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_15.rts_goblin_dynamic_15', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_16.rts_goblin_dynamic_16', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_17.rts_goblin_dynamic_17', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_18.rts_goblin_dynamic_18', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_19.rts_goblin_dynamic_19', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_20.rts_goblin_dynamic_20', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_dynamic_3.rts_goblin_dynamic_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_0.rts_goblin_p_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_1.rts_goblin_p_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_2.rts_goblin_p_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_3.rts_goblin_p_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_4.rts_goblin_p_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_5.rts_goblin_p_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_6.rts_goblin_p_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_7.rts_goblin_p_7', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_8.rts_goblin_p_8', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/goblin/rts_goblin_p_9.rts_goblin_p_9'),
+        'Graveyard_P': ('/game/gamedata/fasttravel/fts_graveyard_01.fts_graveyard_01', '/game/gamedata/fasttravel/fts_graveyard_02.fts_graveyard_02', '/game/gamedata/fasttravel/leveltravelstations/lts_graveyard_overworld.lts_graveyard_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_crypt_resurrecttravelstation_daffodil_11.rts_graveyard_blockout_crypt_resurrecttravelstation_daffodil_11', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_resurrecttravelstation_daffodil_2.rts_graveyard_blockout_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_blockout_resurrecttravelstation_daffodil_3.rts_graveyard_blockout_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_bossarena_resurrecttravelstation_daffodil_5.rts_graveyard_bossarena_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_11.rts_graveyard_dynamic_resurrecttravelstation_daffodil_11', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_2.rts_graveyard_dynamic_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_3.rts_graveyard_dynamic_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_dynamic_resurrecttravelstation_daffodil_4.rts_graveyard_dynamic_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/graveyard/rts_graveyard_p_resurrecttravelstation_daffodil_2.rts_graveyard_p_resurrecttravelstation_daffodil_2'),
+        'Hubtown_P': ('/game/gamedata/fasttravel/fts_hubtown_01.fts_hubtown_01', '/game/gamedata/fasttravel/fts_hubtown_02.fts_hubtown_02', '/game/gamedata/fasttravel/fts_hubtown_03.fts_hubtown_03', '/game/gamedata/fasttravel/fts_hubtown_04.fts_hubtown_04', '/game/gamedata/fasttravel/fts_hubtown_05.fts_hubtown_05', '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_endlessdungeon.lts_hubtown_endlessdungeon', '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_intro.lts_hubtown_intro', '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_overworld.lts_hubtown_overworld', '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_overworld2.lts_hubtown_overworld2', '/game/gamedata/fasttravel/leveltravelstations/lts_hubtown_pyrboss.lts_hubtown_pyrboss', '/game/gamedata/fasttravel/leveltravelstations/lts_hubtownportal.lts_hubtownportal', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_combat_resurrecttravelstation_daffodil_2.rts_hubtown_combat_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_0.rts_hubtown_dynamic_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_2.rts_hubtown_dynamic_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_3.rts_hubtown_dynamic_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_dynamic_resurrecttravelstation_daffodil_4.rts_hubtown_dynamic_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_m_dockblocked_resurrecttravelstation_daffodil_4.rts_hubtown_m_dockblocked_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_m_plot04_resurrecttravelstation_daffodil_4.rts_hubtown_m_plot04_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_0.rts_hubtown_p_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_1.rts_hubtown_p_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/hubtown/rts_hubtown_p_resurrecttravelstation_daffodil_2.rts_hubtown_p_resurrecttravelstation_daffodil_2'),
+        'Ind_CaravanHub_01_P': ('/game/patchdlc/indigo1/gamedata/fasttravel/fts_caravanhub.fts_caravanhub', '/game/patchdlc/indigo1/gamedata/fasttravel/leveltravelstations/lts_caravanhub_overworld_overworld.lts_caravanhub_overworld_overworld'),
+        'Intro_P': ('/game/gamedata/fasttravel/fts_intro_01.fts_intro_01', '/game/gamedata/fasttravel/fts_intro_02.fts_intro_02', '/game/gamedata/fasttravel/fts_intro_03.fts_intro_03', '/game/gamedata/fasttravel/leveltravelstations/lts_intro_hubtown.lts_intro_hubtown', '/game/gamedata/fasttravel/leveltravelstations/lts_intro_overworld.lts_intro_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_0.rts_intro_dynamic_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_1.rts_intro_dynamic_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_2.rts_intro_dynamic_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_3.rts_intro_dynamic_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_4.rts_intro_dynamic_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_5.rts_intro_dynamic_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_6.rts_intro_dynamic_resurrecttravelstation_daffodil_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_7.rts_intro_dynamic_resurrecttravelstation_daffodil_7', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_8.rts_intro_dynamic_resurrecttravelstation_daffodil_8', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/intro/rts_intro_dynamic_resurrecttravelstation_daffodil_9.rts_intro_dynamic_resurrecttravelstation_daffodil_9'),
+        'Mushroom_P': ('/game/gamedata/fasttravel/fts_mushroom_01.fts_mushroom_01', '/game/gamedata/fasttravel/fts_mushroom_02.fts_mushroom_02', '/game/gamedata/fasttravel/fts_mushroom_03.fts_mushroom_03', '/game/gamedata/fasttravel/leveltravelstations/lts_mushroom_overworld.lts_mushroom_overworld', '/game/gamedata/fasttravel/leveltravelstations/lts_mushroom_seabed.lts_mushroom_seabed', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_0.rts_mushroom_dynamic_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_1.rts_mushroom_dynamic_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_2.rts_mushroom_dynamic_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_4.rts_mushroom_dynamic_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_6.rts_mushroom_dynamic_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_dynamic_7.rts_mushroom_dynamic_7', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_0.rts_mushroom_p_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_1.rts_mushroom_p_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_2.rts_mushroom_p_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_3.rts_mushroom_p_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_4.rts_mushroom_p_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_5.rts_mushroom_p_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_6.rts_mushroom_p_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/mushroom/rts_mushroom_p_7.rts_mushroom_p_7'),
+        'Oasis_P': ('/game/gamedata/fasttravel/fts_oasis_01.fts_oasis_01', '/game/gamedata/fasttravel/fts_oasis_02.fts_oasis_02', '/game/gamedata/fasttravel/fts_oasis_03.fts_oasis_03', '/game/gamedata/fasttravel/leveltravelstations/lts_oasis_overworld.lts_oasis_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_0.rts_oasis_dynamic_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_1.rts_oasis_dynamic_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_10.rts_oasis_dynamic_resurrecttravelstation_daffodil_10', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_2.rts_oasis_dynamic_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_3.rts_oasis_dynamic_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_4.rts_oasis_dynamic_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_5.rts_oasis_dynamic_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_6.rts_oasis_dynamic_resurrecttravelstation_daffodil_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_7.rts_oasis_dynamic_resurrecttravelstation_daffodil_7', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_8.rts_oasis_dynamic_resurrecttravelstation_daffodil_8', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/oasis/rts_oasis_dynamic_resurrecttravelstation_daffodil_9.rts_oasis_dynamic_resurrecttravelstation_daffodil_9'),
+        'Overworld_P': ('/game/gamedata/fasttravel/fts_dungeon.fts_dungeon', '/game/gamedata/fasttravel/fts_overworld1.fts_overworld1', '/game/gamedata/fasttravel/fts_overworld2.fts_overworld2', '/game/gamedata/fasttravel/fts_overworld2a.fts_overworld2a', '/game/gamedata/fasttravel/fts_overworld3.fts_overworld3', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld2_climb.lts_overworld2_climb', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_abyss.lts_overworld_abyss', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_abyssboss.lts_overworld_abyssboss', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_beanstalk.lts_overworld_beanstalk', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_climb.lts_overworld_climb', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_goblin.lts_overworld_goblin', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_graveyard.lts_overworld_graveyard', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_hubtown.lts_overworld_hubtown', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_hubtown2.lts_overworld_hubtown2', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_intro.lts_overworld_intro', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_mushroom.lts_overworld_mushroom', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_oasis.lts_overworld_oasis', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_pirate.lts_overworld_pirate', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_pyramid.lts_overworld_pyramid', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_sands.lts_overworld_sands', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_sands2.lts_overworld_sands2', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_seabed.lts_overworld_seabed', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_seabed2.lts_overworld_seabed2', '/game/gamedata/fasttravel/leveltravelstations/lts_overworld_tutorial.lts_overworld_tutorial', '/game/patchdlc/indigo1/gamedata/fasttravel/leveltravelstations/lts_overworld_caravanhub.lts_overworld_caravanhub'),
+        'Pirate_P': ('/game/gamedata/fasttravel/fts_pirate-sendonly.fts_pirate-sendonly', '/game/gamedata/fasttravel/fts_pirate_01.fts_pirate_01', '/game/gamedata/fasttravel/fts_pirate_02.fts_pirate_02', '/game/gamedata/fasttravel/fts_pirate_03.fts_pirate_03', '/game/gamedata/fasttravel/leveltravelstations/lts_pirate_overworld.lts_pirate_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_1.rts_pirate_dynamic_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_2.rts_pirate_dynamic_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_3.rts_pirate_dynamic_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_4.rts_pirate_dynamic_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_5.rts_pirate_dynamic_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_6.rts_pirate_dynamic_resurrecttravelstation_daffodil_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_dynamic_resurrecttravelstation_daffodil_7.rts_pirate_dynamic_resurrecttravelstation_daffodil_7', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_0.rts_pirate_p_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_1.rts_pirate_p_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_2.rts_pirate_p_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_3.rts_pirate_p_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_4.rts_pirate_p_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_5.rts_pirate_p_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_6.rts_pirate_p_resurrecttravelstation_daffodil_6', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pirate/rts_pirate_p_resurrecttravelstation_daffodil_7.rts_pirate_p_resurrecttravelstation_daffodil_7'),
+        'PyramidBoss_P': ('/game/gamedata/fasttravel/fts_pyramidboss-sendonly.fts_pyramidboss-sendonly', '/game/gamedata/fasttravel/fts_pyramidboss.fts_pyramidboss', '/game/gamedata/fasttravel/leveltravelstations/lts_pyramidboss_pyramid.lts_pyramidboss_pyramid', '/game/gamedata/fasttravel/leveltravelstations/lts_pyrboss_hubtown.lts_pyrboss_hubtown', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramidboss/rts_pyramidboss_dynamic_p_resurrecttravelstation_daffodil_0.rts_pyramidboss_dynamic_p_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramidboss/rts_pyramidboss_p_resurrecttravelstation_daffodil_0.rts_pyramidboss_p_resurrecttravelstation_daffodil_0'),
+        'Pyramid_P': ('/game/gamedata/fasttravel/fts_pyramid_01.fts_pyramid_01', '/game/gamedata/fasttravel/fts_pyramid_02.fts_pyramid_02', '/game/gamedata/fasttravel/fts_pyramid_03.fts_pyramid_03', '/game/gamedata/fasttravel/leveltravelstations/lts_pyramid_overworld.lts_pyramid_overworld', '/game/gamedata/fasttravel/leveltravelstations/lts_pyramid_pyramidboss.lts_pyramid_pyramidboss', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil.rts_pyramid_p_resurrecttravelstation_daffodil', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_0.rts_pyramid_p_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_1.rts_pyramid_p_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_3.rts_pyramid_p_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/pyramid/rts_pyramid_p_resurrecttravelstation_daffodil_4.rts_pyramid_p_resurrecttravelstation_daffodil_4'),
+        'Sands_P': ('/game/gamedata/fasttravel/fts_sands_01.fts_sands_01', '/game/gamedata/fasttravel/fts_sands_02.fts_sands_02', '/game/gamedata/fasttravel/fts_sands_03.fts_sands_03', '/game/gamedata/fasttravel/leveltravelstations/lts_sands2_overworld.lts_sands2_overworld', '/game/gamedata/fasttravel/leveltravelstations/lts_sands_overworld.lts_sands_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_outpost_approach.rts_sands_dynamic_resurrecttravelstation_outpost_approach', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-basement.rts_sands_dynamic_resurrecttravelstation_slums-basement', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-blueh.rts_sands_dynamic_resurrecttravelstation_slums-blueh', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-blueh_0.rts_sands_dynamic_resurrecttravelstation_slums-blueh_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-fire.rts_sands_dynamic_resurrecttravelstation_slums-fire', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-gate.rts_sands_dynamic_resurrecttravelstation_slums-gate', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-ice.rts_sands_dynamic_resurrecttravelstation_slums-ice', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-ice_1.rts_sands_dynamic_resurrecttravelstation_slums-ice_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums-tunnel.rts_sands_dynamic_resurrecttravelstation_slums-tunnel', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums_bluehat.rts_sands_dynamic_resurrecttravelstation_slums_bluehat', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_slums_wall.rts_sands_dynamic_resurrecttravelstation_slums_wall', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-downbeat.rts_sands_dynamic_resurrecttravelstation_under-downbeat', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-downbeat_2.rts_sands_dynamic_resurrecttravelstation_under-downbeat_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-obelisk.rts_sands_dynamic_resurrecttravelstation_under-obelisk', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_dynamic_resurrecttravelstation_under-temple.rts_sands_dynamic_resurrecttravelstation_under-temple', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_m_plot09_travelstation_onetimeforcedteleport_2.rts_sands_m_plot09_travelstation_onetimeforcedteleport_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/sands/rts_sands_m_plot09_travelstation_onetimeforcedteleport_5.rts_sands_m_plot09_travelstation_onetimeforcedteleport_5'),
+        'SeaBed_P': ('/game/gamedata/fasttravel/fts_seabed_01.fts_seabed_01', '/game/gamedata/fasttravel/fts_seabed_02.fts_seabed_02', '/game/gamedata/fasttravel/fts_seabed_03.fts_seabed_03', '/game/gamedata/fasttravel/leveltravelstations/lts_seabed2_overworld.lts_seabed2_overworld', '/game/gamedata/fasttravel/leveltravelstations/lts_seabed_mushroom.lts_seabed_mushroom', '/game/gamedata/fasttravel/leveltravelstations/lts_seabed_overworld.lts_seabed_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_boss_resurrecttravelstation_daffodil_2.rts_seabed_boss_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_4.rts_seabed_combat_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_generouslyhighhalfheight.rts_seabed_combat_generouslyhighhalfheight', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_11.rts_seabed_combat_resurrecttravelstation_daffodil_11', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_15.rts_seabed_combat_resurrecttravelstation_daffodil_15', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_19.rts_seabed_combat_resurrecttravelstation_daffodil_19', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_3.rts_seabed_combat_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstation_daffodil_5.rts_seabed_combat_resurrecttravelstation_daffodil_5', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstationobjectdaff.rts_seabed_combat_resurrecttravelstationobjectdaff', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_combat_resurrecttravelstationobjectdaff_0.rts_seabed_combat_resurrecttravelstationobjectdaff_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_intro_4.rts_seabed_geo_intro_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_0.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_1.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/seabed/rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_3.rts_seabed_geo_sharkpearls_resurrecttravelstation_daffodil_3'),
+        'Tutorial_P': ('/game/gamedata/fasttravel/fts_tutorial_01.fts_tutorial_01', '/game/gamedata/fasttravel/fts_tutorial_02.fts_tutorial_02', '/game/gamedata/fasttravel/fts_tutorial_03.fts_tutorial_03', '/game/gamedata/fasttravel/leveltravelstations/lts_tutorial_overworld.lts_tutorial_overworld', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_0.rts_tutorial_geo_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_1.rts_tutorial_geo_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_2.rts_tutorial_geo_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_geo_resurrecttravelstation_daffodil_3.rts_tutorial_geo_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_0.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_2.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_3.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_4.rts_tutorial_m_plot0tutorial_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_0.rts_tutorial_p_resurrecttravelstation_daffodil_0', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_1.rts_tutorial_p_resurrecttravelstation_daffodil_1', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_2.rts_tutorial_p_resurrecttravelstation_daffodil_2', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_3.rts_tutorial_p_resurrecttravelstation_daffodil_3', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_4.rts_tutorial_p_resurrecttravelstation_daffodil_4', '/game/gamedata/fasttravel/resurrecttravelstations/autogen/tutorial/rts_tutorial_p_resurrecttravelstation_daffodil_5.rts_tutorial_p_resurrecttravelstation_daffodil_5'),
+        })
+
+
+def get_mission_name(mission_path, default=None):
+    """
+    Returns the English name for the given mission class path, or `default`
+    """
+    name = mission_to_name.get(mission_path)
+    if name is None:
+        name = mission_to_name.get(mission_path.lower(), default)
+    return name
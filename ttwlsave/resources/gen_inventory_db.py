@@ -22,20 +22,23 @@
 # 3. This notice may not be removed or altered from any source distribution.
 
 import io
+import sys
 import gzip
 import json
 import codecs
+import struct
 import argparse
-from Crypto.Cipher import AES
 
 # Takes InventorySerialNumberDatabase.dat from inside the BL3 paks and turns
-# it into a compressed JSON file suitable for use in our savegame apps.
+# it into a compressed JSON file suitable for use in our savegame apps, plus
+# a precompiled binary version which the apps will prefer (see below).
 # At user request, will also write out a version suitable for sending PRs
 # to https://github.com/gibbed/WonderlandsDumps
 
 # Input/Output parameters
 input_file = 'InventorySerialNumberDatabase.dat'
 output_file = 'inventoryserialdb.json.gz'
+binary_file = 'inventoryserialdb.bin'
 gibbed_file = 'Inventory Serial Number Database.json'
 
 ###
@@ -43,6 +46,7 @@ gibbed_file = 'Inventory Serial Number Database.json'
 ###
 
 def decrypt(key, data):
+    from Crypto.Cipher import AES
     cipher = AES.new(key, AES.MODE_ECB)
     return cipher.decrypt(data)
 
@@ -52,6 +56,54 @@ def decrypt_db_file(file_path):
         key = decrypt(data[:32], data[-32:])
         return decrypt(key, data[:-32]).rstrip(b'\x00')
 
+###
+### Binary output.  This is what InventorySerialDB in datalib.py actually
+### reads; it gets mmapped and only has categories decoded as they're needed.
+### All integers are little-endian:
+###
+###   Header:
+###     8 bytes: b'TTWLISDB'
+###     uint32: format version (currently 1)
+###     uint32: number of categories
+###     uint32: max serial version across all categories
+###   Category index, for each category:
+###     uint16: name length, followed by the UTF-8 name
+###     uint32: offset of the category data from the start of the file
+###   Category data, for each category:
+###     uint16: number of versions
+###     (uint32 version, uint32 bits) for each version
+###     uint32: number of assets
+###     uint16: asset length, followed by the UTF-8 asset name, for each asset
+###
+
+def write_binary(top, filename):
+    index_len = 0
+    for category in top.keys():
+        index_len += 2 + len(category.encode('utf-8')) + 4
+    sections = []
+    offset = 8 + 12 + index_len
+    index = []
+    for category, data in top.items():
+        section = [struct.pack('<H', len(data['versions']))]
+        for version in data['versions']:
+            section.append(struct.pack('<II', version['version'], version['bits']))
+        section.append(struct.pack('<I', len(data['assets'])))
+        for asset in data['assets']:
+            asset = asset.encode('utf-8')
+            section.append(struct.pack('<H', len(asset)))
+            section.append(asset)
+        section = b''.join(section)
+        name = category.encode('utf-8')
+        index.append(struct.pack('<H', len(name)) + name + struct.pack('<I', offset))
+        sections.append(section)
+        offset += len(section)
+    max_version = max([max([v['version'] for v in data['versions']]) for data in top.values()])
+    with open(filename, 'wb') as odf:
+        odf.write(b'TTWLISDB')
+        odf.write(struct.pack('<III', 1, len(top), max_version))
+        odf.write(b''.join(index))
+        odf.write(b''.join(sections))
+
 ###
 ### Arguments
 ###
@@ -62,12 +114,23 @@ parser.add_argument('-g', '--gibbed',
         action='store_true',
         help='Also generate JSON suitable for sending PRs to Gibbed at https://github.com/gibbed/WonderlandsDumps')
 
+parser.add_argument('-b', '--binary-only',
+        action='store_true',
+        help='Just regenerate {} from an existing {}'.format(binary_file, output_file))
+
 args = parser.parse_args()
 
 ###
 ### Do the work
 ###
 
+if args.binary_only:
+    with gzip.open(output_file, 'rt') as df:
+        top = json.load(df)
+    write_binary(top, binary_file)
+    print('Wrote binary DB to {}'.format(binary_file))
+    sys.exit(0)
+
 # Decrypt
 df = io.StringIO(decrypt_db_file(input_file).decode('latin1'))
 
@@ -112,6 +175,10 @@ with gzip.open(output_file, 'wt') as odf:
 print('')
 print('Wrote JSON to {}'.format(output_file))
 
+# Output to binary
+write_binary(top, binary_file)
+print('Wrote binary DB to {}'.format(binary_file))
+
 # If we've been asked to, also generate a Gibbed-compatible JSON file, so that
 # diffs in that repo are nice and clean.  This is pretty stupidly done, but
 # whatever -- the format's simple enough.
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+#
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+
+import os
+import ast
+import sys
+import argparse
+
+# Takes the mission/map name tables from `ttwlsave/__init__.py` and writes
+# out `ttwlsave/lookups.py`, a generated module with the lookup versions of
+# them: lowercased keys (which is what the savegame getters look up with),
+# the "real" mission class paths, and reverse maps from English names back
+# to paths.  Everything's written out as literals, so importing the module
+# doesn't have to rebuild anything, and since all the strings live in the
+# one module, the ones shared between the forward and reverse maps are the
+# same objects.
+#
+# The tables are read by parsing `__init__.py` rather than importing it,
+# since `__init__.py` imports the generated module itself.  Re-run this
+# whenever those tables change.
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+input_file = os.path.join(base_dir, '__init__.py')
+output_file = os.path.join(base_dir, 'lookups.py')
+
+tables = [
+        'mission_to_name',
+        'plot_mission_names',
+        'map_to_eng',
+        'fts_to_map',
+        ]
+
+header = """#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+#
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+
+# AUTOGENERATED by resources/gen_lookups.py, from the tables in __init__.py.
+# Don't edit this by hand -- update those tables and re-run the script.
+
+import types
+"""
+
+footer = '''
+def get_mission_name(mission_path, default=None):
+    """
+    Returns the English name for the given mission class path, or `default`
+    """
+    name = mission_to_name.get(mission_path)
+    if name is None:
+        name = mission_to_name.get(mission_path.lower(), default)
+    return name
+'''
+
+def read_tables(filename):
+    """
+    Parses `filename` and returns a dict containing the literal values of
+    all the `tables` we care about.
+    """
+    with open(filename) as df:
+        tree = ast.parse(df.read(), filename)
+    found = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) \
+                and len(node.targets) == 1 \
+                and isinstance(node.targets[0], ast.Name) \
+                and node.targets[0].id in tables:
+            found[node.targets[0].id] = ast.literal_eval(node.value)
+    for table in tables:
+        if table not in found:
+            raise Exception('Could not find `{}` in {}'.format(table, filename))
+    return found
+
+def class_path(mission_path):
+    """
+    Converts a mission object path to its class path, which is what actually
+    shows up in savegames.
+    """
+    last_bit = mission_path.split('/')[-1]
+    return '{}.{}_C'.format(mission_path, last_bit)
+
+def write_dict(odf, name, data, frozen=True):
+    """
+    Writes out the dict `data` as `name`
+    """
+    if frozen:
+        print('{} = types.MappingProxyType({{'.format(name), file=odf)
+    else:
+        print('{} = {{'.format(name), file=odf)
+    for key, value in sorted(data.items()):
+        print('        {!r}: {!r},'.format(key, value), file=odf)
+    if frozen:
+        print('        })', file=odf)
+    else:
+        print('        }', file=odf)
+    print('', file=odf)
+
+def main():
+
+    parser = argparse.ArgumentParser(
+            description='Generate ttwlsave/lookups.py from the tables in ttwlsave/__init__.py',
+            )
+    parser.add_argument('-o', '--output',
+            default=output_file,
+            help='Output filename (default: {})'.format(output_file),
+            )
+    args = parser.parse_args()
+
+    data = read_tables(input_file)
+
+    # Missions
+    mission_to_name = {}
+    name_to_mission = {}
+    for mission_path, name in data['mission_to_name'].items():
+        full_path = class_path(mission_path)
+        mission_to_name[full_path] = name
+        mission_to_name[full_path.lower()] = name
+        if name in name_to_mission:
+            print('WARNING: Mission name "{}" used more than once'.format(name), file=sys.stderr)
+        name_to_mission.setdefault(name, full_path)
+    plot_missions = sorted([class_path(m).lower() for m in data['plot_mission_names']])
+
+    # Maps
+    map_to_eng = {}
+    eng_to_map = {}
+    for mapname, name in data['map_to_eng'].items():
+        map_to_eng[mapname] = name
+        map_to_eng[mapname.lower()] = name
+        eng_to_map[name] = mapname
+
+    # Fast Travel stations
+    fts_to_map = {}
+    fts_to_eng = {}
+    map_to_fts = {}
+    for fts, mapname in data['fts_to_map'].items():
+        fts_to_map[fts.lower()] = mapname
+        if mapname in data['map_to_eng']:
+            fts_to_eng[fts.lower()] = data['map_to_eng'][mapname]
+        map_to_fts.setdefault(mapname, []).append(fts.lower())
+    map_to_fts = {k: tuple(sorted(v)) for k, v in map_to_fts.items()}
+
+    with open(args.output, 'w') as odf:
+        print(header, file=odf)
+        print('# Mission class paths (as found in savegames, and lowercased) to English', file=odf)
+        write_dict(odf, 'mission_to_name', mission_to_name)
+        print('# English mission names to mission class paths', file=odf)
+        write_dict(odf, 'name_to_mission', name_to_mission)
+        print('# Plot missions, lowercased', file=odf)
+        print('plot_missions = frozenset([', file=odf)
+        for mission in plot_missions:
+            print('        {!r},'.format(mission), file=odf)
+        print('        ])', file=odf)
+        print('', file=odf)
+        print('# Map names (as-is and lowercased) to English', file=odf)
+        write_dict(odf, 'map_to_eng', map_to_eng)
+        print('# English map names to map names', file=odf)
+        write_dict(odf, 'eng_to_map', eng_to_map)
+        print('# Fast Travel stations (lowercased) to map names', file=odf)
+        write_dict(odf, 'fts_to_map', fts_to_map)
+        print('# Fast Travel stations (lowercased) straight to English map names', file=odf)
+        write_dict(odf, 'fts_to_eng', fts_to_eng)
+        print('# Map names to their Fast Travel stations (lowercased)', file=odf)
+        write_dict(odf, 'map_to_fts', map_to_fts)
+        print(footer.rstrip(), file=odf)
+
+    print('Wrote to {}'.format(args.output))
+
+if __name__ == '__main__':
+    main()
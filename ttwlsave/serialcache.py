@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2022 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import pkg_resources
+
+def default_cache_dir():
+    """
+    Returns the directory we'd use for cache files, following the usual
+    per-platform conventions
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA')
+        if not base:
+            base = os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME')
+        if not base:
+            base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ttwlsave')
+
+class PersistentSerialCache(object):
+    """
+    An on-disk (sqlite) cache of parsed serial numbers, so that repeated
+    runs over the same saves/profiles don't have to re-parse every item.
+    Entries are keyed on the de-obfuscated (and CRC-checked) serial data,
+    and hold the records which `WLSerial` generates (`record_class` should
+    be `datalib.ParsedSerial`).
+
+    The cache is tied to the specific data files used to parse serials
+    (`data_files`, as package resource paths); if any of those change, the
+    whole thing gets wiped.  `DataWrapper` passes in whichever inventory DB
+    file actually got loaded, along with `balance_to_inv_key.json.gz`.  If
+    `data_files` isn't specified, all the files which could be involved get
+    used.  Once there are more than `max_entries` items in the cache, the
+    least-recently-used ones get evicted.
+    """
+
+    data_files = [
+            'resources/inventoryserialdb.bin',
+            'resources/inventoryserialdb.json.gz',
+            'resources/balance_to_inv_key.json.gz',
+            ]
+
+    def __init__(self, record_class, filename=None, max_entries=50000, data_files=None):
+        if filename is None:
+            filename = os.path.join(default_cache_dir(), 'serials.sqlite3')
+        dirname = os.path.dirname(filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.filename = filename
+        self.max_entries = max_entries
+        self.pending = 0
+        self.touched = []
+        self.record_class = record_class
+        self.conn = sqlite3.connect(filename, timeout=30)
+        self.conn.execute('create table if not exists meta (key text primary key, value text)')
+        self.conn.execute('create table if not exists serials (serial blob primary key, record text, last_used real)')
+        self.conn.execute('create index if not exists serials_last_used on serials (last_used)')
+
+        # Wipe everything if the data files have changed since we last ran.
+        if data_files is None:
+            data_files = PersistentSerialCache.data_files
+        signature = PersistentSerialCache.get_signature(data_files)
+        row = self.conn.execute('select value from meta where key=?', ('signature',)).fetchone()
+        if row is None or row[0] != signature:
+            self.conn.execute('delete from serials')
+            self.conn.execute('replace into meta (key, value) values (?, ?)', ('signature', signature))
+        self.conn.commit()
+
+    @staticmethod
+    def get_signature(data_files):
+        """
+        Returns a hash of the given `data_files`, which serial parsing depends on
+        """
+        hasher = hashlib.sha1()
+        for data_file in data_files:
+            hasher.update(data_file.encode('utf-8'))
+            hasher.update(pkg_resources.resource_string(__name__, data_file))
+        return hasher.hexdigest()
+
+    def get(self, serial_data):
+        """
+        Returns the cached record for the given de-obfuscated `serial_data`,
+        or `None`.
+        """
+        row = self.conn.execute('select record from serials where serial=?', (bytes(serial_data),)).fetchone()
+        if row is None:
+            return None
+        # Updating the timestamp on every hit is slow, so we batch those up
+        self.touched.append(bytes(serial_data))
+        values = []
+        for value in json.loads(row[0]):
+            if isinstance(value, list):
+                value = tuple(value)
+            values.append(value)
+        return self.record_class(*values)
+
+    def put(self, serial_data, record):
+        """
+        Stores the given `record` for the de-obfuscated `serial_data`
+        """
+        self.conn.execute('replace into serials (serial, record, last_used) values (?, ?, ?)',
+                (bytes(serial_data), json.dumps(list(record), separators=(',', ':')), time.time()))
+        self._note_write()
+
+    def _note_write(self):
+        """
+        Commits every so often, rather than after every single write
+        """
+        self.pending += 1
+        if self.pending >= 500:
+            self.flush()
+
+    def flush(self):
+        """
+        Commits any outstanding changes, evicting the least-recently-used
+        entries if we've gone over `max_entries`.
+        """
+        if self.touched:
+            now = time.time()
+            self.conn.executemany('update serials set last_used=? where serial=?',
+                    [(now, serial_data) for serial_data in self.touched])
+            self.touched = []
+        count = self.conn.execute('select count(*) from serials').fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute('delete from serials where serial in (select serial from serials order by last_used limit ?)',
+                    (count - self.max_entries,))
+        self.conn.commit()
+        self.pending = 0
+
+    def close(self):
+        """
+        Flushes and closes the cache
+        """
+        if self.conn is not None:
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
@@ -21,6 +21,200 @@
 # 
 # 3. This notice may not be removed or altered from any source distribution.
 
+import bisect
+
+class ChallengeIndex(object):
+    """
+    Index of the challenges found in a savegame/profile's `challenge_data`
+    list, so that we don't have to loop through the whole thing whenever we
+    want to find a challenge.  Maps each challenge path to its position(s) in
+    the list, and also keeps a (case-insensitive) trie of the paths, split
+    on slashes, so we can quickly find all challenges matching a prefix.
+    """
+
+    def __init__(self, challenge_data):
+        self.challenge_data = challenge_data
+        self.positions = {}
+        self.trie = {}
+        self.sorted_positions = None
+        for idx, chal in enumerate(challenge_data):
+            self._add_path(chal.challenge_class_path, idx)
+
+    def __contains__(self, path):
+        return path in self.positions
+
+    def _add_path(self, path, idx):
+        """
+        Adds the given `path` at position `idx` to our index
+        """
+        if path in self.positions:
+            self.positions[path].append(idx)
+            return
+        self.positions[path] = [idx]
+        node = self.trie
+        for segment in path.lower().split('/'):
+            node = node.setdefault(segment, {})
+        node.setdefault(None, set()).add(path)
+
+    def _remove_path(self, path):
+        """
+        Removes the given `path` from our trie, pruning any empty branches.
+        """
+        nodes = [self.trie]
+        segments = path.lower().split('/')
+        for segment in segments:
+            nodes.append(nodes[-1][segment])
+        nodes[-1][None].discard(path)
+        if not nodes[-1][None]:
+            del nodes[-1][None]
+        for segment, parent, node in reversed(list(zip(segments, nodes, nodes[1:]))):
+            if node:
+                break
+            del parent[segment]
+
+    def get(self, path):
+        """
+        Returns the first challenge object with the given `path`, or `None`
+        """
+        if path in self.positions:
+            return self.challenge_data[self.positions[path][0]]
+        return None
+
+    def get_all(self, path):
+        """
+        Returns a list of all challenge objects with the given `path`
+        (there should really only ever be one)
+        """
+        return [self.challenge_data[idx] for idx in self.positions.get(path, [])]
+
+    def get_prefix_paths(self, prefix, case_insensitive=False):
+        """
+        Returns a list of all challenge paths starting with `prefix`
+        """
+        segments = prefix.lower().split('/')
+        node = self.trie
+        for segment in segments[:-1]:
+            if segment not in node:
+                return []
+            node = node[segment]
+
+        # The last segment of the prefix may only be partial, so check it
+        # against all the children here, and collect everything underneath.
+        paths = []
+        to_visit = [child for segment, child in node.items()
+                if segment is not None and segment.startswith(segments[-1])]
+        while to_visit:
+            node = to_visit.pop()
+            for segment, child in node.items():
+                if segment is None:
+                    paths.extend(child)
+                else:
+                    to_visit.append(child)
+
+        if not case_insensitive:
+            paths = [path for path in paths if path.startswith(prefix)]
+        return paths
+
+    def get_prefix(self, prefix, case_insensitive=False):
+        """
+        Returns a list of all challenge objects whose paths start with `prefix`
+        """
+        challenges = []
+        for path in self.get_prefix_paths(prefix, case_insensitive):
+            challenges.extend(self.get_all(path))
+        return challenges
+
+    def get_sorted(self):
+        """
+        Returns a list of all challenge objects, sorted by path
+        """
+        if self.sorted_positions is None:
+            self.sorted_positions = []
+            for path in sorted(self.positions.keys()):
+                self.sorted_positions.extend(self.positions[path])
+        return [self.challenge_data[idx] for idx in self.sorted_positions]
+
+    def append(self, path):
+        """
+        Appends a new challenge with the given `path` to the protobuf,
+        and returns it
+        """
+        chal = self.challenge_data.add(challenge_class_path=path)
+        self._add_path(path, len(self.challenge_data)-1)
+        self.sorted_positions = None
+        return chal
+
+    def delete(self, indexes):
+        """
+        Deletes the challenges at the given list of `indexes` from the
+        protobuf, and updates our index to match.
+        """
+        if not indexes:
+            return
+        indexes = sorted(set(indexes))
+        for idx in reversed(indexes):
+            del self.challenge_data[idx]
+
+        # Everything after a deleted challenge moves down a slot for each
+        # deletion before it.
+        deleted = set(indexes)
+        for path in list(self.positions.keys()):
+            remaining = [idx - bisect.bisect_left(indexes, idx)
+                    for idx in self.positions[path]
+                    if idx not in deleted]
+            if remaining:
+                self.positions[path] = remaining
+            else:
+                del self.positions[path]
+                self._remove_path(path)
+        self.sorted_positions = None
+
+class FieldIndex(object):
+    """
+    Simple index of a repeated protobuf field, keyed on one of the attributes
+    of its entries (such as an SDU's `sdu_data_path`).  If there happen to be
+    duplicate keys, the first entry wins.  New entries should be added via
+    `add()` so that the index stays in sync; anything which removes entries
+    should throw the index away.
+    """
+
+    def __init__(self, container, key_attr):
+        self.container = container
+        self.key_attr = key_attr
+        self.mapping = {}
+        for entry in container:
+            self.mapping.setdefault(getattr(entry, key_attr), entry)
+
+    def __contains__(self, key):
+        return key in self.mapping
+
+    def get(self, key):
+        """
+        Returns the entry with the given `key`, or `None`
+        """
+        return self.mapping.get(key)
+
+    def add(self, **kwargs):
+        """
+        Adds a new entry to the repeated field, constructed with the given
+        attributes (which should include our key attribute), and returns it
+        """
+        entry = self.container.add(**kwargs)
+        self.mapping.setdefault(getattr(entry, self.key_attr), entry)
+        return entry
+
+def _gvas_property(name):
+    """
+    Returns a property which passes through to the attribute `name` on our
+    `gvas` header object, so the header values can still be accessed directly
+    on savegames/profiles, the way they used to be.
+    """
+    return property(
+            lambda self: getattr(self.gvas, name),
+            lambda self, value: setattr(self.gvas, name, value),
+            doc='`{}` from the GVAS header'.format(name),
+            )
+
 class TTWLBase(object):
     """
     Base object for TTWL savegame/profile info.  Meant to handle instances
@@ -37,24 +231,77 @@ class TTWLBase(object):
 
     A note about challenges: the way the protobufs get represented, we basically
     have to loop through a list of challenges until we find the one we want.
-    It'd probably be a lot more sensible to load all that stuff into a dict when
-    we load the protobuf in, so that we could just reference specific challenges
-    more intelligently.  For now I'm not gonna bother with that, since so little
-    uses it.
+    To avoid that, the first challenge operation builds a `ChallengeIndex`,
+    which maps challenge paths to their positions in the protobuf list.  The
+    methods in here keep it up to date when challenges get added or removed,
+    so anything else which adds or removes entries from `challenge_data`
+    directly should call `self.invalidate_challenge_index()` afterwards.
+    (Just changing the values on existing challenges is fine, though.)
+
+    Implementing classes should also set `self.gvas` to the `GvasContainer`
+    they read in.  The header values in there are available directly on us
+    as well (`sg_version`, `build_id`, etc).
     """
 
+    sg_version = _gvas_property('sg_version')
+    pkg_version = _gvas_property('pkg_version')
+    engine_major = _gvas_property('engine_major')
+    engine_minor = _gvas_property('engine_minor')
+    engine_patch = _gvas_property('engine_patch')
+    engine_build = _gvas_property('engine_build')
+    build_id = _gvas_property('build_id')
+    fmt_version = _gvas_property('fmt_version')
+    custom_format_data = _gvas_property('custom_format_data')
+    sg_type = _gvas_property('sg_type')
+
     def __init__(self):
         """
-        Make sure that implementing classes set `base_obj` when appropriate.
+        Make sure that implementing classes set `base_obj` and `gvas` when
+        appropriate.
         """
         self.base_obj = None
+        self.gvas = None
+        self.challenge_index = None
+
+
+    def get_challenge_index(self):
+        """
+        Returns our `ChallengeIndex`, building it if need be.
+        """
+        if self.challenge_index is None:
+            self.challenge_index = ChallengeIndex(self.base_obj.challenge_data)
+        return self.challenge_index
+
+
+    def invalidate_challenge_index(self):
+        """
+        Throws away our `ChallengeIndex`, so it'll get rebuilt on next use.
+        Should be called whenever `base_obj` is replaced, or if anything
+        adds/removes challenges without going through the index.
+        """
+        self.challenge_index = None
 
 
     def get_all_challenges_raw(self):
         """
         Returns the savegame's list of all challenges, as the actual protobuf objects.
         """
-        return sorted(self.base_obj.challenge_data, key=lambda chal: chal.challenge_class_path)
+        return self.get_challenge_index().get_sorted()
+
+
+    def _get_challenge(self, challenge_obj):
+        """
+        Returns the challenge protobuf object for the given path, raising an
+        Exception if it's not found.
+        """
+        chal = self.get_challenge_index().get(challenge_obj)
+
+        # AFAIK we should never get an unknown challenge, so long as a valid
+        # challenge path has been given.  Rather than create a new one, I'm
+        # just going to raise an Exception for now.
+        if chal is None:
+            raise Exception('Challenge not found: {}'.format(challenge_obj))
+        return chal
 
 
     def reset_challenge_obj(self, challenge_obj,
@@ -69,20 +316,12 @@ class TTWLBase(object):
         more user-visible challenges on the map menu.  The ones that we're
         primarily concerned with here will just have 1 for it, though.
         """
-        # First look for existing objects (should always be here, I think)
-        for chal in self.base_obj.challenge_data:
-            if chal.challenge_class_path == challenge_obj:
-                chal.currently_completed = False
-                chal.is_active = is_active
-                chal.completed_count = completed_count
-                chal.progress_counter = progress_counter
-                chal.completed_progress_level = progress_level
-                return
-
-        # AFAIK we should never get here, so long as a valid challenge path has
-        # been given.  Rather than create a new one, I'm just going to raise an
-        # Exception for now.
-        raise Exception('Challenge not found: {}'.format(challenge_obj))
+        chal = self._get_challenge(challenge_obj)
+        chal.currently_completed = False
+        chal.is_active = is_active
+        chal.completed_count = completed_count
+        chal.progress_counter = progress_counter
+        chal.completed_progress_level = progress_level
 
 
     def unlock_challenge_obj(self, challenge_obj,
@@ -96,20 +335,41 @@ class TTWLBase(object):
         more user-visible challenges on the map menu.  The ones that we're
         primarily concerned with here will just have 1 for it, though.
         """
-        # First look for existing objects (should always be here, I think)
-        for chal in self.base_obj.challenge_data:
-            if chal.challenge_class_path == challenge_obj:
-                chal.currently_completed = True
-                chal.is_active = False
-                chal.completed_count = completed_count
-                chal.progress_counter = progress_counter
-                chal.completed_progress_level = progress_level
-                return
+        chal = self._get_challenge(challenge_obj)
+        chal.currently_completed = True
+        chal.is_active = False
+        chal.completed_count = completed_count
+        chal.progress_counter = progress_counter
+        chal.completed_progress_level = progress_level
+
 
-        # AFAIK we should never get here, so long as a valid challenge path has
-        # been given.  Rather than create a new one, I'm just going to raise an
-        # Exception for now.
-        raise Exception('Challenge not found: {}'.format(challenge_obj))
+    def set_challenges(self, challenges, create=False):
+        """
+        Sets a whole batch of challenges at once.  `challenges` should be a
+        dict whose keys are challenge paths, and whose values are either `True`
+        (to unlock the challenge, as per `unlock_challenge_obj`), `False` (to
+        reset it, as per `reset_challenge_obj`), or a dict of attributes to set
+        on the challenge protobuf directly (such as `completed_count`).  If
+        `create` is `True`, challenges which aren't already present will be
+        added, otherwise an Exception is raised for them (before any changes
+        are made).
+        """
+        index = self.get_challenge_index()
+        if not create:
+            for path in challenges.keys():
+                if path not in index:
+                    raise Exception('Challenge not found: {}'.format(path))
+        for path, state in challenges.items():
+            if path not in index:
+                index.append(path)
+            if state is True:
+                self.unlock_challenge_obj(path)
+            elif state is False:
+                self.reset_challenge_obj(path)
+            else:
+                chal = index.get(path)
+                for attr, value in state.items():
+                    setattr(chal, attr, value)
 
 
     def clear_challenge_prefix(self, prefix):
@@ -118,43 +378,40 @@ class TTWLBase(object):
         removes the entries, as opposed to trying to intelligently clear their
         values.
         """
-        prefix_lower = prefix.lower()
+        index = self.get_challenge_index()
         indicies_to_del = []
-        for idx, challenge in enumerate(self.base_obj.challenge_data):
-            if challenge.challenge_class_path.lower().startswith(prefix_lower):
-                indicies_to_del.append(idx)
-        for idx in reversed(indicies_to_del):
-            del self.base_obj.challenge_data[idx]
+        for path in index.get_prefix_paths(prefix, case_insensitive=True):
+            indicies_to_del.extend(index.positions[path])
+        index.delete(indicies_to_del)
 
 
     def clear_dice_challenges(self):
         """
         Clears out Lucky Dice challenges.  This is done custom because there's
         260 of them (in addition to the "main" one), and there's no real point to
-        hardcoding them.  The above methods would be pretty inefficient to use, too,
-        since we loop through challenges until we find the correct name.
+        hardcoding them.  The challenge index's prefix lookup finds them all for us.
 
         Note that when clearing this on a savegame, the saves have an additional
         `tracked_interactions` structure which will need to be cleared out as well.
         """
-        for chal in self.base_obj.challenge_data:
-            if chal.challenge_class_path == '/Game/GameData/Challenges/GoldenDice/Challenge_Crew_GoldenDice_Meta.Challenge_Crew_GoldenDice_Meta_C':
-                chal.completed_count = 0
-                chal.currently_completed = False
-                chal.progress_counter = 0
-                chal.is_active = True
-            elif chal.challenge_class_path.startswith('/Game/GameData/Challenges/GoldenDice/Challenge_TrackedInteraction_GoldenDice_'):
-                chal.completed_count = 0
-                chal.currently_completed = False
-                chal.progress_counter = 0
-                chal.is_active = False
+        index = self.get_challenge_index()
+        for chal in index.get_all('/Game/GameData/Challenges/GoldenDice/Challenge_Crew_GoldenDice_Meta.Challenge_Crew_GoldenDice_Meta_C'):
+            chal.completed_count = 0
+            chal.currently_completed = False
+            chal.progress_counter = 0
+            chal.is_active = True
+        for chal in index.get_prefix('/Game/GameData/Challenges/GoldenDice/Challenge_TrackedInteraction_GoldenDice_'):
+            chal.completed_count = 0
+            chal.currently_completed = False
+            chal.progress_counter = 0
+            chal.is_active = False
 
     def finish_dice_challenges(self):
         """
         Mark all Lucky Dice challenges as complete.  This is done custom because
         there's 260 of them (in addition to the "main" one), and there's no real
-        point to hardcoding them.  The above methods would be pretty inefficient to
-        use, too, since we loop through challenges until we find the correct name.
+        point to hardcoding them.  The challenge index's prefix lookup finds them
+        all for us.
 
         Note that if this is used on a savegame, the saves have an additional
         `tracked_interactions` structure to keep track of which dice have been found.
@@ -165,15 +422,15 @@ class TTWLBase(object):
         though, we don't have to care -- the game will auto-populate that structure
         based on the challenges set here, if it's not already present.
         """
-        for chal in self.base_obj.challenge_data:
-            if chal.challenge_class_path == '/Game/GameData/Challenges/GoldenDice/Challenge_Crew_GoldenDice_Meta.Challenge_Crew_GoldenDice_Meta_C':
-                chal.completed_count = 1
-                chal.currently_completed = True
-                chal.progress_counter = 260
-                chal.is_active = True
-            elif chal.challenge_class_path.startswith('/Game/GameData/Challenges/GoldenDice/Challenge_TrackedInteraction_GoldenDice_'):
-                chal.completed_count = 1
-                chal.currently_completed = True
-                chal.progress_counter = 0
-                chal.is_active = False
+        index = self.get_challenge_index()
+        for chal in index.get_all('/Game/GameData/Challenges/GoldenDice/Challenge_Crew_GoldenDice_Meta.Challenge_Crew_GoldenDice_Meta_C'):
+            chal.completed_count = 1
+            chal.currently_completed = True
+            chal.progress_counter = 260
+            chal.is_active = True
+        for chal in index.get_prefix('/Game/GameData/Challenges/GoldenDice/Challenge_TrackedInteraction_GoldenDice_'):
+            chal.completed_count = 1
+            chal.currently_completed = True
+            chal.progress_counter = 0
+            chal.is_active = False
 
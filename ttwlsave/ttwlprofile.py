@@ -21,18 +21,20 @@
 # 
 # 3. This notice may not be removed or altered from any source distribution.
 
-# The encryption/decryption stanzas in TTWLProfile.__init__
-# were helpfully provided by Gibbed (rick 'at' gibbed 'dot' us), so many
-# thanks for that!  https://gist.github.com/gibbed/b6a93f74c575ce99b42c3b629ac1856a
+# The encryption/decryption stanzas (now living in cipher.py) used by
+# TTWLProfile.__init__ were helpfully provided by Gibbed (rick 'at' gibbed
+# 'dot' us), so many thanks for that!  https://gist.github.com/gibbed/b6a93f74c575ce99b42c3b629ac1856a
 #
-# The rest of the savegame format was gleaned from 13xforever/Ilya's
-# "gvas-converter" project: https://github.com/13xforever/gvas-converter
+# The rest of the savegame format (now living in gvas.py) was gleaned from
+# 13xforever/Ilya's "gvas-converter" project:
+# https://github.com/13xforever/gvas-converter
 
 import base64
-import struct
 import google.protobuf
 import google.protobuf.json_format
 from . import *
+from . import gvas
+from . import cipher
 from . import datalib
 from . import OakProfile_pb2, OakShared_pb2
 from .ttwlbase import TTWLBase
@@ -112,68 +114,32 @@ class TTWLProfile(TTWLBase):
     def __init__(self, filename, debug=False):
         super().__init__()
         self.filename = filename
-        self.datawrapper = datalib.DataWrapper()
-        with open(filename, 'rb') as df:
-
-            header = df.read(4)
-            assert(header == b'GVAS')
-
-            self.sg_version = self._read_int(df)
-            if debug:
-                print('Profile version: {}'.format(self.sg_version))
-            self.pkg_version = self._read_int(df)
-            if debug:
-                print('Package version: {}'.format(self.pkg_version))
-            self.engine_major = self._read_short(df)
-            self.engine_minor = self._read_short(df)
-            self.engine_patch = self._read_short(df)
-            self.engine_build = self._read_int(df)
-            if debug:
-                print('Engine version: {}.{}.{}.{}'.format(
-                    self.engine_major,
-                    self.engine_minor,
-                    self.engine_patch,
-                    self.engine_build,
-                    ))
-            self.build_id = self._read_str(df)
-            if debug:
-                print('Build ID: {}'.format(self.build_id))
-            self.fmt_version = self._read_int(df)
-            if debug:
-                print('Custom Format Version: {}'.format(self.fmt_version))
-            fmt_count = self._read_int(df)
-            if debug:
-                print('Custom Format Data Count: {}'.format(fmt_count))
-            self.custom_format_data = []
-            for _ in range(fmt_count):
-                guid = self._read_guid(df)
-                entry = self._read_int(df)
-                if debug:
-                    print(' - GUID {}: {}'.format(guid, entry))
-                self.custom_format_data.append((guid, entry))
-            self.sg_type = self._read_str(df)
-            if debug:
-                print('Profile type: {}'.format(sg_type))
-
-            # Read in the actual data
-            remaining_data_len = self._read_int(df)
-            data = bytearray(df.read(remaining_data_len))
-
-            # Decrypt
-            for i in range(len(data)-1, -1, -1):
-                if i < 32:
-                    b = TTWLProfile._prefix_magic[i]
-                else:
-                    b = data[i - 32]
-                b ^= TTWLProfile._xor_magic[i % 32]
-                data[i] ^= b
-
-            # Make sure that was all there was
-            last = df.read()
-            assert(len(last) == 0)
-
-            # Parse protobufs
-            self.import_protobuf(data)
+        self.datawrapper = datalib.DataWrapper.shared()
+        (self.gvas, data) = gvas.GvasContainer.read(filename,
+                body_func=lambda body: cipher.decrypt(body, TTWLProfile._prefix_magic, TTWLProfile._xor_magic),
+                label='Profile',
+                debug=debug,
+                )
+
+        # Parse protobufs
+        self.import_protobuf(data)
+
+    @staticmethod
+    def peek(filename, fields=None):
+        """
+        Lightweight alternative to loading the whole file: returns a tuple of
+        the GVAS header (a `gvas.GvasContainer`) and a dict of the requested
+        top-level protobuf `fields` (ie: `['bank_inventory_list']`).  Only
+        the parts of the body we need get decrypted, and the full protobuf
+        is never parsed.
+        """
+        return gvas.GvasContainer.peek(filename,
+                OakProfile_pb2.Profile,
+                TTWLProfile._prefix_magic,
+                TTWLProfile._xor_magic,
+                fields=fields,
+                label='Profile',
+                )
 
     def import_protobuf(self, data):
         """
@@ -185,6 +151,7 @@ class TTWLProfile(TTWLBase):
         # Now parse the protobufs
         self.prof = OakProfile_pb2.Profile()
         self.base_obj = self.prof
+        self.invalidate_challenge_index()
         try:
             self.prof.ParseFromString(data)
         except google.protobuf.message.DecodeError as e:
@@ -193,9 +160,19 @@ class TTWLProfile(TTWLBase):
         # Do some data processing so that we can wrap things APIwise
         # First: Bank
         self.bank = [datalib.WLItem(i, self.datawrapper) for i in self.prof.bank_inventory_list]
+        self.bank_fingerprints = None
+
+        # Keep track of the highest pickup_order_index in use, so that new
+        # bank items can be given a unique one without scanning the bank
+        # each time.
+        self.max_bank_pickup_order = 0
+        for item in self.bank:
+            if item.get_pickup_order_idx() > self.max_bank_pickup_order:
+                self.max_bank_pickup_order = item.get_pickup_order_idx()
 
         # Next: Lost Loot
         self.lost_loot = [LostLootItem(s, self.prof.lost_loot_inventory_list, idx, self.datawrapper) for idx, s in enumerate(self.prof.lost_loot_inventory_list)]
+        self.lost_loot_fingerprints = None
 
     def import_json(self, json_str):
         """
@@ -210,39 +187,8 @@ class TTWLProfile(TTWLBase):
         """
         Saves ourselves to a new filename
         """
-        with open(filename, 'wb') as df:
-
-            # Header info
-            df.write(b'GVAS')
-            self._write_int(df, self.sg_version)
-            self._write_int(df, self.pkg_version)
-            self._write_short(df, self.engine_major)
-            self._write_short(df, self.engine_minor)
-            self._write_short(df, self.engine_patch)
-            self._write_int(df, self.engine_build)
-            self._write_str(df, self.build_id)
-            self._write_int(df, self.fmt_version)
-            self._write_int(df, len(self.custom_format_data))
-            for guid, entry in self.custom_format_data:
-                self._write_guid(df, guid)
-                self._write_int(df, entry)
-            self._write_str(df, self.sg_type)
-
-            # Turn our parsed protobuf back into data
-            data = bytearray(self.prof.SerializeToString())
-
-            # Encrypt
-            for i in range(len(data)):
-                if i < 32:
-                    b = self._prefix_magic[i]
-                else:
-                    b = data[i - 32]
-                b ^= self._xor_magic[i % 32]
-                data[i] ^= b
-
-            # Write out to the file
-            self._write_int(df, len(data))
-            df.write(data)
+        self.gvas.save_to(filename,
+                cipher.encrypt(self.prof.SerializeToString(), self._prefix_magic, self._xor_magic))
 
     def save_protobuf_to(self, filename):
         """
@@ -261,54 +207,6 @@ class TTWLProfile(TTWLBase):
                 preserving_proto_field_name=True,
                 ))
 
-    def _read_int(self, df):
-        return struct.unpack('<I', df.read(4))[0]
-
-    def _write_int(self, df, value):
-        df.write(struct.pack('<I', value))
-
-    def _read_short(self, df):
-        return struct.unpack('<H', df.read(2))[0]
-
-    def _write_short(self, df, value):
-        df.write(struct.pack('<H', value))
-
-    def _read_str(self, df):
-        datalen = self._read_int(df)
-        if datalen == 0:
-            return None
-        elif datalen == 1:
-            return ''
-        else:
-            value = df.read(datalen)
-            return value[:-1].decode('utf-8')
-
-    def _write_str(self, df, value):
-        if value is None:
-            self._write_int(df, 0)
-        elif value == '':
-            self._write_int(df, 1)
-        else:
-            data = value.encode('utf-8') + b'\0'
-            self._write_int(df, len(data))
-            df.write(data)
-
-    def _read_guid(self, df):
-        data = df.read(16)
-        return data
-        # A bit silly to bother formatting it, since we don't care.
-        #arr = ''.join(['{:02x}'.format(d) for d in data])
-        #return '{}-{}-{}-{}-{}'.format(
-        #        arr[0:8],
-        #        arr[8:12],
-        #        arr[12:16],
-        #        arr[16:20],
-        #        arr[20:32],
-        #        )
-
-    def _write_guid(self, df, value):
-        df.write(value)
-
     def get_sdus(self, eng=False):
         """
         Returns a dict containing the SDU type and the number purchased.  The SDU
@@ -384,16 +282,13 @@ class TTWLProfile(TTWLBase):
         # Okay, I have no idea what this pickup_order_index attribute is about, but let's
         # make sure it's unique anyway.  It might be related to ordering when picking
         # up multiple items at once, which would probably make it more useful for auto-pick-up
-        # items like money and ammo...
-        max_pickup_order = 0
-        for item in self.bank:
-            if item.get_pickup_order_idx() > max_pickup_order:
-                max_pickup_order = item.get_pickup_order_idx()
+        # items like money and ammo...  `self.max_bank_pickup_order` gets
+        # kept up to date as items are added.
 
         # Create the item and return it
         return datalib.WLItem.create(self.datawrapper,
                 serial_number=item_serial,
-                pickup_order_idx=max_pickup_order+1,
+                pickup_order_idx=self.max_bank_pickup_order+1,
                 is_favorite=True,
                 )
 
@@ -416,6 +311,39 @@ class TTWLProfile(TTWLBase):
         """
         return self.bank
 
+    def get_bank_fingerprints(self):
+        """
+        Returns a `datalib.FingerprintIndex` of our bank, for checking whether
+        an item is already present.  It's built on first use and then kept up
+        to date as items are added.
+        """
+        if self.bank_fingerprints is None:
+            self.bank_fingerprints = datalib.FingerprintIndex(self.bank)
+        return self.bank_fingerprints
+
+    def has_bank_item(self, item):
+        """
+        Returns `True` if the given `item` (a WLSerial/WLItem object) is
+        already in our bank, regardless of the seed its serial is obfuscated
+        with.
+        """
+        return item in self.get_bank_fingerprints()
+
+    def get_lostloot_fingerprints(self):
+        """
+        Returns a `datalib.FingerprintIndex` of our Lost Loot items.
+        """
+        if self.lost_loot_fingerprints is None:
+            self.lost_loot_fingerprints = datalib.FingerprintIndex(self.lost_loot)
+        return self.lost_loot_fingerprints
+
+    def has_lostloot_item(self, item):
+        """
+        Returns `True` if the given `item` (a WLSerial/WLItem object) is
+        already in our Lost Loot machine.
+        """
+        return item in self.get_lostloot_fingerprints()
+
     def add_new_bank_item(self, item_serial):
         """
         Adds a new item to our bank using the binary `item_serial`.
@@ -442,9 +370,61 @@ class TTWLProfile(TTWLBase):
         new_item.protobuf = self.prof.bank_inventory_list[-1]
 
         # Now update our internal items list and return
-        self.bank.append(new_item)
+        self._track_new_bank_items([new_item])
         return len(self.bank)-1
 
+    def add_bank_items(self, new_items):
+        """
+        Adds a list of `new_items` (WLItem objects) to our bank, in one go.
+        Returns a list of the items' new indexes in the bank.
+        """
+
+        # Same deal as in `add_bank_item` -- the protobufs get copied in
+        # when we extend, so afterwards, point each item at its live copy.
+        start_idx = len(self.prof.bank_inventory_list)
+        self.prof.bank_inventory_list.extend([new_item.protobuf for new_item in new_items])
+        for idx, new_item in enumerate(new_items, start_idx):
+            new_item.protobuf = self.prof.bank_inventory_list[idx]
+
+        self._track_new_bank_items(new_items)
+        return list(range(start_idx, start_idx+len(new_items)))
+
+    def add_new_bank_items(self, item_serials):
+        """
+        Adds new items to our bank using the binary serials in `item_serials`,
+        allocating a block of pickup_order_index values for them all at once.
+        Returns a list of the new WLItem objects.  If any of the serials
+        can't be loaded, none of the items will be added.
+        """
+        start_idx = len(self.prof.bank_inventory_list)
+        start_pickup_order = self.max_bank_pickup_order+1
+        try:
+            new_items = [datalib.WLItem.create_in(self.prof.bank_inventory_list,
+                    self.datawrapper,
+                    serial_number=item_serial,
+                    pickup_order_idx=start_pickup_order+idx,
+                    is_favorite=True,
+                    ) for idx, item_serial in enumerate(item_serials)]
+        except:
+            # The protobufs get added before the serials are checked, so
+            # clear out anything we added before the bad one.
+            del self.prof.bank_inventory_list[start_idx:]
+            raise
+        self._track_new_bank_items(new_items)
+        return new_items
+
+    def _track_new_bank_items(self, new_items):
+        """
+        Updates our internal bank list (and related bookkeeping) with
+        `new_items`, which have already been added to the protobuf.
+        """
+        self.bank.extend(new_items)
+        for new_item in new_items:
+            if self.bank_fingerprints is not None:
+                self.bank_fingerprints.add(new_item)
+            if new_item.get_pickup_order_idx() > self.max_bank_pickup_order:
+                self.max_bank_pickup_order = new_item.get_pickup_order_idx()
+
     def get_cur_customizations(self, cust_set):
         """
         Returns a set of the currently-unlocked customizations which live in the
@@ -475,20 +455,23 @@ class TTWLProfile(TTWLBase):
         Returns a set of all the customizations that are possible to unlock.  Includes
         the customizations which are unlocked by default
         """
-        return profile_customizations | profile_customizations_defaults
+        from . import customizations
+        return customizations.profile_customizations | customizations.profile_customizations_defaults
 
     def get_customizations_current(self):
         """
         Returns a set of the current customizations which are unlocked.  Includes the
         customizations which are unlocked by default
         """
-        return self.get_cur_customizations(profile_customizations) | profile_customizations_defaults
+        from . import customizations
+        return self.get_cur_customizations(customizations.profile_customizations) | customizations.profile_customizations_defaults
 
     def unlock_customizations(self):
         """
         Unlocks all customizations
         """
-        self.unlock_customization_set(profile_customizations)
+        from . import customizations
+        self.unlock_customization_set(customizations.profile_customizations)
 
     def clear_all_customizations(self):
         """
@@ -504,19 +487,20 @@ class TTWLProfile(TTWLBase):
         which are unlocked by default and which don't ordinarily appear explicitly
         in the profile.
         """
+        from . import customizations
         to_ret = {}
 
         # First up, copy all our "defaults" in -- these don't show up by default
         # in the profile.  This'll also ensure that all our customization keys
         # are in the returned dict.
-        for cust_type, cust_set in profile_customizations_defaults_by_cat.items():
+        for cust_type, cust_set in customizations.profile_customizations_defaults_by_cat.items():
             to_ret[cust_type] = set(cust_set)
 
         # Now, loop through the unlocks and add in what we've got
         for cust in self.prof.unlocked_customizations:
-            if cust.customization_asset_path not in profile_customizations_to_type:
+            if cust.customization_asset_path not in customizations.profile_customizations_to_type:
                 raise TTWLProfile.UnknownCustomizationException(cust.customization_asset_path)
-            cust_type = profile_customizations_to_type[cust.customization_asset_path]
+            cust_type = customizations.profile_customizations_to_type[cust.customization_asset_path]
             to_ret[cust_type].add(cust.customization_asset_path)
 
         # Return!
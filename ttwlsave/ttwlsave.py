@@ -21,22 +21,26 @@
 # 
 # 3. This notice may not be removed or altered from any source distribution.
 
-# The encryption/decryption stanzas in TTWLSave.__init__ and TTWLSave.save_to
-# were helpfully provided by Gibbed (rick 'at' gibbed 'dot' us), so many
-# thanks for that!  https://twitter.com/gibbed/status/1246863435868049410?s=19
+# The encryption/decryption stanzas (now living in cipher.py) used by
+# TTWLSave.__init__ and TTWLSave.save_to were helpfully provided by Gibbed
+# (rick 'at' gibbed 'dot' us), so many thanks for that!
+# https://twitter.com/gibbed/status/1246863435868049410?s=19
 #
-# The rest of the savegame format was gleaned from 13xforever/Ilya's
-# "gvas-converter" project: https://github.com/13xforever/gvas-converter
+# The rest of the savegame format (now living in gvas.py) was gleaned from
+# 13xforever/Ilya's "gvas-converter" project:
+# https://github.com/13xforever/gvas-converter
 
 import uuid
-import struct
 import random
 import google.protobuf
 import google.protobuf.json_format
 from . import *
+from . import gvas
+from . import lookups
+from . import cipher
 from . import datalib
-from . import OakSave_pb2, OakShared_pb2
-from .ttwlbase import TTWLBase
+from . import OakSave_pb2
+from .ttwlbase import TTWLBase, FieldIndex
 from .ttwlprofile import TTWLProfile
 
 MissionState = OakSave_pb2.MissionStatusPlayerSaveGameData.MissionState
@@ -96,6 +100,122 @@ class WLEquipSlot(object):
         """
         return self.protobuf.slot_data_path
 
+class MissionIndex(object):
+    """
+    Index of the missions in a single playthrough's `mission_list`, so that
+    we're not walking (and lowercasing) the whole list every time we want to
+    know something about it.  Maps the lowercased mission path to a tuple of
+    its position in the list and its status, and also keeps track of which
+    positions are in each status.  Mission lists built from that get cached
+    until something changes.
+
+    Edits which change a mission's status, or add/remove missions, should go
+    through `set_status()`, `append()`, and `delete()` so the index stays in
+    sync.
+    """
+
+    def __init__(self, mission_list):
+        self.mission_list = mission_list
+        self._build()
+
+    def _build(self):
+        """
+        (Re)builds our index from the protobuf list
+        """
+        self.missions = {}
+        self.buckets = {}
+        self.list_cache = {}
+        for idx, mission in enumerate(self.mission_list):
+            self.missions.setdefault(mission.mission_class_path.lower(), (idx, mission.status))
+            self.buckets.setdefault(mission.status, set()).add(idx)
+
+    def __contains__(self, mission_path):
+        return mission_path.lower() in self.missions
+
+    def get(self, mission_path):
+        """
+        Returns the mission protobuf for the given `mission_path` (matched
+        case-insensitively), or `None`
+        """
+        lower = mission_path.lower()
+        if lower in self.missions:
+            return self.mission_list[self.missions[lower][0]]
+        return None
+
+    def get_status(self, mission_path):
+        """
+        Returns the status of the given `mission_path`, or `None`
+        """
+        lower = mission_path.lower()
+        if lower in self.missions:
+            return self.missions[lower][1]
+        return None
+
+    def get_count(self, mission_status):
+        """
+        Returns the number of missions in the given `mission_status`
+        """
+        return len(self.buckets.get(mission_status, ()))
+
+    def get_missions(self, mission_status, eng=False):
+        """
+        Returns a list of missions in the given `mission_status`, in the order
+        they show up in the savegame.  Missions will be in their object name
+        by default, or their English names if `eng` is `True`.
+        """
+        key = (mission_status, eng)
+        if key not in self.list_cache:
+            missions = []
+            for idx in sorted(self.buckets.get(mission_status, ())):
+                mission_name = self.mission_list[idx].mission_class_path
+                if eng:
+                    mission_name = lookups.get_mission_name(mission_name,
+                            '(Unknown mission: {})'.format(mission_name))
+                missions.append(mission_name)
+            self.list_cache[key] = missions
+        return list(self.list_cache[key])
+
+    def set_status(self, mission_path, mission_status):
+        """
+        Sets the status of the given (existing) `mission_path`
+        """
+        lower = mission_path.lower()
+        (idx, old_status) = self.missions[lower]
+        self.mission_list[idx].status = mission_status
+        if old_status != mission_status:
+            self.missions[lower] = (idx, mission_status)
+            self.buckets[old_status].discard(idx)
+            self.buckets.setdefault(mission_status, set()).add(idx)
+            self.list_cache = {}
+
+    def append(self, **kwargs):
+        """
+        Appends a new mission to the list, constructed with the given
+        attributes, and returns it
+        """
+        mission = self.mission_list.add(**kwargs)
+        idx = len(self.mission_list)-1
+        self.missions.setdefault(mission.mission_class_path.lower(), (idx, mission.status))
+        self.buckets.setdefault(mission.status, set()).add(idx)
+        self.list_cache = {}
+        return mission
+
+    def delete(self, mission_paths):
+        """
+        Deletes the given `mission_paths` from the list.  Returns the number
+        of missions actually deleted.
+        """
+        to_del = set()
+        for mission_path in mission_paths:
+            lower = mission_path.lower()
+            if lower in self.missions:
+                to_del.add(self.missions[lower][0])
+        for idx in sorted(to_del, reverse=True):
+            del self.mission_list[idx]
+        if to_del:
+            self._build()
+        return len(to_del)
+
 class TTWLSave(TTWLBase):
     """
     Real simple wrapper for a WL savegame file.
@@ -126,68 +246,32 @@ class TTWLSave(TTWLBase):
     def __init__(self, filename, debug=False):
         super().__init__()
         self.filename = filename
-        self.datawrapper = datalib.DataWrapper()
-        with open(filename, 'rb') as df:
-
-            header = df.read(4)
-            assert(header == b'GVAS')
-
-            self.sg_version = self._read_int(df)
-            if debug:
-                print('Savegame version: {}'.format(self.sg_version))
-            self.pkg_version = self._read_int(df)
-            if debug:
-                print('Package version: {}'.format(self.pkg_version))
-            self.engine_major = self._read_short(df)
-            self.engine_minor = self._read_short(df)
-            self.engine_patch = self._read_short(df)
-            self.engine_build = self._read_int(df)
-            if debug:
-                print('Engine version: {}.{}.{}.{}'.format(
-                    self.engine_major,
-                    self.engine_minor,
-                    self.engine_patch,
-                    self.engine_build,
-                    ))
-            self.build_id = self._read_str(df)
-            if debug:
-                print('Build ID: {}'.format(self.build_id))
-            self.fmt_version = self._read_int(df)
-            if debug:
-                print('Custom Format Version: {}'.format(self.fmt_version))
-            fmt_count = self._read_int(df)
-            if debug:
-                print('Custom Format Data Count: {}'.format(fmt_count))
-            self.custom_format_data = []
-            for _ in range(fmt_count):
-                guid = self._read_guid(df)
-                entry = self._read_int(df)
-                if debug:
-                    print(' - GUID {}: {}'.format(guid, entry))
-                self.custom_format_data.append((guid, entry))
-            self.sg_type = self._read_str(df)
-            if debug:
-                print('Savegame type: {}'.format(self.sg_type))
-
-            # Read in the actual data
-            remaining_data_len = self._read_int(df)
-            data = bytearray(df.read(remaining_data_len))
-
-            # Decrypt
-            for i in range(len(data)-1, -1, -1):
-                if i < 32:
-                    b = TTWLSave._prefix_magic[i]
-                else:
-                    b = data[i - 32]
-                b ^= TTWLSave._xor_magic[i % 32]
-                data[i] ^= b
+        self.datawrapper = datalib.DataWrapper.shared()
+        (self.gvas, data) = gvas.GvasContainer.read(filename,
+                body_func=lambda body: cipher.decrypt(body, TTWLSave._prefix_magic, TTWLSave._xor_magic),
+                label='Savegame',
+                debug=debug,
+                )
 
-            # Make sure that was all there was
-            last = df.read()
-            assert(len(last) == 0)
+        # Parse protobufs
+        self.import_protobuf(data)
 
-            # Parse protobufs
-            self.import_protobuf(data)
+    @staticmethod
+    def peek(filename, fields=None):
+        """
+        Lightweight alternative to loading the whole file: returns a tuple of
+        the GVAS header (a `gvas.GvasContainer`) and a dict of the requested
+        top-level protobuf `fields` (ie: `['preferred_character_name', 'experience_points']`).  Only
+        the parts of the body we need get decrypted, and the full protobuf
+        is never parsed.
+        """
+        return gvas.GvasContainer.peek(filename,
+                OakSave_pb2.Character,
+                TTWLSave._prefix_magic,
+                TTWLSave._xor_magic,
+                fields=fields,
+                label='Savegame',
+                )
 
     def import_protobuf(self, data):
         """
@@ -199,6 +283,9 @@ class TTWLSave(TTWLBase):
         # Now parse the protobufs
         self.save = OakSave_pb2.Character()
         self.base_obj = self.save
+        self.invalidate_challenge_index()
+        self.invalidate_field_indexes()
+        self.invalidate_mission_indexes()
         try:
             self.save.ParseFromString(data)
         except google.protobuf.message.DecodeError as e:
@@ -217,6 +304,15 @@ class TTWLSave(TTWLBase):
         # Do some data processing so that we can wrap things APIwise
         # First: Items
         self.items = [datalib.WLItem(i, self.datawrapper) for i in self.save.inventory_items]
+        self.item_fingerprints = None
+
+        # Keep track of the highest pickup_order_index in use, so that new
+        # items can be given a unique one without scanning the inventory
+        # each time.
+        self.max_pickup_order = 0
+        for item in self.items:
+            if item.get_pickup_order_idx() > self.max_pickup_order:
+                self.max_pickup_order = item.get_pickup_order_idx()
 
         # Next: Equip slots
         self.equipslots = {}
@@ -237,39 +333,8 @@ class TTWLSave(TTWLBase):
         """
         Saves ourselves to a new filename
         """
-        with open(filename, 'wb') as df:
-
-            # Header info
-            df.write(b'GVAS')
-            self._write_int(df, self.sg_version)
-            self._write_int(df, self.pkg_version)
-            self._write_short(df, self.engine_major)
-            self._write_short(df, self.engine_minor)
-            self._write_short(df, self.engine_patch)
-            self._write_int(df, self.engine_build)
-            self._write_str(df, self.build_id)
-            self._write_int(df, self.fmt_version)
-            self._write_int(df, len(self.custom_format_data))
-            for guid, entry in self.custom_format_data:
-                self._write_guid(df, guid)
-                self._write_int(df, entry)
-            self._write_str(df, self.sg_type)
-
-            # Turn our parsed protobuf back into data
-            data = bytearray(self.save.SerializeToString())
-
-            # Encrypt
-            for i in range(len(data)):
-                if i < 32:
-                    b = self._prefix_magic[i]
-                else:
-                    b = data[i - 32]
-                b ^= self._xor_magic[i % 32]
-                data[i] ^= b
-
-            # Write out to the file
-            self._write_int(df, len(data))
-            df.write(data)
+        self.gvas.save_to(filename,
+                cipher.encrypt(self.save.SerializeToString(), self._prefix_magic, self._xor_magic))
 
     def save_protobuf_to(self, filename):
         """
@@ -288,54 +353,6 @@ class TTWLSave(TTWLBase):
                 preserving_proto_field_name=True,
                 ))
 
-    def _read_int(self, df):
-        return struct.unpack('<I', df.read(4))[0]
-
-    def _write_int(self, df, value):
-        df.write(struct.pack('<I', value))
-
-    def _read_short(self, df):
-        return struct.unpack('<H', df.read(2))[0]
-
-    def _write_short(self, df, value):
-        df.write(struct.pack('<H', value))
-
-    def _read_str(self, df):
-        datalen = self._read_int(df)
-        if datalen == 0:
-            return None
-        elif datalen == 1:
-            return ''
-        else:
-            value = df.read(datalen)
-            return value[:-1].decode('utf-8')
-
-    def _write_str(self, df, value):
-        if value is None:
-            self._write_int(df, 0)
-        elif value == '':
-            self._write_int(df, 1)
-        else:
-            data = value.encode('utf-8') + b'\0'
-            self._write_int(df, len(data))
-            df.write(data)
-
-    def _read_guid(self, df):
-        data = df.read(16)
-        return data
-        # A bit silly to bother formatting it, since we don't care.
-        #arr = ''.join(['{:02x}'.format(d) for d in data])
-        #return '{}-{}-{}-{}-{}'.format(
-        #        arr[0:8],
-        #        arr[8:12],
-        #        arr[12:16],
-        #        arr[16:20],
-        #        arr[20:32],
-        #        )
-
-    def _write_guid(self, df, value):
-        df.write(value)
-
     def get_char_name(self):
         """
         Returns the character name
@@ -626,13 +643,13 @@ class TTWLSave(TTWLBase):
                 maps.append('(BLANK MAP)')
             else:
                 lower = station.lower()
-                if lower in fts_to_map:
-                    mapname = fts_to_map[lower]
+                if lower in lookups.fts_to_map:
                     if eng:
-                        if mapname in map_to_eng:
-                            mapname = map_to_eng[mapname]
-                        else:
-                            mapname = '(Unknown map: {})'.format(mapname)
+                        mapname = lookups.fts_to_eng.get(lower)
+                        if mapname is None:
+                            mapname = '(Unknown map: {})'.format(lookups.fts_to_map[lower])
+                    else:
+                        mapname = lookups.fts_to_map[lower]
                     maps.append(mapname)
                 else:
                     maps.append('(Unknown station: {})'.format(station))
@@ -706,26 +723,41 @@ class TTWLSave(TTWLBase):
                 ))
         self.save.active_travel_stations_for_playthrough.pop()
 
+    def invalidate_mission_indexes(self):
+        """
+        Throws away our per-playthrough MissionIndex objects, so they'll be
+        rebuilt on next use.  Anything which adds/removes playthroughs, or
+        edits mission lists without going through the indexes, should call
+        this.
+        """
+        self.mission_indexes = None
+
+    def get_mission_indexes(self):
+        """
+        Returns a list of MissionIndex objects, one per playthrough, building
+        them if need be.
+        """
+        if self.mission_indexes is None:
+            self.mission_indexes = [MissionIndex(pt.mission_list) for pt in self.save.mission_playthroughs_data]
+        return self.mission_indexes
+
+    def get_mission_index(self, pt=0):
+        """
+        Returns the MissionIndex for the given playthrough `pt` (zero-indexed),
+        or `None` if we don't have that playthrough.
+        """
+        indexes = self.get_mission_indexes()
+        if 0 <= pt < len(indexes):
+            return indexes[pt]
+        return None
+
     def get_pt_mission_lists(self, mission_status, eng=False):
         """
         Returns a list of missions in the given `mission_status`, for each
         Playthrough.  Missions will be in their object name by default, or
         their English names if `eng` is `True`.
         """
-        to_ret = []
-        for pt in self.save.mission_playthroughs_data:
-            active_missions = []
-            for mission in pt.mission_list:
-                if mission.status == mission_status:
-                    mission_name = mission.mission_class_path
-                    if eng:
-                        if mission_name.lower() in mission_to_name:
-                            mission_name = mission_to_name[mission_name.lower()]
-                        else:
-                            mission_name = '(Unknown mission: {})'.format(mission_name)
-                    active_missions.append(mission_name)
-            to_ret.append(active_missions)
-        return to_ret
+        return [index.get_missions(mission_status, eng=eng) for index in self.get_mission_indexes()]
 
     def get_mission_lists(self, mission_status, eng=False):
         """
@@ -788,9 +820,9 @@ class TTWLSave(TTWLBase):
         Playthrough (zero-indexed).  Missions will be in their object name
         by default, or their English names if `eng` is `True`
         """
-        missions = self.get_pt_mission_lists(mission_status, eng=eng)
-        if len(missions) > pt:
-            return missions[pt]
+        index = self.get_mission_index(pt)
+        if index is not None:
+            return index.get_missions(mission_status, eng=eng)
         return None
 
     def get_pt_active_mission_list(self, pt=0, eng=False):
@@ -813,10 +845,7 @@ class TTWLSave(TTWLBase):
         """
         Returns a count of completed missions for each Playthrough.
         """
-        to_ret = []
-        for missions in self.get_pt_completed_mission_lists():
-            to_ret.append(len(missions))
-        return to_ret
+        return [index.get_count(MissionState.MS_Complete) for index in self.get_mission_indexes()]
 
     def get_completed_mission_counts(self):
         """
@@ -831,9 +860,9 @@ class TTWLSave(TTWLBase):
         Returns a count of completed mission object names for the given
         Playthrough (zero-indexed).
         """
-        counts = self.get_pt_completed_mission_counts()
-        if len(counts) > pt:
-            return counts[pt]
+        index = self.get_mission_index(pt)
+        if index is not None:
+            return index.get_count(MissionState.MS_Complete)
         return None
 
     def clear_mission_pt(self, playthrough=0):
@@ -848,6 +877,8 @@ class TTWLSave(TTWLBase):
                 len(self.save.mission_playthroughs_data)-1,
                 ))
         self.save.mission_playthroughs_data.pop()
+        if self.mission_indexes is not None:
+            self.mission_indexes.pop()
 
     def clear_playthrough_data(self, playthrough=0):
         """
@@ -876,6 +907,24 @@ class TTWLSave(TTWLBase):
         """
         return self.items
 
+    def get_item_fingerprints(self):
+        """
+        Returns a `datalib.FingerprintIndex` of our inventory, for checking
+        whether an item is already present.  It's built on first use and then
+        kept up to date as items are added or removed.
+        """
+        if self.item_fingerprints is None:
+            self.item_fingerprints = datalib.FingerprintIndex(self.items)
+        return self.item_fingerprints
+
+    def has_item(self, item):
+        """
+        Returns `True` if the given `item` (a WLSerial/WLItem object) is
+        already in our inventory, regardless of the seed its serial is
+        obfuscated with.
+        """
+        return item in self.get_item_fingerprints()
+
     def get_equipped_items(self, eng=False):
         """
         Returns a dict containing the slot and the equipped item.  The slot will
@@ -936,6 +985,9 @@ class TTWLSave(TTWLBase):
 
         del self.save.inventory_items[:]
         self.items = []
+        if self.item_fingerprints is not None:
+            self.item_fingerprints.clear()
+        self.max_pickup_order = 0
         for slot in self.equipslots.values():
             slot.protobuf.inventory_list_index = -1
 
@@ -956,9 +1008,37 @@ class TTWLSave(TTWLBase):
         new_item.protobuf = self.save.inventory_items[-1]
 
         # Now update our internal items list and return
-        self.items.append(new_item)
+        self._track_new_items([new_item])
         return len(self.items)-1
 
+    def add_items(self, new_items):
+        """
+        Adds a list of `new_items` (WLItem objects) to our item list, in one
+        go.  Returns a list of the items' new indexes in our item list.
+        """
+
+        # Same deal as in `add_item` -- the protobufs get copied in when
+        # we extend, so afterwards, point each item at its live copy.
+        start_idx = len(self.save.inventory_items)
+        self.save.inventory_items.extend([new_item.protobuf for new_item in new_items])
+        for idx, new_item in enumerate(new_items, start_idx):
+            new_item.protobuf = self.save.inventory_items[idx]
+
+        self._track_new_items(new_items)
+        return list(range(start_idx, start_idx+len(new_items)))
+
+    def _track_new_items(self, new_items):
+        """
+        Updates our internal items list (and related bookkeeping) with
+        `new_items`, which have already been added to the protobuf.
+        """
+        self.items.extend(new_items)
+        for new_item in new_items:
+            if self.item_fingerprints is not None:
+                self.item_fingerprints.add(new_item)
+            if new_item.get_pickup_order_idx() > self.max_pickup_order:
+                self.max_pickup_order = new_item.get_pickup_order_idx()
+
     def create_new_item(self, item_serial):
         """
         Creates a new item from the given binary `item_serial`, which can later
@@ -968,16 +1048,13 @@ class TTWLSave(TTWLBase):
         # Okay, I have no idea what this pickup_order_index attribute is about, but let's
         # make sure it's unique anyway.  It might be related to ordering when picking
         # up multiple items at once, which would probably make it more useful for auto-pick-up
-        # items like money and ammo...
-        max_pickup_order = 0
-        for item in self.items:
-            if item.get_pickup_order_idx() > max_pickup_order:
-                max_pickup_order = item.get_pickup_order_idx()
+        # items like money and ammo...  `self.max_pickup_order` gets kept
+        # up to date as items are added.
 
         # Create the item and return it
         new_item = datalib.WLItem.create(self.datawrapper,
                 serial_number=item_serial,
-                pickup_order_idx=max_pickup_order+1,
+                pickup_order_idx=self.max_pickup_order+1,
                 is_favorite=True,
                 )
         return new_item
@@ -1006,6 +1083,30 @@ class TTWLSave(TTWLBase):
         """
         return self.add_new_item(datalib.WLSerial.decode_serial_base64(item_serial_b64))
 
+    def add_new_items(self, item_serials):
+        """
+        Adds new items to our item list using the binary serials in
+        `item_serials`, allocating a block of pickup_order_index values for
+        them all at once.  Returns a list of the new WLItem objects.  If any
+        of the serials can't be loaded, none of the items will be added.
+        """
+        start_idx = len(self.save.inventory_items)
+        start_pickup_order = self.max_pickup_order+1
+        try:
+            new_items = [datalib.WLItem.create_in(self.save.inventory_items,
+                    self.datawrapper,
+                    serial_number=item_serial,
+                    pickup_order_idx=start_pickup_order+idx,
+                    is_favorite=True,
+                    ) for idx, item_serial in enumerate(item_serials)]
+        except:
+            # The protobufs get added before the serials are checked, so
+            # clear out anything we added before the bad one.
+            del self.save.inventory_items[start_idx:]
+            raise
+        self._track_new_items(new_items)
+        return new_items
+
     def overwrite_item_in_slot(self, slot, itemdata):
         """
         Given a binary `itemdata`, overwrite whatever item is in the given `slot`.  Will create
@@ -1039,14 +1140,31 @@ class TTWLSave(TTWLBase):
         """
         self.overwrite_item_in_slot(slot, datalib.WLSerial.decode_serial_base64(item_serial_b64))
 
+    def invalidate_field_indexes(self):
+        """
+        Throws away our indexes of the currency, SDU, ammo, and stat lists,
+        so they'll be rebuilt on next use.  Anything which removes entries
+        from those lists (or replaces them wholesale) should call this.
+        """
+        self.field_indexes = {}
+
+    def _get_field_index(self, field, key_attr):
+        """
+        Returns a FieldIndex for the repeated protobuf field `field` in our
+        savegame, keyed on `key_attr`, building it if need be.
+        """
+        if field not in self.field_indexes:
+            self.field_indexes[field] = FieldIndex(getattr(self.save, field), key_attr)
+        return self.field_indexes[field]
+
     def get_currency(self, currency_type):
         """
         Returns the amount of currency of the given type
         """
-        for cat_save_data in self.save.inventory_category_list:
-            if cat_save_data.base_category_definition_hash == currency_type.value:
-                return cat_save_data.quantity
-        return 0
+        cat_save_data = self._get_field_index('inventory_category_list', 'base_category_definition_hash').get(currency_type.value)
+        if cat_save_data is None:
+            return 0
+        return cat_save_data.quantity
 
     def set_currency(self, currency_type, new_value, quiet=False):
         """
@@ -1058,17 +1176,16 @@ class TTWLSave(TTWLBase):
             if currency_type.num is not None and new_value > currency_type.num:
                 print(f'WARNING: Maximum value for {currency_type.label} is {currency_type.num:,} - setting to {new_value:,} anyway')
 
-        # Update an existing value, if we have it
-        for cat_save_data in self.save.inventory_category_list:
-            if cat_save_data.base_category_definition_hash == currency_type.value:
-                cat_save_data.quantity = new_value
-                return
-
-        # Add a new one, if we don't
-        self.save.inventory_category_list.append(OakShared_pb2.InventoryCategorySaveData(
-            base_category_definition_hash=currency_type.value,
-            quantity=new_value,
-            ))
+        # Update an existing value, if we have it, or add a new one if we don't
+        index = self._get_field_index('inventory_category_list', 'base_category_definition_hash')
+        cat_save_data = index.get(currency_type.value)
+        if cat_save_data is None:
+            index.add(
+                base_category_definition_hash=currency_type.value,
+                quantity=new_value,
+                )
+        else:
+            cat_save_data.quantity = new_value
 
     def get_money(self):
         """
@@ -1144,10 +1261,24 @@ class TTWLSave(TTWLBase):
         """
         Returns the number of SDUs purchased for the specified type
         """
-        sdus = self.get_sdus()
-        if sdu in sdus:
-            return sdus[sdu]
-        return 0
+        sdu_proto = self._get_field_index('sdu_list', 'sdu_data_path').get(sdu.value)
+        if sdu_proto is None:
+            return 0
+        return sdu_proto.sdu_level
+
+    def set_sdu(self, sdu, level):
+        """
+        Sets the number of SDUs purchased for the specified type to `level`
+        """
+        index = self._get_field_index('sdu_list', 'sdu_data_path')
+        sdu_proto = index.get(sdu.value)
+        if sdu_proto is None:
+            index.add(
+                sdu_data_path=sdu.value,
+                sdu_level=level,
+                )
+        else:
+            sdu_proto.sdu_level = level
 
     def set_max_sdus(self, sdulist=None):
         """
@@ -1158,19 +1289,8 @@ class TTWLSave(TTWLBase):
         else:
             all_sdus = set(sdulist)
 
-        # Set all existing SDUs to max
-        for sdu_proto in self.save.sdu_list:
-            sdu = SDU(sdu_proto.sdu_data_path)
-            if sdu in all_sdus:
-                all_sdus.remove(sdu)
-                sdu_proto.sdu_level = sdu.num
-
-        # If we're missing any, add them.
         for sdu in all_sdus:
-            self.save.sdu_list.append(OakShared_pb2.OakSDUSaveGameData(
-                sdu_data_path=sdu.value,
-                sdu_level=sdu.num,
-                ))
+            self.set_sdu(sdu, sdu.num)
 
     def get_ammo_counts(self, eng=False):
         """
@@ -1195,12 +1315,27 @@ class TTWLSave(TTWLBase):
 
     def get_ammo_count(self, ammo):
         """
-        Returns the ammo count for the specified ammo type
+        Returns the ammo count for the specified ammo type (either an Ammo
+        enum member, or its resource path)
         """
-        ammo_vals = self.get_ammo_counts()
-        if ammo in ammo_vals:
-            return ammo_vals[ammo]
-        return 0
+        if isinstance(ammo, Ammo):
+            ammo = ammo.value
+        pool = self._get_field_index('resource_pools', 'resource_path').get(ammo)
+        if pool is None:
+            return 0
+        return int(pool.amount)
+
+    def set_ammo_count(self, ammo, count):
+        """
+        Sets the ammo count for the specified ammo type (an Ammo enum member).
+        Returns `True` if the ammo pool was found, or `False` otherwise -- we
+        don't create new pools, since the game should always have them.
+        """
+        pool = self._get_field_index('resource_pools', 'resource_path').get(ammo.value)
+        if pool is None:
+            return False
+        pool.amount = count
+        return True
 
     def set_max_ammo(self):
         """
@@ -1209,27 +1344,34 @@ class TTWLSave(TTWLBase):
 
         # Set all existing ammo pools to max (shouldn't have to worry about
         # pools not being in here)
-        for pool in self.save.resource_pools:
-            ammo = Ammo.has_value(pool.resource_path)
-            if ammo:
-                pool.amount = ammo.num
+        for ammo in Ammo:
+            self.set_ammo_count(ammo, ammo.num)
+
+    def get_stats_obj(self, stat_obj, default=0):
+        """
+        Returns the value of the given `stat_obj`, which lives in
+        `game_stats_data`, or `default` if it's not present.
+        """
+        stat = self._get_field_index('game_stats_data', 'stat_path').get(stat_obj)
+        if stat is None:
+            return default
+        return stat.stat_value
 
     def set_stats_obj(self, stat_obj, stat_value):
         """
         Sets the given `stat_obj`, which lives in `game_stats_data`.
         `stat_value` will be the value of the statistic.
         """
-        for stat in self.save.game_stats_data:
-            if stat.stat_path == stat_obj:
-                stat.stat_value = stat_value
-                return
-
-        # If we get here, the stat wasn't found, and we'll have to add
-        # it ourselves.
-        self.save.game_stats_data.append(OakShared_pb2.GameStatSaveGameData(
-            stat_value=stat_value,
-            stat_path=stat_obj,
-            ))
+        index = self._get_field_index('game_stats_data', 'stat_path')
+        stat = index.get(stat_obj)
+        if stat is None:
+            # The stat wasn't found, so we'll have to add it ourselves.
+            index.add(
+                stat_value=stat_value,
+                stat_path=stat_obj,
+                )
+        else:
+            stat.stat_value = stat_value
 
     def get_savegame_guid(self):
         """
@@ -1283,25 +1425,22 @@ class TTWLSave(TTWLBase):
                 [ 1, 1, 1,1,1,1,1,1,0,1,0,1,1,1,1,]
             ),
         }
-        for pt in self.save.mission_playthroughs_data:
-            # First, complete the missions if they're already present
-            mission_seen = set()
-            for mission in pt.mission_list:
-                if mission.mission_class_path in final_missions:
+        for index in self.get_mission_indexes():
+            for mission_path, (objectiveset, objectives) in final_missions.items():
+                # First, complete the missions if they're already present
+                mission = index.get(mission_path)
+                if mission is not None:
                     # print(f"Found mission: {mission.mission_class_path}")
-                    (_, objectives) = final_missions[mission.mission_class_path]
-                    mission_seen.add(mission.mission_class_path)
-                    mission.status = MissionState.MS_Complete
+                    index.set_status(mission_path, MissionState.MS_Complete)
                     del mission.objectives_progress[:]
                     mission.objectives_progress.extend(objectives)
                     mission.kickoff_played = True
                     mission.has_been_viewed_in_log = True
 
-            # Now, if we didn't find one of 'em, inject it
-            for mission_path, (objectiveset, objectives) in final_missions.items():
-                if mission_path not in mission_seen:
-                    # print(f"Making mission: {mission.mission_class_path}")
-                    pt.mission_list.append(OakSave_pb2.MissionStatusPlayerSaveGameData(
+                # Now, if we didn't find one of 'em, inject it
+                else:
+                    # print(f"Making mission: {mission_path}")
+                    index.append(
                         status=MissionState.MS_Complete,
                         objectives_progress=objectives,
                         mission_class_path=mission_path,
@@ -1310,21 +1449,34 @@ class TTWLSave(TTWLBase):
                         has_been_viewed_in_log=True,
                         dlc_package_id=0,
                         # league_instance=0,
-                        ))
-
-                    
-    def finish_mission(self, mission_name, pt=0):
-        # TODO: docstring, test, better handling of `pt`
-        self.save.mission_playthroughs_data[pt].mission_list.append(OakSave_pb2.MissionStatusPlayerSaveGameData(
-            status=MissionState.MS_Complete,
-            objectives_progress=objectives,
-            mission_class_path=mission_path,
-            active_objective_set_path=objectiveset,
-            kickoff_played=True,
-            has_been_viewed_in_log=True,
-            dlc_package_id=0,
-            league_instance=0,
-        ))
+                        )
+
+    def finish_mission(self, mission_obj, pt=0):
+        """
+        Marks the specified mission (with object path `mission_obj`) as
+        completed, in the playthrough `pt` (0 = Normal/NVHM, 1 = TVHM).  If
+        the mission isn't already present, a new completed entry is added
+        for it (without any objective progress, which we don't know about
+        in general).  Returns `True` if the mission was marked as completed,
+        or `False` if we don't have data for the specified playthrough.
+        """
+        index = self.get_mission_index(pt)
+        if index is None:
+            return False
+        mission = index.get(mission_obj)
+        if mission is None:
+            index.append(
+                status=MissionState.MS_Complete,
+                mission_class_path=mission_obj,
+                kickoff_played=True,
+                has_been_viewed_in_log=True,
+                dlc_package_id=0,
+                )
+        else:
+            index.set_status(mission_obj, MissionState.MS_Complete)
+            mission.kickoff_played = True
+            mission.has_been_viewed_in_log = True
+        return True
 
     def delete_mission(self, mission_obj, pt=0, allow_plot=False):
         """
@@ -1336,24 +1488,21 @@ class TTWLSave(TTWLBase):
         mission was deleted, or `False` if the specified mission wasn't found,
         or wasn't permitted to be deleted on account of `allow_plot`.
         """
-        lower = mission_obj.lower()
-        if not allow_plot and lower in plot_missions:
-            return False
-        if len(self.save.mission_playthroughs_data) <= pt:
-            return False
-        # Originally tried a fancier `itertools.filterfalse` assignment here, but
-        # repeated protobufs can't be assigned directly, and doing a del/extend
-        # dance seemed sillier than just doing it this "dumb" way.
-        to_del_idx = None
-        for idx, mission in enumerate(self.save.mission_playthroughs_data[pt].mission_list):
-            if mission.mission_class_path.lower() == lower:
-                to_del_idx = idx
-                break
-        if to_del_idx is None:
-            return False
-        else:
-            del self.save.mission_playthroughs_data[pt].mission_list[idx]
-            return True
+        return self.delete_missions([mission_obj], pt=pt, allow_plot=allow_plot) == 1
+
+    def delete_missions(self, mission_objs, pt=0, allow_plot=False):
+        """
+        Deletes all the specified missions (a list of object paths in
+        `mission_objs`) in the playthrough `pt` from the savegame entirely, in
+        one go.  Plot missions are skipped unless `allow_plot` is `True`, as
+        with `delete_mission`.  Returns the number of missions deleted.
+        """
+        index = self.get_mission_index(pt)
+        if index is None:
+            return 0
+        if not allow_plot:
+            mission_objs = [m for m in mission_objs if m.lower() not in lookups.plot_missions]
+        return index.delete(mission_objs)
 
     def unlock_feat(self):
         """
@@ -1440,6 +1589,7 @@ class TTWLSave(TTWLBase):
         first element will be `None`, and the second will be the object path
         of the customization we don't know about.
         """
+        from . import customizations
         # Construct a dict of our current customizations (minus emotes)
         if eng:
             cur_customizations = {cust_type.value: None for cust_type in Customization}
@@ -1448,9 +1598,9 @@ class TTWLSave(TTWLBase):
             cur_customizations = {cust_type: None for cust_type in Customization}
             del cur_customizations[Customization.EMOTE]
         for obj_path in self.save.selected_customizations:
-            if obj_path not in profile_customizations_to_type:
+            if obj_path not in customizations.profile_customizations_to_type:
                 return (None, obj_path)
-            cust_type = profile_customizations_to_type[obj_path]
+            cust_type = customizations.profile_customizations_to_type[obj_path]
             if cust_type != Customization.EMOTE:
                 if eng:
                     key = cust_type.value
@@ -1616,13 +1766,15 @@ class TTWLSave(TTWLBase):
         Clears out Overworld challenges, or specifically the Shrine completions and
         Bottlecap shortcuts, intended for use with the --fake-tvhm option on the save
         editor.  This is done via a custom routine because there's a bunch of them,
-        and there's no real point to hardcoding them.  The above methods would be
-        pretty inefficient to use, too, since we loop through challenges until we
-        find the correct name.
-        """
-        for chal in self.base_obj.challenge_data:
-            if chal.challenge_class_path.startswith('/Game/GameData/Challenges/Shrines/Shrine') \
-                    or chal.challenge_class_path.startswith('/Game/GameData/Challenges/OverworldShortcuts/Challenge_Crew_OWShortcut'):
+        and there's no real point to hardcoding them.  The challenge index's prefix
+        lookup finds them all for us.
+        """
+        index = self.get_challenge_index()
+        for prefix in [
+                '/Game/GameData/Challenges/Shrines/Shrine',
+                '/Game/GameData/Challenges/OverworldShortcuts/Challenge_Crew_OWShortcut',
+                ]:
+            for chal in index.get_prefix(prefix):
                 chal.completed_count = 0
                 chal.currently_completed = False
 